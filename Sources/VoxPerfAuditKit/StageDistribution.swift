@@ -5,6 +5,11 @@ package struct StageDistribution: Codable, Sendable {
     package let p95: Double
     package let min: Double
     package let max: Double
+    // Optional so reports written before these fields existed still decode.
+    package let p99: Double?
+    /// Per-iteration samples in recorded order. Lets report tooling merge
+    /// distributions exactly (across fixtures/runs) instead of averaging percentiles.
+    package let samples: [Double]?
 
     package init(samples: [Double]) {
         guard !samples.isEmpty else {
@@ -12,6 +17,8 @@ package struct StageDistribution: Codable, Sendable {
             self.p95 = 0
             self.min = 0
             self.max = 0
+            self.p99 = 0
+            self.samples = []
             return
         }
         let sorted = samples.sorted()
@@ -19,6 +26,8 @@ package struct StageDistribution: Codable, Sendable {
         self.max = sorted[sorted.count - 1]
         self.p50 = Self.percentile(sorted, quantile: 0.50)
         self.p95 = Self.percentile(sorted, quantile: 0.95)
+        self.p99 = Self.percentile(sorted, quantile: 0.99)
+        self.samples = samples
     }
 
     static func percentile(_ sorted: [Double], quantile: Double) -> Double {
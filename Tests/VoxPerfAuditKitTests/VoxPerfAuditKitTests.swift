@@ -112,6 +112,22 @@ struct StageDistributionTests {
         #expect(d.p50 == 50)
         #expect(d.p95 == 95)
     }
+
+    @Test("Keeps samples and p99 for exact merging")
+    func test_init_recordsSamplesAndP99() {
+        let d = StageDistribution(samples: [30.0, 10.0, 20.0])
+        #expect(d.samples == [30.0, 10.0, 20.0])
+        #expect(abs((d.p99 ?? 0) - 29.8) < 1e-9)
+    }
+
+    @Test("Decodes legacy payload without samples")
+    func test_decode_legacyPayloadWithoutSamples() throws {
+        let json = Data(#"{"p50":1,"p95":2,"min":0.5,"max":3}"#.utf8)
+        let d = try JSONDecoder().decode(StageDistribution.self, from: json)
+        #expect(d.p95 == 2)
+        #expect(d.p99 == nil)
+        #expect(d.samples == nil)
+    }
 }
 
 @Suite("PerfProviderPlan")
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+HTTP cassettes for stt-eval, rewrite-bakeoff and the perf report synthesis.
+
+--record-cassette PATH runs against the real providers and appends every
+request/response pair to PATH (JSON Lines, one interaction per line).
+--replay-cassette PATH serves those responses locally instead, so report
+generation, scoring and the trace/profile hooks can be exercised without
+network access, API keys or spend:
+
+    python3 scripts/stt-eval.py clip.wav --record-cassette /tmp/stt.cassette
+    python3 scripts/stt-eval.py clip.wav --replay-cassette /tmp/stt.cassette
+    python3 scripts/stt-eval.py clip.wav --replay-cassette /tmp/stt.cassette --replay-speed 0
+
+Requests are matched by fingerprint: method, URL (query parameters sorted)
+and a SHA-256 of the body, with multipart boundaries normalized. Repeated
+requests (iterations) replay their recorded responses in order, cycling
+when a replay run asks for more than were recorded. A request with no
+recorded response fails like a connection error.
+
+Each interaction keeps the measured HTTP phases (connect / upload / ttfb /
+download, see eval_trace). Replay sleeps for the recorded latency scaled by
+--replay-speed (1 = recorded pace, 0 = no sleep) and, with --trace, emits the
+recorded phases as spans, so replayed traces look like the live run.
+
+Replayed latencies are not measurements: replayed stt-eval/bakeoff runs write
+their docs/performance outputs with a -replay suffix and are never recorded
+in the eval results store (eval_store import refuses them too).
+
+Secrets stay out of the file: request headers are stored by name only, and
+none of the providers take credentials in the URL or body.
+
+The core is stdlib only so the perf report can use it; post() needs requests.
+"""
+
+import base64
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+CASSETTE_VERSION = 1
+
+# Response headers worth replaying; the rest (cookies, request ids, dates) are noise.
+REPLAY_HEADERS = ("content-type", "retry-after")
+
+
+class CassetteMiss(ConnectionError):
+    """No recorded response for a replayed request."""
+
+
+def normalize_url(url):
+    """URL with query parameters sorted, so dict ordering never changes the fingerprint."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, query, ""))
+
+
+def fingerprint(method, url, body):
+    """Stable request identity: method, normalized URL and body hash."""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    digest = hashlib.sha256(body or b"").hexdigest()
+    return f"{method.upper()} {normalize_url(url)} {digest}"
+
+
+def encode_body(content):
+    """Response body as JSON-safe fields: text when it is UTF-8, else base64."""
+    try:
+        return {"body": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_base64": base64.b64encode(content).decode("ascii")}
+
+
+def decode_body(interaction):
+    response = interaction["response"]
+    if "body_base64" in response:
+        return base64.b64decode(response["body_base64"])
+    return response.get("body", "").encode("utf-8")
+
+
+class Cassette:
+    """Recorded interactions in one JSONL file, opened for "record" or "replay"."""
+
+    def __init__(self, path, mode, replay_speed=1.0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"unknown cassette mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.replay_speed = max(0.0, replay_speed)
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._interactions = {}
+        self._cursors = {}
+        if mode == "replay":
+            self._load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _load(self):
+        with self.path.open(encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    interaction = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"{self.path}:{number}: {e}") from e
+                self._interactions.setdefault(interaction["request"]["fingerprint"], []).append(interaction)
+
+    @property
+    def replaying(self):
+        return self.mode == "replay"
+
+    def hosts(self):
+        """Hosts with at least one recorded interaction."""
+        return {urlsplit(items[0]["request"]["url"]).netloc for items in self._interactions.values()}
+
+    def record(self, method, url, body, header_names, status, headers, content, elapsed_s, phases=()):
+        """Append one interaction; header values are never written."""
+        lowered = {name.lower(): value for name, value in headers.items()}
+        interaction = {
+            "version": CASSETTE_VERSION,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "request": {
+                "fingerprint": fingerprint(method, url, body),
+                "method": method.upper(),
+                "url": normalize_url(url),
+                "header_names": sorted(header_names, key=str.lower),
+                "body_bytes": len(body or b""),
+            },
+            "response": {
+                "status": status,
+                "headers": {name: lowered[name] for name in REPLAY_HEADERS if name in lowered},
+                **encode_body(content),
+            },
+            "timing": {
+                "elapsed_s": round(elapsed_s, 6),
+                "phases": [[name, round(start, 6), round(end, 6)] for name, start, end in phases],
+            },
+        }
+        line = json.dumps(interaction, separators=(",", ":")) + "\n"
+        with self._lock, self.path.open("a", encoding="utf-8") as f:
+            f.write(line)
+            self.recorded += 1
+
+    def replay(self, method, url, body):
+        """Next recorded interaction for this request; raises CassetteMiss when there is none."""
+        key = fingerprint(method, url, body)
+        with self._lock:
+            items = self._interactions.get(key)
+            if not items:
+                self.misses += 1
+                raise CassetteMiss(f"no recorded response for {method.upper()} {normalize_url(url)} in {self.path}")
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            self.replayed += 1
+            return items[cursor % len(items)]
+
+    def pace(self, interaction):
+        """Sleep for the recorded latency scaled by replay_speed."""
+        delay = interaction["timing"]["elapsed_s"] * self.replay_speed
+        if delay > 0:
+            time.sleep(delay)
+
+    def summary(self):
+        if self.replaying:
+            return f"cassette: replayed {self.replayed} response(s), {self.misses} miss(es) from {self.path}"
+        return f"cassette: recorded {self.recorded} interaction(s) to {self.path}"
+
+
+_cassette = None
+
+
+def add_cassette_arguments(parser):
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--record-cassette", metavar="PATH", help="Record every provider request/response to PATH (JSONL)")
+    group.add_argument("--replay-cassette", metavar="PATH", help="Serve provider responses from PATH instead of the network")
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="Scale recorded latency during --replay-cassette (default: 1 = recorded pace, 0 = no sleep)",
+    )
+
+
+def configure(args):
+    """Activate the cassette selected by add_cassette_arguments() flags; returns it (or None)."""
+    global _cassette
+    if args.record_cassette:
+        _cassette = Cassette(args.record_cassette, "record")
+    elif args.replay_cassette:
+        _cassette = Cassette(args.replay_cassette, "replay", args.replay_speed)
+    else:
+        _cassette = None
+    return _cassette
+
+
+def current():
+    return _cassette
+
+
+def replaying():
+    return _cassette is not None and _cassette.replaying
+
+
+# ---------------------------------------------------------------------------
+# requests integration
+# ---------------------------------------------------------------------------
+
+def _prepared_body(prepared):
+    """Request body bytes with the random multipart boundary replaced by a fixed one."""
+    body = prepared.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    content_type = prepared.headers.get("Content-Type", "")
+    if "boundary=" in content_type:
+        boundary = content_type.split("boundary=", 1)[1].split(";", 1)[0].strip('"')
+        body = body.replace(boundary.encode("ascii"), b"vox-cassette-boundary")
+    return body
+
+
+def _rewind_files(files):
+    """Preparing a multipart body reads the file objects; put them back for the real upload."""
+    for value in (files.values() if isinstance(files, dict) else files or ()):
+        if isinstance(value, (tuple, list)):
+            value = value[1] if len(value) > 1 else value[0]
+        if hasattr(value, "seek"):
+            value.seek(0)
+
+
+def post(url, **kwargs):
+    """eval_trace.post, recorded to or replayed from the active cassette."""
+    # Imported here so format-perf-report can use the stdlib core without requests.
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    import eval_trace
+
+    cassette = _cassette
+    if cassette is None:
+        return eval_trace.post(url, **kwargs)
+
+    request_fields = {key: kwargs[key] for key in ("params", "headers", "files", "data", "json") if key in kwargs}
+    prepared = requests.Request("POST", url, **request_fields).prepare()
+    _rewind_files(kwargs.get("files"))
+    body = _prepared_body(prepared)
+    header_names = list(kwargs.get("headers") or {})
+
+    if not cassette.replaying:
+        phases = []
+        start = time.perf_counter()
+        resp = eval_trace.post(url, phases=phases, **kwargs)
+        cassette.record(
+            "POST", prepared.url, body, header_names,
+            resp.status_code, resp.headers, resp.content, time.perf_counter() - start, phases,
+        )
+        return resp
+
+    host = urlsplit(url).netloc
+    with eval_trace.span(f"POST {host}", "http", {"url": url, "replayed": True}) as fields:
+        try:
+            interaction = cassette.replay("POST", prepared.url, body)
+        except CassetteMiss as e:
+            eval_trace.instant("cassette miss", args={"host": host})
+            raise requests.ConnectionError(str(e)) from e
+        recorder = eval_trace.current()
+        started_us = recorder.now_us() if recorder else 0.0
+        cassette.pace(interaction)
+        speed = cassette.replay_speed
+        phases = [(name, start * speed, end * speed) for name, start, end in interaction["timing"]["phases"]]
+        eval_trace.note_phases(phases)
+        if recorder is not None:
+            for name, start, end in phases:
+                recorder.complete(name, "http", started_us + start * 1e6, (end - start) * 1e6)
+        recorded = interaction["response"]
+        fields["status"] = recorded["status"]
+        eval_trace.mark_status(host, recorded["status"], recorded["headers"].get("retry-after"))
+
+    resp = requests.Response()
+    resp.status_code = recorded["status"]
+    resp.headers = CaseInsensitiveDict(recorded["headers"])
+    resp._content = decode_body(interaction)
+    resp.encoding = requests.utils.get_encoding_from_headers(resp.headers) or "utf-8"
+    resp.url = prepared.url
+    resp.request = prepared
+    return resp
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Shared profiling hooks for stt-eval, rewrite-bakeoff and format-perf-report.
+
+Phase timers are always on. Each script marks its main-thread work with
+switch("load" | "network" | "scoring" | "aggregation" | "render") at
+boundaries, or `with phase(...)` for work nested inside another phase.
+Phases are exclusive: entering one pauses the enclosing phase, so the
+rows add up to the run's wall time. CPU time is process-wide, so a network
+phase also counts the JSON decoding done by its worker threads.
+
+--profile PREFIX additionally writes:
+
+    PREFIX.pstats      cProfile of the main thread
+                       (python3 -m pstats PREFIX.pstats, or snakeviz)
+    PREFIX.collapsed   sampled stacks of every thread in collapsed format
+                       (flamegraph.pl, speedscope, or inferno)
+
+Stdlib only, so the perf report can use it without extra dependencies.
+"""
+
+import atexit
+import cProfile
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+PHASES = ("load", "network", "scoring", "aggregation", "render")
+DEFAULT_SAMPLE_INTERVAL_MS = 5.0
+
+
+class PhaseTimer:
+    """Exclusive wall and CPU time per phase, measured from the main thread."""
+
+    def __init__(self):
+        self.wall = {}
+        self.cpu = {}
+        self._stack = []
+        self._mark = (time.perf_counter(), time.process_time())
+        self.started = self._mark[0]
+
+    def _charge(self):
+        wall, cpu = time.perf_counter(), time.process_time()
+        if self._stack:
+            name = self._stack[-1]
+            self.wall[name] = self.wall.get(name, 0.0) + wall - self._mark[0]
+            self.cpu[name] = self.cpu.get(name, 0.0) + cpu - self._mark[1]
+        self._mark = (wall, cpu)
+
+    def switch(self, name):
+        """Charge time from now on to `name` instead of the current phase."""
+        self._charge()
+        if self._stack:
+            self._stack[-1] = name
+        else:
+            self._stack.append(name)
+
+    @contextmanager
+    def phase(self, name):
+        self._charge()
+        self._stack.append(name)
+        try:
+            yield
+        finally:
+            self._charge()
+            self._stack.pop()
+
+    def rows(self):
+        """[(phase, wall_s, cpu_s)] in PHASES order, then any other phase, then unattributed time."""
+        self._charge()
+        names = [name for name in PHASES if name in self.wall]
+        names += sorted(name for name in self.wall if name not in PHASES)
+        rows = [(name, self.wall[name], self.cpu[name]) for name in names]
+        other = time.perf_counter() - self.started - sum(wall for _, wall, _ in rows)
+        if other >= 0.0005:
+            rows.append(("other", other, None))
+        return rows
+
+    def summary_lines(self):
+        rows = self.rows()
+        total = sum(wall for _, wall, _ in rows) or 1.0
+        lines = ["Phase          Wall      CPU   Share"]
+        for name, wall, cpu in rows:
+            cpu_text = f"{cpu:7.2f}s" if cpu is not None else "      —"
+            lines.append(f"{name:12s} {wall:7.2f}s {cpu_text} {wall / total:6.0%}")
+        return lines
+
+    def one_line(self):
+        return " · ".join(
+            f"{name} {wall:.2f}s" + (f" ({cpu:.2f}s cpu)" if cpu is not None else "")
+            for name, wall, cpu in self.rows()
+        )
+
+
+_timer = PhaseTimer()
+
+
+def reset_phases():
+    """Start a fresh set of phase timers (e.g. per report when called in-process)."""
+    global _timer
+    _timer = PhaseTimer()
+    return _timer
+
+
+def phases():
+    return _timer
+
+
+def phase(name):
+    return _timer.phase(name)
+
+
+def switch(name):
+    _timer.switch(name)
+
+
+class StackSampler:
+    """Background thread sampling every thread's Python stack into collapsed-stack counts."""
+
+    def __init__(self, interval_ms=DEFAULT_SAMPLE_INTERVAL_MS):
+        self.interval = max(0.001, interval_ms / 1000)
+        self.counts = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="eval-profile-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                    frame = frame.f_back
+                # Pool workers share a lane: "provider_3" -> "provider".
+                lane = names.get(ident, "thread").rsplit("_", 1)[0]
+                self.counts[";".join([lane, *reversed(stack)])] += 1
+            self.samples += 1
+
+    def write(self, path):
+        Path(path).write_text("".join(f"{stack} {count}\n" for stack, count in self.counts.most_common()))
+
+
+def add_profile_argument(parser):
+    parser.add_argument(
+        "--profile",
+        metavar="PREFIX",
+        help="Write PREFIX.pstats (cProfile, main thread) and PREFIX.collapsed (sampled stacks, all threads)",
+    )
+    parser.add_argument(
+        "--profile-interval-ms",
+        type=float,
+        default=DEFAULT_SAMPLE_INTERVAL_MS,
+        help=f"Stack sampling interval for --profile (default: {DEFAULT_SAMPLE_INTERVAL_MS:g})",
+    )
+
+
+def start_profile(prefix, interval_ms=DEFAULT_SAMPLE_INTERVAL_MS, out=sys.stderr):
+    """Start cProfile + the stack sampler; returns stop(), which also runs at exit.
+
+    No-op (returning a no-op stop) when prefix is empty.
+    """
+    if not prefix:
+        return lambda: None
+    Path(prefix).parent.mkdir(parents=True, exist_ok=True)
+    profiler = cProfile.Profile()
+    sampler = StackSampler(interval_ms)
+    stopped = []
+
+    def stop():
+        if stopped:
+            return
+        stopped.append(True)
+        profiler.disable()
+        sampler.stop()
+        profiler.dump_stats(f"{prefix}.pstats")
+        sampler.write(f"{prefix}.collapsed")
+        print(f"profile: {prefix}.pstats, {prefix}.collapsed ({sampler.samples} stack sample(s))", file=out)
+
+    atexit.register(stop)
+    sampler.start()
+    profiler.enable()
+    return stop
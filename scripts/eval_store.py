@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Eval results store — append-only SQLite history for stt-eval and
+rewrite-bakeoff runs.
+
+Usage:
+    python3 scripts/eval_store.py import docs/performance/*-raw-*.json
+    python3 scripts/eval_store.py runs
+    python3 scripts/eval_store.py trends --kind stt --by month
+    python3 scripts/eval_store.py trends --kind rewrite --level clean --metric latency_s
+
+Both eval scripts record every run here (disable with --no-db). The date-
+stamped markdown/JSON files in docs/performance/ stay the human-readable
+artifacts; this store is for querying across runs. Default location is
+~/.local/share/vox/eval-results.sqlite (override with VOX_EVAL_DB or --db).
+
+Schema:
+    runs      one row per script invocation (kind = stt | rewrite)
+    requests  one row per provider/model call (item = clip or corpus entry)
+    metrics   per-request numeric metrics (latency_s and its HTTP phases
+              connect_s / upload_s / ttfb_s / download_s, bytes, tokens,
+              cost, wer, levenshtein, ...)
+
+Rows are only ever inserted. Each run carries a hash of its raw payload, so
+re-importing a raw JSON that was already recorded live is a no-op.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_DB = Path(
+    os.environ.get("VOX_EVAL_DB")
+    or Path.home() / ".local" / "share" / "vox" / "eval-results.sqlite"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    label TEXT,
+    source TEXT NOT NULL,
+    source_hash TEXT NOT NULL UNIQUE,
+    config TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_kind_started ON runs(kind, started_at);
+
+CREATE TABLE IF NOT EXISTS requests (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    provider TEXT NOT NULL,
+    level TEXT,
+    item TEXT,
+    variant TEXT,
+    iteration INTEGER,
+    ok INTEGER NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS requests_run ON requests(run_id);
+CREATE INDEX IF NOT EXISTS requests_provider_level ON requests(provider, level);
+
+CREATE TABLE IF NOT EXISTS metrics (
+    request_id INTEGER NOT NULL REFERENCES requests(id),
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (request_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS metrics_name ON metrics(name, request_id);
+"""
+
+# Raw result field -> stored metric name.
+# HTTP phase seconds per request (eval_trace.take_phases); older raw files have none.
+PHASE_METRICS = {
+    "connect": "connect_s",
+    "upload": "upload_s",
+    "ttfb": "ttfb_s",
+    "download": "download_s",
+}
+STT_METRICS = {
+    "latency": "latency_s",
+    **PHASE_METRICS,
+    "bytes": "bytes",
+    "chars": "chars",
+    "wer": "wer",
+    "similarity": "similarity",
+}
+REWRITE_METRICS = {
+    "latency": "latency_s",
+    **PHASE_METRICS,
+    "cost": "cost",
+    "prompt_tokens": "prompt_tokens",
+    "completion_tokens": "completion_tokens",
+    "ratio": "ratio",
+    "levenshtein": "levenshtein",
+    "content_overlap": "content_overlap",
+}
+
+
+def connect(db_path=None):
+    """Open (creating if needed) the results store."""
+    path = Path(db_path or DEFAULT_DB)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path))
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def payload_hash(raw_data):
+    canonical = json.dumps(raw_data, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _insert_run(conn, kind, raw_data, label, source):
+    config = {k: v for k, v in raw_data.items() if k != "results"}
+    cur = conn.execute(
+        "INSERT OR IGNORE INTO runs (kind, started_at, label, source, source_hash, config) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            kind,
+            str(raw_data.get("timestamp") or ""),
+            label,
+            source,
+            payload_hash(raw_data),
+            json.dumps(config, sort_keys=True, default=str),
+        ),
+    )
+    return cur.lastrowid if cur.rowcount else None
+
+
+def _insert_request(conn, run_id, provider, level, result, metric_map):
+    cur = conn.execute(
+        "INSERT INTO requests (run_id, provider, level, item, variant, iteration, ok, error) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            run_id,
+            provider,
+            level,
+            result.get("clip") or result.get("entry_id"),
+            result.get("variant"),
+            result.get("iteration"),
+            0 if "error" in result else 1,
+            result.get("error"),
+        ),
+    )
+    request_id = cur.lastrowid
+    rows = [
+        (request_id, name, float(result[key]))
+        for key, name in metric_map.items()
+        if isinstance(result.get(key), (int, float)) and not isinstance(result.get(key), bool)
+    ]
+    conn.executemany("INSERT INTO metrics (request_id, name, value) VALUES (?, ?, ?)", rows)
+
+
+def record_stt_run(conn, raw_data, source="live"):
+    """Record an stt-eval raw payload. Returns run id, or None if already stored."""
+    with conn:
+        run_id = _insert_run(conn, "stt", raw_data, raw_data.get("label"), source)
+        if run_id is None:
+            return None
+        for provider, results in (raw_data.get("results") or {}).items():
+            for result in results:
+                _insert_request(conn, run_id, provider, None, result, STT_METRICS)
+    return run_id
+
+
+def record_bakeoff_run(conn, raw_data, source="live"):
+    """Record a rewrite-bakeoff raw payload. Returns run id, or None if already stored."""
+    with conn:
+        run_id = _insert_run(conn, "rewrite", raw_data, raw_data.get("output_suffix"), source)
+        if run_id is None:
+            return None
+        for level, by_model in (raw_data.get("results") or {}).items():
+            for model, results in by_model.items():
+                for result in results:
+                    _insert_request(conn, run_id, model, level, result, REWRITE_METRICS)
+    return run_id
+
+
+def import_raw_file(conn, path):
+    """Import a bakeoff-raw-*.json or stt-eval-raw-*.json file."""
+    raw_data = json.loads(Path(path).read_text())
+    if (raw_data.get("cassette") or {}).get("mode") == "replay":
+        # Latencies were replayed (and scaled by --replay-speed), not measured.
+        raise ValueError("replayed run, not recorded in the store")
+    results = raw_data.get("results") or {}
+    is_bakeoff = "models" in raw_data or any(isinstance(v, dict) for v in results.values())
+    if is_bakeoff:
+        return "rewrite", record_bakeoff_run(conn, raw_data, source=str(path))
+    return "stt", record_stt_run(conn, raw_data, source=str(path))
+
+
+def percentile(values, q):
+    """Linear-interpolated percentile (matches numpy's default)."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = q / 100 * (len(ordered) - 1)
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def period_key(started_at, by):
+    try:
+        ts = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+    except ValueError:
+        return started_at[:7] or "—"
+    if by == "day":
+        return ts.strftime("%Y-%m-%d")
+    if by == "week":
+        year, week, _ = ts.isocalendar()
+        return f"{year}-W{week:02d}"
+    return ts.strftime("%Y-%m")
+
+
+def query_trends(conn, kind, metric="latency_s", by="month", provider=None, level=None):
+    """Per-period, per-provider distribution of one metric over successful requests."""
+    sql = (
+        "SELECT r.started_at, q.provider, q.level, m.value "
+        "FROM metrics m JOIN requests q ON q.id = m.request_id JOIN runs r ON r.id = q.run_id "
+        "WHERE r.kind = ? AND m.name = ? AND q.ok = 1"
+    )
+    params = [kind, metric]
+    if provider:
+        sql += " AND q.provider = ?"
+        params.append(provider)
+    if level:
+        sql += " AND q.level = ?"
+        params.append(level)
+
+    groups = {}
+    for started_at, prov, lvl, value in conn.execute(sql, params):
+        key = (period_key(started_at, by), prov, lvl or "")
+        groups.setdefault(key, []).append(value)
+
+    return [
+        {
+            "period": period,
+            "provider": prov,
+            "level": lvl,
+            "n": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "mean": sum(values) / len(values),
+        }
+        for (period, prov, lvl), values in sorted(groups.items())
+    ]
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def cmd_import(conn, args):
+    for path in args.files:
+        try:
+            kind, run_id = import_raw_file(conn, path)
+        except (OSError, ValueError) as e:
+            print(f"  {path}: skipped ({e})", file=sys.stderr)
+            continue
+        status = f"run {run_id}" if run_id else "already imported"
+        print(f"  {path}: {kind} {status}")
+
+
+def cmd_runs(conn, args):
+    rows = conn.execute(
+        "SELECT r.id, r.kind, r.started_at, COALESCE(r.label, ''), r.source, COUNT(q.id) "
+        "FROM runs r LEFT JOIN requests q ON q.run_id = r.id "
+        "GROUP BY r.id ORDER BY r.started_at"
+    ).fetchall()
+    print("| Run | Kind | Started | Label | Requests | Source |")
+    print("| --- | --- | --- | --- | --- | --- |")
+    for run_id, kind, started_at, label, source, n in rows:
+        print(f"| {run_id} | {kind} | {started_at} | {label} | {n} | `{source}` |")
+
+
+def cmd_trends(conn, args):
+    rows = query_trends(
+        conn, args.kind, metric=args.metric, by=args.by, provider=args.provider, level=args.level
+    )
+    if not rows:
+        print("No matching results.")
+        return
+    print(f"| Period | {'Model' if args.kind == 'rewrite' else 'Provider'} | Level | n | p50 | p95 | mean |")
+    print("| --- | --- | --- | --- | --- | --- | --- |")
+    for row in rows:
+        print(
+            f"| {row['period']} | {row['provider']} | {row['level'] or '—'} | {row['n']} | "
+            f"{row['p50']:.3f} | {row['p95']:.3f} | {row['mean']:.3f} |"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query and import eval results history")
+    parser.add_argument("--db", default=str(DEFAULT_DB), help=f"SQLite path (default: {DEFAULT_DB})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_import = sub.add_parser("import", help="Import stt-eval-raw-*.json / bakeoff-raw-*.json files")
+    p_import.add_argument("files", nargs="+")
+
+    sub.add_parser("runs", help="List recorded runs")
+
+    p_trends = sub.add_parser("trends", help="Per-provider/model metric trend by period")
+    p_trends.add_argument("--kind", choices=["stt", "rewrite"], required=True)
+    p_trends.add_argument("--metric", default="latency_s")
+    p_trends.add_argument("--by", choices=["day", "week", "month"], default="month")
+    p_trends.add_argument("--provider", help="Provider (stt) or model (rewrite) filter")
+    p_trends.add_argument("--level", help="Rewrite level filter (clean, polish, ...)")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    try:
+        {"import": cmd_import, "runs": cmd_runs, "trends": cmd_trends}[args.command](conn, args)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Chrome trace-event export for stt-eval and rewrite-bakeoff runs.
+
+Both eval scripts accept --trace PATH. While a trace is enabled, every
+provider request becomes a span on the thread that made it, with child
+spans for the HTTP phases:
+
+    connect   TCP + TLS handshake (absent when a connection is reused)
+    upload    request line, headers and body written
+    ttfb      waiting for the status line and headers
+    download  reading the response body
+
+Phase durations of each thread's last request are also kept without
+--trace (take_phases()), so the eval scripts store them per request as
+connect_s / upload_s / ttfb_s / download_s.
+
+Non-2xx responses and exceptions leave instant markers (429s carry the
+Retry-After header). Open the file in https://ui.perfetto.dev or
+chrome://tracing to see how requests overlap, queue and stall.
+
+Timestamps are microseconds since the recorder started (perf_counter).
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class TraceRecorder:
+    """Thread-safe collector of Chrome trace events for one process."""
+
+    def __init__(self, process_name):
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.events = [
+            {"name": "process_name", "ph": "M", "pid": self.pid, "tid": 0, "args": {"name": process_name}},
+        ]
+        self._lock = threading.Lock()
+        self._tids = {}
+
+    def now_us(self):
+        return (time.perf_counter() - self.origin) * 1e6
+
+    def _tid(self):
+        """Small stable thread id, registering the thread's name as its lane label."""
+        ident = threading.get_ident()
+        tid = self._tids.get(ident)
+        if tid is None:
+            with self._lock:
+                tid = self._tids.setdefault(ident, len(self._tids) + 1)
+                self.events.append({
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self.pid,
+                    "tid": tid,
+                    "args": {"name": threading.current_thread().name},
+                })
+        return tid
+
+    def _append(self, event):
+        with self._lock:
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name, cat="eval", args=None):
+        """Complete ("X") event around the block; the yielded dict becomes the span's args."""
+        fields = dict(args or {})
+        tid = self._tid()
+        start = self.now_us()
+        try:
+            yield fields
+        except BaseException as e:
+            fields.setdefault("error", f"{type(e).__name__}: {e}"[:200])
+            raise
+        finally:
+            self._append({
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": round(start, 1),
+                "dur": round(self.now_us() - start, 1),
+                "pid": self.pid,
+                "tid": tid,
+                "args": fields,
+            })
+
+    def complete(self, name, cat, start_us, dur_us, args=None):
+        """Complete event with explicit timing (e.g. phases replayed from a cassette)."""
+        self._append({
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": round(start_us, 1),
+            "dur": round(dur_us, 1),
+            "pid": self.pid,
+            "tid": self._tid(),
+            "args": dict(args or {}),
+        })
+
+    def instant(self, name, cat="marker", args=None):
+        self._append({
+            "name": name,
+            "cat": cat,
+            "ph": "i",
+            "s": "t",
+            "ts": round(self.now_us(), 1),
+            "pid": self.pid,
+            "tid": self._tid(),
+            "args": dict(args or {}),
+        })
+
+    def write(self, path, metadata=None):
+        with self._lock:
+            events = list(self.events)
+        payload = {"traceEvents": events, "displayTimeUnit": "ms", "otherData": metadata or {}}
+        Path(path).write_text(json.dumps(payload, separators=(",", ":"), default=str))
+
+
+_recorder = None
+
+
+def enable(process_name):
+    """Start recording for this process; returns the recorder."""
+    global _recorder
+    _recorder = TraceRecorder(process_name)
+    return _recorder
+
+
+def current():
+    return _recorder
+
+
+def span(name, cat="eval", args=None):
+    """recorder.span when tracing is enabled, else a no-op yielding a throwaway dict."""
+    if _recorder is None:
+        return nullcontext({})
+    return _recorder.span(name, cat, args)
+
+
+def instant(name, cat="marker", args=None):
+    if _recorder is not None:
+        _recorder.instant(name, cat, args)
+
+
+# ---------------------------------------------------------------------------
+# HTTP phases
+# ---------------------------------------------------------------------------
+
+_local = threading.local()
+
+
+@contextmanager
+def _http_phase(name):
+    """Trace span for one HTTP phase; also logged as [start_s, end_s] offsets when post() asked for them."""
+    log = getattr(_local, "phases", None)
+    start = time.perf_counter()
+    try:
+        with span(name, "http"):
+            yield
+    finally:
+        if log is not None:
+            log.append((name, start - _local.started, time.perf_counter() - _local.started))
+
+
+class _PhaseSpans:
+    """Mixin for urllib3 connections: connect / upload / ttfb phases on the calling thread."""
+
+    def connect(self):
+        with _http_phase("connect"):
+            return super().connect()
+
+    def request(self, *args, **kwargs):
+        with _http_phase("upload"):
+            return super().request(*args, **kwargs)
+
+    def getresponse(self, *args, **kwargs):
+        with _http_phase("ttfb"):
+            return super().getresponse(*args, **kwargs)
+
+
+class _TracedHTTPConnection(_PhaseSpans, HTTPConnection):
+    pass
+
+
+class _TracedHTTPSConnection(_PhaseSpans, HTTPSConnection):
+    pass
+
+
+class _TracedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TracedHTTPConnection
+
+
+class _TracedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TracedHTTPSConnection
+
+
+class _TracedAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TracedHTTPConnectionPool,
+            "https": _TracedHTTPSConnectionPool,
+        }
+
+
+def post(url, phases=None, **kwargs):
+    """requests.post, traced as a "POST <host>" span with phase children when enabled.
+
+    Pass a list as `phases` to get (name, start_s, end_s) offsets from the
+    call's start for connect/upload/ttfb/download; take_phases() returns the
+    same phases as durations either way.
+    Like requests.post, each call gets a fresh session (and so a fresh
+    connection), which keeps traced and untraced runs comparable.
+    """
+    phases = [] if phases is None else phases
+    _local.last_phases = phases
+    host = urlsplit(url).netloc
+    _local.phases, _local.started = phases, time.perf_counter()
+    try:
+        with span(f"POST {host}", "http", {"url": url}) as fields:
+            with requests.Session() as session:
+                adapter = _TracedAdapter()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                try:
+                    resp = session.post(url, stream=True, **kwargs)
+                except requests.RequestException as e:
+                    instant("request failed", args={"host": host, "error": str(e)[:200]})
+                    raise
+                with _http_phase("download"):
+                    body = resp.content
+            fields["status"] = resp.status_code
+            fields["response_bytes"] = len(body)
+            mark_status(host, resp.status_code, resp.headers.get("Retry-After"))
+    finally:
+        _local.phases = None
+    return resp
+
+
+def note_phases(phases):
+    """Set this thread's last request phases ((name, start_s, end_s) offsets), e.g. when replayed."""
+    _local.last_phases = list(phases)
+
+
+def take_phases():
+    """Seconds per HTTP phase of this thread's last post(), then forget them.
+
+    Empty when the thread made no request since the last call (e.g. chunked
+    uploads, whose requests run on other threads).
+    """
+    phases = getattr(_local, "last_phases", None) or ()
+    _local.last_phases = None
+    durations = {}
+    for name, start, end in phases:
+        durations[name] = durations.get(name, 0.0) + end - start
+    return durations
+
+
+def mark_status(host, status, retry_after=None):
+    """Instant marker for a 429 (with Retry-After) or other HTTP error."""
+    if status == 429:
+        instant("HTTP 429 rate limited", args={"host": host, "retry_after": retry_after})
+    elif status >= 400:
+        instant(f"HTTP {status}", args={"host": host})
@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Benchmark format-perf-report.py against synthetic perf history.
+
+Usage:
+    python3 scripts/perf/bench-perf-report.py                      # 100, 1k, 10k, 50k runs
+    python3 scripts/perf/bench-perf-report.py --sizes 100,10000
+    python3 scripts/perf/bench-perf-report.py --sizes 1000 --json-out /tmp/bench-before.json
+    python3 scripts/perf/bench-perf-report.py --sizes 1000 --compare /tmp/bench-before.json
+
+Generates deterministic history on disk — legacy v2 provider runs, then v3
+provider + codepath runs with a configurable PR/master mix and fixture count —
+and times each stage of the report path:
+
+    load_history_runs      parse every history JSON
+    dedupe_and_sort_runs   identity dedupe + chronological sort
+    build_snapshot         per-run snapshot (fixture aggregation)
+    history cache (cold)   load_history_snapshots into an empty SQLite cache
+    history cache (warm)   load_history_snapshots with every file cached
+    index build            HistoryIndex over all snapshots
+    critical metrics       collect_critical_metrics
+    report sections        summary, signals, lane detail (best of --repeat)
+    full report            main() end to end (no LLM, warm cache)
+
+Each stage records wall time and tracemalloc peak (a second, traced pass;
+skip with --no-memory). --json-out saves results; --compare prints the
+change against a saved run so report-path optimizations can be compared.
+
+--null-check N skips the timings and instead draws N head/base provider pairs
+from the same distribution, counting how often the overall vs-base verdict is
+not neutral. That false-positive rate must stay at or below alpha (exit 1
+otherwise), however many fixture × level tests the verdict is built from:
+
+    python3 scripts/perf/bench-perf-report.py --null-check 300 --fixtures 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import importlib.util
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+STAGES = ("encodeMs", "sttMs", "rewriteMs", "pasteMs")
+LANE_STAGE_MS = {
+    # (encode, stt, rewrite, paste) medians per lane
+    "provider": (25.0, 650.0, 420.0, 40.0),
+    "codepath": (4.0, 30.0, 25.0, 2.0),
+}
+FIXTURE_CATALOG = (("fixture-short", 96_000), ("fixture-medium", 320_000), ("fixture-long", 960_000))
+BENCH_VERSION = 1
+
+
+def load_formatter():
+    spec = importlib.util.spec_from_file_location("format_perf_report", SCRIPT_DIR / "format-perf-report.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses resolve annotations via sys.modules
+    spec.loader.exec_module(module)
+    return module
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    rank = q * (len(ordered) - 1)
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def dist(samples: list[float], with_samples: bool = True) -> dict[str, Any]:
+    ordered = sorted(samples)
+    entry: dict[str, Any] = {
+        "p50": percentile(ordered, 0.50),
+        "p95": percentile(ordered, 0.95),
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+    if with_samples:
+        entry["p99"] = percentile(ordered, 0.99)
+        entry["samples"] = samples
+    return entry
+
+
+def level_entry(
+    rng: random.Random,
+    lane: str,
+    level: str,
+    iterations: int,
+    scale: float,
+    with_samples: bool = True,
+) -> dict[str, Any]:
+    medians = LANE_STAGE_MS[lane]
+    jitter = 0.25 if lane == "provider" else 0.05
+    samples: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    for _ in range(iterations):
+        for stage, median_ms in zip(STAGES, medians):
+            value = median_ms * scale * rng.lognormvariate(0, jitter)
+            if stage == "rewriteMs" and level == "raw":
+                value = 0.0
+            elif stage == "rewriteMs" and level == "polish":
+                value *= 1.8
+            samples[stage].append(value)
+    generation = [samples["encodeMs"][i] + samples["sttMs"][i] + samples["rewriteMs"][i] for i in range(iterations)]
+    total = [generation[i] + samples["pasteMs"][i] for i in range(iterations)]
+    distributions = {stage: dist(values, with_samples) for stage, values in samples.items()}
+    distributions["generationMs"] = dist(generation, with_samples)
+    distributions["totalStageMs"] = dist(total, with_samples)
+    return {
+        "level": level,
+        "iterations": iterations,
+        "providers": {
+            "sttMode": "batch",
+            "sttObserved": [{"provider": "ElevenLabs", "model": "scribe_v2", "count": iterations}],
+            "rewriteObserved": None if level == "raw" else [{"path": "openrouter", "model": "inception/mercury", "count": iterations}],
+        },
+        "distributions": distributions,
+    }
+
+
+def make_run(
+    rng: random.Random,
+    lane: str,
+    commit: str,
+    generated_at: datetime,
+    pr_number: Optional[int],
+    iterations: int = 5,
+    fixtures: tuple[tuple[str, int], ...] = FIXTURE_CATALOG[:2],
+) -> dict[str, Any]:
+    """Schema v3 run (provider or codepath lane) with per-fixture results and samples."""
+    fixture_results = []
+    for fixture_id, audio_bytes in fixtures:
+        scale = 1.0 + audio_bytes / 1_000_000
+        fixture_results.append({
+            "fixtureID": fixture_id,
+            "audioFile": f"{fixture_id}.caf",
+            "audioBytes": audio_bytes,
+            "levels": [level_entry(rng, lane, level, iterations, scale) for level in ("raw", "clean", "polish")],
+        })
+    return {
+        "schemaVersion": 3,
+        "generatedAt": generated_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "lane": lane,
+        "commitSHA": commit,
+        "pullRequestNumber": pr_number,
+        "label": f"synthetic-{lane}",
+        "iterationsPerLevel": iterations,
+        "warmupIterationsPerLevel": 1,
+        "audioFile": f"{len(fixtures)} fixtures",
+        "audioBytes": sum(audio_bytes for _, audio_bytes in fixtures),
+        "fixtures": [{"id": f, "audioFile": f"{f}.caf", "audioBytes": b} for f, b in fixtures],
+        "fixtureResults": fixture_results,
+        "sttMode": "batch",
+        "sttSelectionPolicy": "preference",
+        "sttForcedProvider": None,
+        "sttChain": [{"provider": "ElevenLabs", "model": "scribe_v2"}, {"provider": "Deepgram", "model": "nova-3"}],
+        "rewriteRouting": "openrouter(inception/mercury)",
+        "levels": [level_entry(rng, lane, level, iterations * len(fixtures), 1.2) for level in ("raw", "clean", "polish")],
+    }
+
+
+def make_v2_run(
+    rng: random.Random,
+    commit: str,
+    generated_at: datetime,
+    pr_number: Optional[int],
+    iterations: int = 5,
+) -> dict[str, Any]:
+    """Legacy schema v2 run: provider-only, one fixture, no lane, no samples."""
+    audio_file, audio_bytes = FIXTURE_CATALOG[1]
+    return {
+        "schemaVersion": 2,
+        "generatedAt": generated_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "commitSHA": commit,
+        "pullRequestNumber": pr_number,
+        "iterationsPerLevel": iterations,
+        "audioFile": f"{audio_file}.caf",
+        "audioBytes": audio_bytes,
+        "sttMode": "batch",
+        "sttSelectionPolicy": "preference",
+        "sttChain": [{"provider": "ElevenLabs", "model": "scribe_v2"}],
+        "rewriteRouting": "openrouter(inception/mercury)",
+        "levels": [
+            level_entry(rng, "provider", level, iterations, 1.0 + audio_bytes / 1_000_000, with_samples=False)
+            for level in ("raw", "clean", "polish")
+        ],
+    }
+
+
+def synthetic_history(
+    count: int,
+    seed: int = 7,
+    pr_share: float = 0.6,
+    v2_share: float = 0.1,
+    fixture_count: int = 2,
+    iterations: int = 5,
+) -> list[dict[str, Any]]:
+    """count runs, oldest first: the first v2_share are legacy v2 provider runs, the rest
+    alternate provider/codepath v3 lanes; pr_share of commits are PR runs."""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    fixtures = FIXTURE_CATALOG[: max(1, min(fixture_count, len(FIXTURE_CATALOG)))]
+    legacy = int(count * v2_share)
+    runs = []
+    for i in range(count):
+        commit = f"{rng.getrandbits(160):040x}"
+        pr_number = rng.randint(1, 400) if rng.random() < pr_share else None
+        generated_at = start + timedelta(minutes=30 * i)
+        if i < legacy:
+            runs.append(make_v2_run(rng, commit, generated_at, pr_number, iterations))
+        else:
+            lane = "provider" if i % 2 == 0 else "codepath"
+            runs.append(make_run(rng, lane, commit, generated_at, pr_number, iterations, fixtures))
+    return runs
+
+
+def write_history(runs: list[dict[str, Any]], history_dir: Path) -> int:
+    written = 0
+    for index, run in enumerate(runs):
+        data = json.dumps(run, separators=(",", ":"))
+        (history_dir / f"{index:06d}-{run['commitSHA'][:8]}.json").write_text(data)
+        written += len(data)
+    return written
+
+
+def render_sections(fpr, history, provider, codepath, base, history_max: int = 24) -> int:
+    lines: list[str] = []
+    fpr.collect_critical_metrics(provider, codepath, base, history, history_max)
+    fpr.render_summary_section(lines, provider, history, base, history_max, provider.run["commitSHA"], base.run["commitSHA"], "exact")
+    fpr.render_actionable_signals(lines, provider, history, history_max, base, codepath, [])
+    fpr.render_lane_detail(lines, provider, history, history_max, 16, False, base_snapshot=base)
+    fpr.render_lane_detail(lines, codepath, history, history_max, 16, False)
+    return len(lines)
+
+
+def measure(fn: Callable[[], Any], repeat: int = 1, memory: bool = True) -> tuple[Any, float, Optional[int]]:
+    """(result, best wall seconds, tracemalloc peak bytes) — memory from a separate traced pass."""
+    result = None
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result, best, peak
+
+
+def fmt_seconds(seconds: float) -> str:
+    return f"{seconds * 1000:.2f}ms" if seconds < 1 else f"{seconds:.2f}s"
+
+
+def fmt_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return "—"
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.2f}GiB"
+
+
+def fmt_ratio(current: Optional[float], baseline: Optional[float]) -> str:
+    if current is None or not baseline:
+        return "—"
+    return f"{current / baseline:.2f}×"
+
+
+def bench_size(fpr, args, size: int, heads: dict[str, Any], workdir: Path) -> list[dict[str, Any]]:
+    history_dir = workdir / f"history-{size}"
+    history_dir.mkdir()
+    runs = synthetic_history(
+        size,
+        pr_share=args.pr_share,
+        v2_share=args.v2_share,
+        fixture_count=args.fixtures,
+        iterations=args.iterations,
+    )
+    history_bytes = write_history(runs, history_dir)
+    del runs
+    print(f"[bench] {size} runs, {history_bytes / 1_048_576:.1f}MiB of history JSON", file=sys.stderr)
+
+    provider, codepath, base = heads["provider"], heads["codepath"], heads["base"]
+    memory = not args.no_memory
+    results: list[dict[str, Any]] = []
+
+    def record(phase: str, fn: Callable[[], Any], repeat: int = 1) -> Any:
+        value, seconds, peak = measure(fn, repeat, memory)
+        results.append({"runs": size, "phase": phase, "seconds": seconds, "peak_bytes": peak})
+        return value
+
+    loaded = record("load_history_runs", lambda: fpr.load_history_runs(history_dir))
+    ordered = record("dedupe_and_sort_runs", lambda: fpr.dedupe_and_sort_runs(loaded + [provider.run, codepath.run]))
+    del loaded
+    snapshots = record(
+        "build_snapshot",
+        lambda: [snapshot for run in ordered if (snapshot := fpr.build_snapshot(run)) is not None],
+    )
+    del ordered
+
+    cache_path = workdir / f"cache-{size}.sqlite"
+
+    def cold_cache() -> list[Any]:
+        cache_path.unlink(missing_ok=True)
+        return fpr.load_history_snapshots(history_dir, cache_path, args.jobs)
+
+    with contextlib.redirect_stderr(io.StringIO()):
+        record("history cache (cold)", cold_cache)
+        record("history cache (warm)", lambda: fpr.load_history_snapshots(history_dir, cache_path, args.jobs))
+
+    history = record("index build", lambda: fpr.HistoryIndex(fpr.dedupe_and_sort_snapshots(snapshots)))
+    del snapshots
+    record("critical metrics", lambda: fpr.collect_critical_metrics(provider, codepath, base, history, 24), args.repeat)
+    record("report sections", lambda: render_sections(fpr, history, provider, codepath, base), args.repeat)
+    del history
+
+    head_paths = {}
+    for name in ("provider", "codepath", "base"):
+        head_paths[name] = workdir / f"{name}.json"
+        head_paths[name].write_text(json.dumps(heads[name].run))
+    argv = [
+        "format-perf-report.py",
+        "--head", str(head_paths["provider"]),
+        "--codepath-head", str(head_paths["codepath"]),
+        "--base", str(head_paths["base"]),
+        "--history-dir", str(history_dir),
+        "--history-cache", str(cache_path),
+        "--out", str(workdir / "report.md"),
+    ]
+
+    def full_report() -> None:
+        saved_argv = sys.argv
+        sys.argv = argv
+        try:
+            with contextlib.redirect_stderr(io.StringIO()):
+                fpr.main()
+        finally:
+            sys.argv = saved_argv
+
+    record("full report", full_report)
+    shutil.rmtree(history_dir)
+    cache_path.unlink(missing_ok=True)
+    return results
+
+
+def null_check(fpr, args) -> int:
+    """Same-distribution head/base pairs; returns 1 when the verdict FP rate exceeds alpha."""
+    rng = random.Random(args.seed)
+    now = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    fixtures = FIXTURE_CATALOG[: max(1, min(args.fixtures, len(FIXTURE_CATALOG)))]
+    # No effect floor: the check is about the tests, not the floor hiding small p95 shifts.
+    policy = fpr.VerdictPolicy(resamples=args.null_resamples, min_effect_ms=0.0)
+    empty = fpr.HistoryIndex([])
+    verdicts: dict[str, int] = {}
+    for trial in range(args.null_check):
+        head = fpr.build_snapshot(make_run(rng, "provider", f"{trial:040x}", now, 999, args.iterations, fixtures))
+        base = fpr.build_snapshot(make_run(rng, "provider", f"{trial:039x}b", now - timedelta(hours=1), None, args.iterations, fixtures))
+        verdict = fpr.collect_critical_metrics(head, None, base, empty, 24, policy)["verdict"]
+        verdicts[verdict] = verdicts.get(verdict, 0) + 1
+    false_positives = args.null_check - verdicts.get("neutral", 0)
+    rate = false_positives / max(1, args.null_check)
+    print(
+        f"null check: {false_positives}/{args.null_check} non-neutral verdicts ({rate:.1%}, alpha {policy.alpha:.0%}; "
+        f"{len(fixtures)} fixture(s) × 3 levels, {args.iterations} iterations) {dict(sorted(verdicts.items()))}"
+    )
+    return 0 if rate <= policy.alpha else 1
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark format-perf-report.py on synthetic history")
+    ap.add_argument("--sizes", default="100,1000,10000,50000", help="Comma-separated history run counts")
+    ap.add_argument("--repeat", type=int, default=5, help="Repeats for the per-report stages (best is reported)")
+    ap.add_argument("--pr-share", type=float, default=0.6, help="Share of history runs that are PR runs")
+    ap.add_argument("--v2-share", type=float, default=0.1, help="Share of (oldest) history runs in legacy v2 schema")
+    ap.add_argument("--fixtures", type=int, default=2, help=f"Fixtures per v3 run (1-{len(FIXTURE_CATALOG)})")
+    ap.add_argument("--iterations", type=int, default=5, help="Measured iterations per level and fixture")
+    ap.add_argument("--jobs", type=int, default=None, help="--history-jobs for the history cache stages")
+    ap.add_argument("--no-memory", action="store_true", help="Skip the traced pass that records peak memory")
+    ap.add_argument("--json-out", help="Write results JSON here")
+    ap.add_argument("--compare", help="Results JSON from an earlier run to compare against")
+    ap.add_argument("--null-check", type=int, default=0, metavar="N", help="Check the verdict false-positive rate over N same-distribution pairs instead")
+    ap.add_argument("--null-resamples", type=int, default=500, help="Permutation resamples per test during --null-check")
+    ap.add_argument("--seed", type=int, default=1, help="Random seed for --null-check")
+    args = ap.parse_args()
+
+    # The full-report stage must not reach the network or reuse cached syntheses.
+    os.environ.pop("OPENROUTER_API_KEY", None)
+
+    fpr = load_formatter()
+    if args.null_check:
+        sys.exit(null_check(fpr, args))
+    rng = random.Random(1)
+    now = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    fixtures = FIXTURE_CATALOG[: max(1, min(args.fixtures, len(FIXTURE_CATALOG)))]
+    heads = {
+        "provider": fpr.build_snapshot(make_run(rng, "provider", "head" * 10, now, 999, args.iterations, fixtures)),
+        "codepath": fpr.build_snapshot(make_run(rng, "codepath", "head" * 10, now, 999, args.iterations, fixtures)),
+        "base": fpr.build_snapshot(make_run(rng, "provider", "base" * 10, now - timedelta(hours=1), None, args.iterations, fixtures)),
+    }
+
+    baseline: dict[tuple[int, str], dict[str, Any]] = {}
+    if args.compare:
+        saved = json.loads(Path(args.compare).read_text())
+        baseline = {(entry["runs"], entry["phase"]): entry for entry in saved.get("results", [])}
+
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="bench-perf-report-") as tmp:
+        for size in [int(part) for part in args.sizes.split(",") if part.strip()]:
+            results.extend(bench_size(fpr, args, size, heads, Path(tmp)))
+
+    header = "| runs | stage | wall | peak mem |"
+    divider = "| ---: | --- | ---: | ---: |"
+    if baseline:
+        header += " wall vs baseline | mem vs baseline |"
+        divider += " ---: | ---: |"
+    print(header)
+    print(divider)
+    for entry in results:
+        row = f"| {entry['runs']} | {entry['phase']} | {fmt_seconds(entry['seconds'])} | {fmt_bytes(entry['peak_bytes'])} |"
+        if baseline:
+            before = baseline.get((entry["runs"], entry["phase"]), {})
+            row += (
+                f" {fmt_ratio(entry['seconds'], before.get('seconds'))} |"
+                f" {fmt_ratio(entry['peak_bytes'], before.get('peak_bytes'))} |"
+            )
+        print(row)
+
+    if args.json_out:
+        payload = {
+            "version": BENCH_VERSION,
+            "generatedAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "python": sys.version.split()[0],
+            "config": {
+                key: getattr(args, key) for key in ("repeat", "pr_share", "v2_share", "fixtures", "iterations", "jobs")
+            },
+            "results": results,
+        }
+        Path(args.json_out).write_text(json.dumps(payload, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,18 +11,46 @@ Supports:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import math
 import os
+import pickle
+import random
 import re
+import sqlite3
+import subprocess
 import sys
+import time
 import urllib.error
 import urllib.request
-from dataclasses import dataclass
+from array import array
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
+from statistics import NormalDist, stdev
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:  # optional fast path; stdlib json is always the fallback
+    orjson = None
+
+# Phase timers and --profile are shared with scripts/stt-eval.py and scripts/rewrite-bakeoff.py.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import eval_cassette  # noqa: E402
+import eval_profile  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
 LEVELS = ["raw", "clean", "polish"]
+STAGE_METRICS = ("generation", "stt", "rewrite", "encode", "paste", "total")
+# Per-fixture history is tracked for these metrics, as "<metric>@<fixtureID>" series.
+FIXTURE_METRICS = ("generation",)
 
 
 @dataclass(frozen=True)
@@ -31,6 +59,11 @@ class Dist:
     p95: float
     min: float
     max: float
+    # Present when the run recorded it; legacy runs only carry p50/p95/min/max.
+    p99: Optional[float] = None
+    # Per-iteration samples (ms). When every input has them, aggregates merge
+    # samples instead of averaging percentiles.
+    samples: tuple[float, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -43,6 +76,7 @@ class LevelStats:
     rewrite: Dist
     encode: Dist
     paste: Dist
+    total: Dist  # encode + stt + rewrite + paste (totalStageMs)
 
 
 @dataclass(frozen=True)
@@ -68,8 +102,23 @@ class LaneSnapshot:
     rewrite_routing: str
 
 
+def parse_json_bytes(data: bytes | str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # stdlib also accepts NaN/Infinity literals; let it decide
+    return json.loads(data)
+
+
+def dump_compact_json(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"))
+
+
 def load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return parse_json_bytes(path.read_bytes())
 
 
 def parse_generated_at(value: Optional[str]) -> Optional[datetime]:
@@ -158,39 +207,204 @@ def load_changed_files(path: Optional[str]) -> list[str]:
     return [line.strip() for line in lines if line.strip()]
 
 
-def stage_related_files(changed_files: list[str], stage: str, limit: int = 4) -> list[str]:
-    stage_patterns: dict[str, tuple[str, ...]] = {
+# ── Source index: Swift files → pipeline stages ─────────────────────────────
+# Types through which each stage enters the pipeline. Files declaring them sit at
+# distance 0; files referencing a type at distance d sit at d + 1. PipelineTiming
+# is where every stage is timed (encode is injected as closures, not a protocol).
+STAGE_ENTRY_TYPES: dict[str, tuple[str, ...]] = {
+    "stt": ("STTProvider", "StreamingSTTProvider", "StreamingSTTSession", "PipelineTiming"),
+    "rewrite": ("RewriteProvider", "PipelineTiming"),
+    "encode": ("AudioEncoder", "AudioConverter", "PipelineTiming"),
+    "paste": ("TextPaster", "PipelineTiming"),
+}
+SOURCE_INDEX_VERSION = 1
+SOURCE_INDEX_MAX_DISTANCE = 3  # beyond this, app glue would map to every stage
+SOURCE_INDEX_CACHE_DIR = Path(
+    os.environ.get("VOX_PERF_SOURCE_INDEX_CACHE_DIR") or Path.home() / ".cache" / "vox" / "perf-source-index"
+)
+SWIFT_NOISE = re.compile(r'//[^\n]*|/\*.*?\*/|"""(?:.|\n)*?"""|"(?:\\.|[^"\\\n])*"', re.S)
+SWIFT_DECLARATION = re.compile(r"\b(?:protocol|class|struct|actor|enum|typealias)\s+([A-Z]\w*)")
+SWIFT_TOP_LEVEL = re.compile(r"\b(?:protocol|class|struct|actor|enum|extension)\s+([A-Z]\w*)")
+SWIFT_TYPE_NAME = re.compile(r"\b[A-Z]\w*\b")
+
+
+@dataclass(frozen=True)
+class SourceIndex:
+    tree: str
+    distances: dict[str, dict[str, int]]  # every indexed path -> stage -> distance to the stage entry types
+
+    def related(self, changed_files: list[str], stage: str, limit: int) -> list[str]:
+        """Changed files linked to `stage`, closest to its entry points first; ties go to
+        files tied to fewer stages (a provider client before the session that wires it)."""
+        ranked = sorted(
+            (distance, len(self.distances[path]), order, path)
+            for order, path in enumerate(changed_files)
+            if (distance := self.distances.get(path, {}).get(stage)) is not None
+        )
+        return [path for *_, path in ranked[:limit]]
+
+
+def swift_units(code: str) -> list[tuple[set[str], set[str]]]:
+    """(names, referenced type names) per top-level declaration; loose top-level code is one unnamed unit.
+
+    Nested types belong to their enclosing declaration; an extension's body counts
+    toward the type it extends.
+    """
+    units: list[tuple[set[str], set[str]]] = []
+    loose: list[str] = []
+    cursor = 0
+    for match in SWIFT_TOP_LEVEL.finditer(code):
+        if match.start() < cursor:
+            continue
+        segment = code[cursor:match.start()]
+        if segment.count("{") != segment.count("}"):
+            continue  # declared inside a top-level function or closure
+        loose.append(segment)
+        end = code.find("{", match.end())
+        if end < 0:
+            break
+        level = 0
+        for end in range(end, len(code)):
+            level += {"{": 1, "}": -1}.get(code[end], 0)
+            if level == 0:
+                break
+        body = code[match.start():end + 1]
+        # Nested types are namespaced (e.g. VoxSession.State), so only the outer name links files.
+        nested = set(SWIFT_DECLARATION.findall(body))
+        units.append(({match.group(1)}, set(SWIFT_TYPE_NAME.findall(body)) - nested - {match.group(1)}))
+        cursor = end + 1
+    loose.append(code[cursor:])
+    units.append((set(), set(SWIFT_TYPE_NAME.findall(" ".join(loose)))))
+    return units
+
+
+def scan_swift_sources(root: Path) -> dict[str, dict[str, int]]:
+    """Stage distances for every Swift file under root/Sources, over the type reference graph."""
+    units: list[tuple[str, set[str], set[str]]] = []
+    for path in sorted((root / "Sources").rglob("*.swift")):
+        key = path.relative_to(root).as_posix()
+        try:
+            code = SWIFT_NOISE.sub(" ", path.read_text(encoding="utf-8", errors="replace"))
+        except OSError:
+            continue
+        units.extend((key, names, refs) for names, refs in swift_units(code))
+    known_types = set().union(*(names for _, names, _ in units))
+
+    distances: dict[str, dict[str, int]] = {key: {} for key, _, _ in units}
+    for stage, entry_types in STAGE_ENTRY_TYPES.items():
+        type_distance = {name: 0 for name in entry_types if name in known_types}
+        unit_distance: dict[int, int] = {
+            position: 0 for position, (_, names, _) in enumerate(units) if names & set(type_distance)
+        }
+        frontier = set(type_distance)
+        for depth in range(1, SOURCE_INDEX_MAX_DISTANCE + 1):
+            reached: set[str] = set()
+            for position, (_, names, refs) in enumerate(units):
+                if position in unit_distance or not refs & frontier:
+                    continue
+                unit_distance[position] = depth
+                reached.update(name for name in names if name not in type_distance)
+            for name in reached:
+                type_distance[name] = depth
+            frontier = reached
+        for position, distance in unit_distance.items():
+            stages = distances[units[position][0]]
+            stages[stage] = min(distance, stages.get(stage, distance))
+    return distances
+
+
+def git_output(root: Path, *args: str) -> Optional[str]:
+    try:
+        proc = subprocess.run(["git", "-C", str(root), *args], check=True, capture_output=True, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip()
+
+
+def sources_tree_hash(root: Path) -> str:
+    """Git tree hash of Sources/ for a clean checkout, else a digest of the Swift files."""
+    if git_output(root, "status", "--porcelain", "--", "Sources") == "":
+        tree = git_output(root, "rev-parse", "HEAD:Sources")
+        if tree:
+            return tree
+    digest = hashlib.sha256()
+    for path in sorted((root / "Sources").rglob("*.swift")):
+        digest.update(path.relative_to(root).as_posix().encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+    return f"sha256-{digest.hexdigest()}"
+
+
+def load_source_index(root: Path, cache_dir: Optional[Path] = SOURCE_INDEX_CACHE_DIR) -> Optional[SourceIndex]:
+    """Stage index for root/Sources, reused from cache_dir while the tree hash matches."""
+    if not (root / "Sources").is_dir():
+        return None
+    tree = sources_tree_hash(root)
+    cache_path = cache_dir / f"{tree}.json" if cache_dir else None
+    if cache_path:
+        try:
+            cached = load_json(cache_path)
+            if cached.get("version") == SOURCE_INDEX_VERSION and cached.get("tree") == tree:
+                return SourceIndex(tree, cached["files"])
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+    index = SourceIndex(tree, scan_swift_sources(root))
+    if cache_path:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps({"version": SOURCE_INDEX_VERSION, "tree": tree, "files": index.distances}))
+        except OSError:
+            pass
+    return index
+
+
+# Path fallback for files the source index cannot place: no checkout, outside Sources/,
+# or helpers the pipeline calls into that never name a stage entry type themselves
+# (e.g. RewriteQualityGate, AudioRecorder, HUDController), which the reference graph
+# does not reach.
+STAGE_PATH_PATTERNS: dict[str, re.Pattern[str]] = {
+    stage: re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+    for stage, patterns in {
         "stt": (
             r"sources/voxproviders/.*(stt|deepgram|elevenlabs|speechtranscriber|applespeech|providerassembly)",
             r"sources/voxcore/.*(stt|fallbackstt|retryingstt|timeoutstt|hedgedstt|healthawarestt|concurrencylimitedstt)",
-            r"sources/voxappkit/dictationpipeline\.swift",
+            r"sources/voxpipeline/dictationpipeline\.swift",
         ),
         "rewrite": (
             r"sources/voxproviders/.*(rewrite|openrouter|gemini|foundationmodels|modelrouted)",
             r"sources/voxcore/.*(rewrite|modelroutedrewrite)",
-            r"sources/voxappkit/dictationpipeline\.swift",
+            r"sources/voxpipeline/dictationpipeline\.swift",
         ),
         "encode": (
             r"sources/voxproviders/.*(audioconverter|opus|encode)",
             r"sources/voxmac/.*(audioencoder|audiorecorder|capturedaudioinspector)",
-            r"sources/voxappkit/dictationpipeline\.swift",
+            r"sources/voxpipeline/dictationpipeline\.swift",
         ),
         "paste": (
             r"sources/voxmac/.*(clipboardpaster|hud)",
-            r"sources/voxappkit/.*(dictationpipeline|voxsession)",
+            r"sources/(voxpipeline/dictationpipeline|voxsession/voxsession)\.swift",
         ),
-    }
-    patterns = stage_patterns.get(stage, ())
-    if not patterns:
-        return []
+    }.items()
+}
+
 
+def stage_related_files(
+    changed_files: list[str],
+    stage: str,
+    limit: int = 4,
+    source_index: Optional[SourceIndex] = None,
+) -> list[str]:
     hits: list[str] = []
+    if source_index is not None:
+        hits = source_index.related(changed_files, stage, limit)
+        changed_files = [path for path in changed_files if not source_index.distances.get(path)]
+    pattern = STAGE_PATH_PATTERNS.get(stage)
+    if pattern is None:
+        return hits
     for path in changed_files:
-        lower = path.lower()
-        if any(re.search(pattern, lower) for pattern in patterns):
-            hits.append(path)
         if len(hits) >= limit:
             break
+        if pattern.search(path.lower()):
+            hits.append(path)
     return hits
 
 
@@ -198,17 +412,31 @@ def variability(dist: Dist) -> float:
     return max(0.0, dist.p95 - dist.p50)
 
 
-def dominant_stage(generation: Dist, stt: Dist, rewrite: Dist, encode: Dist, paste: Dist) -> str:
-    candidates = [("STT", stt.p95), ("Rewrite", rewrite.p95), ("Encode", encode.p95), ("Paste", paste.p95)]
+STAGE_LABELS = {"stt": "STT", "rewrite": "Rewrite", "encode": "Encode", "paste": "Paste", "other": "Other"}
+
+
+def dominant_stage(row: LevelStats) -> str:
+    tail = tail_attribution(row)
+    if tail:
+        stage = tail.driver
+        return f"{STAGE_LABELS[stage]} ({fmt_ms(tail.stages[stage])}, {tail.share(stage):.0f}% of p90+ tail)"
+    candidates = [("STT", row.stt.p95), ("Rewrite", row.rewrite.p95), ("Encode", row.encode.p95), ("Paste", row.paste.p95)]
     name, value = max(candidates, key=lambda item: item[1])
-    share = (value / generation.p95 * 100) if generation.p95 > 0 else 0.0
+    share = (value / row.generation.p95 * 100) if row.generation.p95 > 0 else 0.0
     return f"{name} ({fmt_ms(value)}, {share:.0f}%)"
 
 
-def change_status(latest: float, previous: float, noise: float = 0.0) -> str:
+def change_status(latest: float, previous: float, noise: float = 0.0, threshold: Optional[float] = None) -> str:
     if previous <= 0:
         return "neutral"
     delta = latest - previous
+    if threshold is not None:
+        # Calibrated run-to-run noise for this lane/level/stage replaces the fixed 200ms/10% rule.
+        if delta > threshold:
+            return "regressed"
+        if delta < -threshold:
+            return "improved"
+        return "neutral"
     pct = abs(delta) / previous
     # Suppress verdict when delta is within the within-run measurement spread.
     # A between-run change smaller than within-run noise is indistinguishable from variance.
@@ -221,9 +449,258 @@ def change_status(latest: float, previous: float, noise: float = 0.0) -> str:
     return "neutral"
 
 
-def confidence_label(samples: int, spread: float, p95: float) -> str:
+NOISE_MODEL_VERSION = 1
+NOISE_CALIBRATION_WINDOW = 60  # newest master runs per series used for calibration
+NOISE_MIN_RUNS = 8  # fewer master runs than this: keep the fixed heuristic
+NOISE_THRESHOLD_SIGMAS = 3.0
+
+
+@dataclass(frozen=True)
+class NoiseEstimate:
+    sigma_ms: float  # run-to-run p95 noise of a single run (robust, from MAD of deltas)
+    runs: int
+
+
+@dataclass(frozen=True)
+class NoiseModel:
+    estimates: dict[str, NoiseEstimate]  # keyed "lane/level/metric" (metric may be "<metric>@<fixtureID>")
+    source: str
+
+    def sigma(self, lane: str, level: str, metric: str) -> Optional[float]:
+        estimate = self.estimates.get(f"{lane}/{level}/{metric}")
+        return estimate.sigma_ms if estimate else None
+
+
+def calibrate_noise(
+    history: HistoryIndex,
+    window: int = NOISE_CALIBRATION_WINDOW,
+    lanes: tuple[str, ...] = ("provider", "codepath"),
+) -> NoiseModel:
+    """Per-(lane, level, stage) run-to-run noise from master p95 series."""
+    estimates: dict[str, NoiseEstimate] = {}
+    for lane in lanes:
+        metrics = list(STAGE_METRICS) + [
+            fixture_metric(metric, fixture_id) for fixture_id in history.fixture_ids(lane) for metric in FIXTURE_METRICS
+        ]
+        for level in LEVELS:
+            for metric in metrics:
+                series = history.series_entry(lane, "master", level, metric)
+                if series is None:
+                    continue
+                values = list(series.p95[-window:])
+                if len(values) < NOISE_MIN_RUNS:
+                    continue
+                estimates[f"{lane}/{level}/{metric}"] = NoiseEstimate(robust_sigma(values), len(values))
+    return NoiseModel(estimates, source="history")
+
+
+def noise_model_to_json(model: NoiseModel) -> dict[str, Any]:
+    return {
+        "version": NOISE_MODEL_VERSION,
+        "generatedAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "method": "1.4826 * MAD(run-to-run p95 deltas) / sqrt(2) over newest master runs",
+        "thresholdSigmas": NOISE_THRESHOLD_SIGMAS,
+        "estimates": {
+            key: {"sigma_ms": round(estimate.sigma_ms, 3), "runs": estimate.runs}
+            for key, estimate in sorted(model.estimates.items())
+        },
+    }
+
+
+def load_noise_model(path: Path) -> NoiseModel:
+    data = load_json(path)
+    if not isinstance(data, dict) or data.get("version") != NOISE_MODEL_VERSION:
+        raise ValueError(f"{path}: expected noise model version {NOISE_MODEL_VERSION}")
+    estimates = {
+        str(key): NoiseEstimate(float(entry["sigma_ms"]), int(entry.get("runs") or 0))
+        for key, entry in (data.get("estimates") or {}).items()
+    }
+    return NoiseModel(estimates, source=str(path))
+
+
+@dataclass(frozen=True)
+class VerdictPolicy:
+    """How verdicts are decided: sample tests when samples exist, calibrated noise otherwise."""
+
+    alpha: float = 0.05  # family-wise false-positive rate of the vs-base verdict (Holm-adjusted tests)
+    resamples: int = 2000
+    min_effect_ms: float = 50.0  # uncalibrated lanes: significant but smaller p95 shifts stay neutral
+    noise: Optional[NoiseModel] = None
+
+    def threshold(self, lane: str, level: str, metric: str = "generation", paired: bool = True) -> Optional[float]:
+        """Calibrated |delta| beyond which a change is real.
+
+        paired: one run vs one run (noise adds in quadrature); otherwise one run
+        vs a multi-run median, whose own noise is small.
+        """
+        sigma = self.noise.sigma(lane, level, metric) if self.noise else None
+        if sigma is None:
+            return None
+        return NOISE_THRESHOLD_SIGMAS * sigma * (math.sqrt(2) if paired else 1.0)
+
+
+DEFAULT_VERDICT_POLICY = VerdictPolicy()
+# Fewer samples per side than this cannot support a p95 test; use the heuristic.
+MIN_TEST_SAMPLES = 5
+
+
+@dataclass(frozen=True)
+class Comparison:
+    status: str
+    delta: float  # head p95 - base p95 (ms)
+    method: str  # "permutation", "calibrated" or "heuristic"
+    p_value: Optional[float] = None
+    ci_low: Optional[float] = None
+    ci_high: Optional[float] = None
+
+
+def p95_of(values: list[float]) -> float:
+    return percentile(sorted(values), 0.95)
+
+
+@lru_cache(maxsize=256)
+def p95_difference_test(
+    head: tuple[float, ...],
+    base: tuple[float, ...],
+    alpha: float,
+    resamples: int,
+) -> tuple[float, float, float]:
+    """Permutation p-value and bootstrap CI for p95(head) - p95(base).
+
+    Seeded so the same inputs always produce the same verdict in a report.
+    """
+    rng = random.Random(0x5EED)
+    observed = abs(p95_of(list(head)) - p95_of(list(base)))
+    pooled = list(head) + list(base)
+    split = len(head)
+    extreme = 0
+    for _ in range(resamples):
+        rng.shuffle(pooled)
+        if abs(p95_of(pooled[:split]) - p95_of(pooled[split:])) >= observed - 1e-9:
+            extreme += 1
+    p_value = (extreme + 1) / (resamples + 1)
+
+    deltas = sorted(
+        p95_of(rng.choices(head, k=len(head))) - p95_of(rng.choices(base, k=len(base)))
+        for _ in range(resamples)
+    )
+    return p_value, percentile(deltas, alpha / 2), percentile(deltas, 1 - alpha / 2)
+
+
+@lru_cache(maxsize=256)
+def p95_bootstrap_sigma(samples: tuple[float, ...], resamples: int) -> float:
+    """Bootstrap standard error of one run's p95, seeded like p95_difference_test."""
+    if len(samples) < 2:
+        return 0.0
+    rng = random.Random(0x5EED)
+    return stdev(p95_of(rng.choices(samples, k=len(samples))) for _ in range(resamples))
+
+
+def compare_dists(
+    head: Dist,
+    base: Dist,
+    policy: VerdictPolicy = DEFAULT_VERDICT_POLICY,
+    key: Optional[tuple[str, str, str]] = None,
+) -> Comparison:
+    """Head-vs-base p95 verdict for (lane, level, metric) key.
+
+    Permutation test on samples when both runs have them; otherwise the
+    calibrated noise threshold, or the fixed heuristic without calibration.
+    """
+    delta = head.p95 - base.p95
+    threshold = policy.threshold(*key, paired=True) if key else None
+    if len(head.samples) >= MIN_TEST_SAMPLES and len(base.samples) >= MIN_TEST_SAMPLES:
+        p_value, ci_low, ci_high = p95_difference_test(head.samples, base.samples, policy.alpha, policy.resamples)
+        # Within-run samples miss between-run drift, so the calibrated noise bounds the effect;
+        # the flat floor only stands in for lanes that were never calibrated.
+        min_effect = threshold if threshold is not None else policy.min_effect_ms
+        status = "neutral"
+        if p_value < policy.alpha and abs(delta) >= min_effect:
+            status = "regressed" if delta > 0 else "improved"
+        return Comparison(status, delta, "permutation", p_value, ci_low, ci_high)
+    if threshold is not None:
+        return Comparison(change_status(head.p95, base.p95, threshold=threshold), delta, "calibrated")
+    noise = max(variability(head), variability(base))
+    return Comparison(change_status(head.p95, base.p95, noise=noise), delta, "heuristic")
+
+
+def holm_adjust(p_values: list[float]) -> list[float]:
+    """Holm step-down adjusted p-values (family-wise error rate), in input order."""
+    order = sorted(range(len(p_values)), key=lambda i: p_values[i])
+    adjusted = [1.0] * len(p_values)
+    running = 0.0
+    for rank, index in enumerate(order):
+        running = max(running, min(1.0, (len(p_values) - rank) * p_values[index]))
+        adjusted[index] = running
+    return adjusted
+
+
+def collect_base_tests(
+    snapshot: LaneSnapshot,
+    base_snapshot: Optional[LaneSnapshot],
+    policy: VerdictPolicy = DEFAULT_VERDICT_POLICY,
+) -> dict[tuple[Optional[str], str], Comparison]:
+    """Generation-p95 vs-base comparisons keyed by (fixture ID, or None for the aggregate, level).
+
+    Any of these tests can move the overall verdict, so their permutation p-values
+    are Holm-adjusted as one family (aggregate levels plus fixture × level) and a
+    status only stands when its adjusted p-value is below alpha. That keeps the
+    verdict's false-positive rate at alpha however many fixtures a run has.
+    """
+    if base_snapshot is None or base_snapshot.lane != snapshot.lane:
+        return {}
+    pairs: list[tuple[Optional[str], str, LevelStats, LevelStats, str]] = [
+        (None, level, snapshot.levels[level], base_snapshot.levels[level], "generation")
+        for level in LEVELS
+        if level in snapshot.levels and level in base_snapshot.levels
+    ]
+    if len(snapshot.fixtures) > 1 and len(base_snapshot.fixtures) > 1:
+        base_fixtures = {fixture.fixture_id: fixture for fixture in base_snapshot.fixtures}
+        for fixture in snapshot.fixtures:
+            base_fixture = base_fixtures.get(fixture.fixture_id)
+            if base_fixture is None:
+                continue
+            pairs.extend(
+                (fixture.fixture_id, level, fixture.levels[level], base_fixture.levels[level],
+                 fixture_metric("generation", fixture.fixture_id))
+                for level in LEVELS
+                if level in fixture.levels and level in base_fixture.levels
+            )
+    tests = {
+        (fixture_id, level): compare_dists(row.generation, base_row.generation, policy, (snapshot.lane, level, metric))
+        for fixture_id, level, row, base_row, metric in pairs
+    }
+    tested = [key for key, comparison in tests.items() if comparison.method == "permutation"]
+    adjusted = holm_adjust([tests[key].p_value for key in tested])
+    for key, p_value in zip(tested, adjusted):
+        comparison = tests[key]
+        # Effect-size and raw-significance gates already passed when the status is not neutral.
+        status = comparison.status if p_value < policy.alpha else "neutral"
+        tests[key] = replace(comparison, status=status, p_value=p_value)
+    return tests
+
+
+def fmt_comparison_evidence(comparison: Comparison, alpha: float) -> str:
+    if comparison.method != "permutation":
+        return ""
+    confidence = int(round((1 - alpha) * 100))
+    return (
+        f"p={comparison.p_value:.3f}, {confidence}% CI "
+        f"{fmt_signed_ms(comparison.ci_low)}…{fmt_signed_ms(comparison.ci_high)}"
+    )
+
+
+def confidence_label(samples: int, spread: float, p95: float, sigma: Optional[float] = None) -> str:
     if p95 <= 0:
         return "low"
+    if sigma is not None:
+        # Calibrated run-to-run noise says how far a single run's p95 can be trusted.
+        noise_ratio = sigma / p95
+        if samples >= 10 and noise_ratio <= 0.05:
+            return "high"
+        if samples >= 6 and noise_ratio <= 0.15:
+            return "medium"
+        return "low"
     spread_ratio = spread / p95
     if samples >= 10 and spread_ratio <= 0.20:
         return "high"
@@ -264,8 +741,148 @@ def snapshot_identity(snapshot: LaneSnapshot) -> tuple[str, str, str]:
     )
 
 
+def stage_dist(row: LevelStats, metric: str) -> Optional[Dist]:
+    if metric == "generation":
+        return row.generation
+    if metric == "stt":
+        return row.stt
+    if metric == "rewrite":
+        return row.rewrite
+    if metric == "encode":
+        return row.encode
+    if metric == "paste":
+        return row.paste
+    if metric == "total":
+        return row.total
+    return None
+
+
+def fixture_metric(metric: str, fixture_id: str) -> str:
+    """Series/noise key for one fixture's metric; `metric` alone is the run aggregate."""
+    return f"{metric}@{fixture_id}"
+
+
+@dataclass
+class HistorySeries:
+    positions: list[int]
+    p50: array
+    p95: array
+
+
+class HistoryIndex:
+    """Time-ordered history pre-split by (lane, source, level, metric).
+
+    Built once per report; trend queries become tail slices instead of full
+    scans over every snapshot. Source is None (all runs), "master" or "pr".
+    """
+
+    def __init__(self, snapshots: list[LaneSnapshot]) -> None:
+        self.snapshots: list[LaneSnapshot] = []
+        self.source_labels: list[str] = []
+        self.commits: list[str] = []
+        self._by_lane: dict[str, list[LaneSnapshot]] = {}
+        self._source_counts: Counter[tuple[str, str]] = Counter()
+        self._positions_by_identity: dict[tuple[str, str, str], list[int]] = {}
+        self._positions_by_commit: dict[tuple[str, str], list[int]] = {}
+        self._series: dict[tuple[str, Optional[str], str, str], HistorySeries] = {}
+        self._fixture_ids: dict[str, dict[str, None]] = {}
+        for snapshot in snapshots:
+            self.append(snapshot)
+
+    def append(self, snapshot: LaneSnapshot) -> None:
+        """Add a snapshot newer than (or tied with) every indexed one; callers keep the order."""
+        position = len(self.snapshots)
+        lane = snapshot.lane
+        label = run_source_label(snapshot)
+        source = "master" if label == "master" else "pr"
+        self.snapshots.append(snapshot)
+        self.source_labels.append(label)
+        self.commits.append(str(snapshot.run.get("commitSHA") or ""))
+        self._by_lane.setdefault(lane, []).append(snapshot)
+        self._source_counts[(lane, source)] += 1
+        self._positions_by_identity.setdefault(snapshot_identity(snapshot), []).append(position)
+        if self.commits[-1]:
+            self._positions_by_commit.setdefault((self.commits[-1], lane), []).append(position)
+        for level, row in snapshot.levels.items():
+            for metric in STAGE_METRICS:
+                self._append(position, lane, source, level, metric, stage_dist(row, metric))
+        if len(snapshot.fixtures) < 2:
+            return  # single-fixture runs: the aggregate is the fixture
+        for fixture in snapshot.fixtures:
+            self._fixture_ids.setdefault(lane, {})[fixture.fixture_id] = None
+            for level, row in fixture.levels.items():
+                for metric in FIXTURE_METRICS:
+                    self._append(
+                        position, lane, source, level, fixture_metric(metric, fixture.fixture_id), stage_dist(row, metric)
+                    )
+
+    def _append(self, position: int, lane: str, source: str, level: str, metric: str, dist: Dist) -> None:
+        for key in ((lane, None, level, metric), (lane, source, level, metric)):
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = HistorySeries([], array("d"), array("d"))
+            series.positions.append(position)
+            series.p50.append(dist.p50)
+            series.p95.append(dist.p95)
+
+    def lane(self, lane: str) -> list[LaneSnapshot]:
+        return self._by_lane.get(lane, [])
+
+    def contains(self, snapshot: LaneSnapshot) -> bool:
+        return snapshot_identity(snapshot) in self._positions_by_identity
+
+    def excluded_positions(self, snapshot: LaneSnapshot) -> list[int]:
+        """Positions of every indexed run of the snapshot's commit and lane (the snapshot alone without a SHA)."""
+        commit = str(snapshot.run.get("commitSHA") or "")
+        if commit:
+            return self._positions_by_commit.get((commit, snapshot.lane), [])
+        return self._positions_by_identity.get(snapshot_identity(snapshot), [])
+
+    def fixture_ids(self, lane: str) -> list[str]:
+        """Fixture IDs seen in multi-fixture runs of this lane, first-seen order."""
+        return list(self._fixture_ids.get(lane, ()))
+
+    def series_entry(self, lane: str, source: Optional[str], level: str, metric: str) -> Optional[HistorySeries]:
+        return self._series.get((lane, source, level, metric))
+
+    def count(self, lane: str, source: Optional[str] = None) -> int:
+        if source is None:
+            return len(self.lane(lane))
+        return self._source_counts[(lane, source)]
+
+    def series(
+        self,
+        lane: str,
+        level: str,
+        metric: str,
+        max_points: int,
+        source: Optional[str] = None,
+        exclude_snapshot: Optional[LaneSnapshot] = None,
+        field: str = "p95",
+    ) -> list[float]:
+        """Newest `max_points` values, oldest first; `exclude_snapshot` drops every run of its
+        commit in this lane, so repeats merged into a head never count as its own history."""
+        series = self._series.get((lane, source, level, metric))
+        if series is None:
+            return []
+        values = series.p95 if field == "p95" else series.p50
+        excluded = set(self.excluded_positions(exclude_snapshot)) if exclude_snapshot else set()
+        if not excluded:
+            return list(values[-max_points:])
+
+        picked: list[float] = []
+        for i in range(len(values) - 1, -1, -1):
+            if series.positions[i] in excluded:
+                continue
+            picked.append(values[i])
+            if max_points > 0 and len(picked) >= max_points:
+                break
+        picked.reverse()
+        return picked
+
+
 def trend_series_filtered(
-    snapshots: list[LaneSnapshot],
+    history: HistoryIndex,
     lane: str,
     level: str,
     metric: str,
@@ -273,35 +890,14 @@ def trend_series_filtered(
     source: Optional[str] = None,
     exclude_snapshot: Optional[LaneSnapshot] = None,
 ) -> list[float]:
-    values: list[float] = []
-    exclude_identity = snapshot_identity(exclude_snapshot) if exclude_snapshot else None
-
-    for snapshot in snapshots:
-        if snapshot.lane != lane:
-            continue
-        if source == "master" and run_source_label(snapshot) != "master":
-            continue
-        if source == "pr" and run_source_label(snapshot) == "master":
-            continue
-        if exclude_identity and snapshot_identity(snapshot) == exclude_identity:
-            continue
-
-        row = snapshot.levels.get(level)
-        if row is None:
-            continue
-
-        if metric == "generation":
-            values.append(row.generation.p95)
-        elif metric == "stt":
-            values.append(row.stt.p95)
-        elif metric == "rewrite":
-            values.append(row.rewrite.p95)
-        elif metric == "encode":
-            values.append(row.encode.p95)
-        elif metric == "paste":
-            values.append(row.paste.p95)
-
-    return values[-max_points:]
+    return history.series(
+        lane,
+        level,
+        metric,
+        max_points,
+        source=source,
+        exclude_snapshot=exclude_snapshot,
+    )
 
 
 def lane_name_for_run(run: dict[str, Any]) -> str:
@@ -311,26 +907,67 @@ def lane_name_for_run(run: dict[str, Any]) -> str:
     return "provider"
 
 
+def percentile(ordered: list[float], quantile: float) -> float:
+    """Linear-interpolated percentile of sorted values (matches StageDistribution.percentile)."""
+    if not ordered:
+        return 0.0
+    rank = quantile * (len(ordered) - 1)
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def dist_from_samples(samples: list[float]) -> Dist:
+    if not samples:
+        return Dist(0.0, 0.0, 0.0, 0.0)
+    ordered = sorted(samples)
+    return Dist(
+        p50=percentile(ordered, 0.50),
+        p95=percentile(ordered, 0.95),
+        min=ordered[0],
+        max=ordered[-1],
+        p99=percentile(ordered, 0.99),
+        samples=tuple(samples),
+    )
+
+
 def dist_from_level(level_entry: dict[str, Any], key: str) -> Dist:
     d = level_entry.get("distributions", {}).get(key) or {}
+    samples = d.get("samples")
+    if isinstance(samples, list) and samples and all(isinstance(value, (int, float)) for value in samples):
+        return dist_from_samples([float(value) for value in samples])
+    p99 = d.get("p99")
     return Dist(
         p50=float(d.get("p50", 0.0)),
         p95=float(d.get("p95", 0.0)),
         min=float(d.get("min", 0.0)),
         max=float(d.get("max", 0.0)),
+        p99=float(p99) if isinstance(p99, (int, float)) else None,
     )
 
 
 def level_stats_from_entry(level_entry: dict[str, Any]) -> LevelStats:
+    generation = dist_from_level(level_entry, "generationMs")
+    paste = dist_from_level(level_entry, "pasteMs")
+    total = dist_from_level(level_entry, "totalStageMs")
+    if total.max <= 0 and (generation.max > 0 or paste.max > 0):
+        # Runs without totalStageMs: approximate the stage sum by summing percentiles.
+        total = Dist(
+            p50=generation.p50 + paste.p50,
+            p95=generation.p95 + paste.p95,
+            min=generation.min + paste.min,
+            max=generation.max + paste.max,
+        )
     return LevelStats(
         level=str(level_entry.get("level", "")),
         iterations=int(level_entry.get("iterations", 0)),
         providers=level_entry.get("providers") or {},
-        generation=dist_from_level(level_entry, "generationMs"),
+        generation=generation,
         stt=dist_from_level(level_entry, "sttMs"),
         rewrite=dist_from_level(level_entry, "rewriteMs"),
         encode=dist_from_level(level_entry, "encodeMs"),
-        paste=dist_from_level(level_entry, "pasteMs"),
+        paste=paste,
+        total=total,
     )
 
 
@@ -343,9 +980,20 @@ def weighted_avg(values: list[float], weights: list[float]) -> float:
     return sum(value * weight for value, weight in zip(values, weights)) / total_weight
 
 
+def merge_dists(dists: list[Dist]) -> Optional[Dist]:
+    """Exact merge via pooled samples; None if any input lacks samples."""
+    if not dists or not all(d.samples for d in dists):
+        return None
+    return dist_from_samples([value for d in dists for value in d.samples])
+
+
 def weighted_dist(dists: list[Dist], weights: list[float]) -> Dist:
     if not dists:
         return Dist(0.0, 0.0, 0.0, 0.0)
+    merged = merge_dists(dists)
+    if merged is not None:
+        return merged
+    # Legacy runs: no samples, so approximate with byte-weighted percentiles.
     return Dist(
         p50=weighted_avg([d.p50 for d in dists], weights),
         p95=weighted_avg([d.p95 for d in dists], weights),
@@ -354,6 +1002,76 @@ def weighted_dist(dists: list[Dist], weights: list[float]) -> Dist:
     )
 
 
+def merge_usage(items_by_run: list[Any]) -> Optional[list[dict[str, Any]]]:
+    """Sum observed provider/model counts across runs."""
+    counts: dict[tuple[tuple[str, Any], ...], int] = {}
+    present = False
+    for items in items_by_run:
+        if not isinstance(items, list):
+            continue
+        present = True
+        for item in items:
+            if isinstance(item, dict):
+                identity = tuple(sorted((key, value) for key, value in item.items() if key != "count"))
+                counts[identity] = counts.get(identity, 0) + int(item.get("count") or 0)
+    if not present:
+        return None
+    return [dict(identity, count=count) for identity, count in sorted(counts.items(), key=lambda kv: -kv[1])]
+
+
+def merge_level_stats(rows: list[LevelStats]) -> LevelStats:
+    weights = [float(max(1, row.iterations)) for row in rows]
+    providers = dict(rows[-1].providers) if isinstance(rows[-1].providers, dict) else {}
+    for key in ("sttObserved", "rewriteObserved"):
+        providers[key] = merge_usage([row.providers.get(key) for row in rows if isinstance(row.providers, dict)])
+    return LevelStats(
+        level=rows[0].level,
+        iterations=sum(row.iterations for row in rows),
+        providers=providers,
+        **{metric: weighted_dist([getattr(row, metric) for row in rows], weights) for metric in STAGE_METRICS},
+    )
+
+
+def merge_snapshots(snapshots: list[LaneSnapshot]) -> LaneSnapshot:
+    """One snapshot from repeated runs of one lane and commit.
+
+    Distributions pool per-iteration samples when every run has them, and fall
+    back to iteration-weighted percentiles for runs without samples.
+    """
+    if len(snapshots) == 1:
+        return snapshots[0]
+    latest = max(snapshots, key=lambda snapshot: run_order_key(snapshot.run))
+    levels = {
+        level: merge_level_stats(rows)
+        for level in LEVELS
+        if (rows := [snapshot.levels[level] for snapshot in snapshots if level in snapshot.levels])
+    }
+    fixtures_by_id: dict[str, list[FixtureStats]] = {}
+    for snapshot in snapshots:
+        for fixture in snapshot.fixtures:
+            fixtures_by_id.setdefault(fixture.fixture_id, []).append(fixture)
+    fixtures = [
+        FixtureStats(
+            fixture_id=fixture_id,
+            audio_file=repeats[0].audio_file,
+            audio_bytes=repeats[0].audio_bytes,
+            levels={
+                level: merge_level_stats(rows)
+                for level in LEVELS
+                if (rows := [fixture.levels[level] for fixture in repeats if level in fixture.levels])
+            },
+        )
+        for fixture_id, repeats in fixtures_by_id.items()
+    ]
+    return replace(
+        latest,
+        run={**latest.run, "mergedRuns": len(snapshots)},
+        levels=levels,
+        fixtures=fixtures,
+        iterations_per_fixture=sum(snapshot.iterations_per_fixture for snapshot in snapshots),
+    )
+
+
 def build_snapshot(run: dict[str, Any]) -> Optional[LaneSnapshot]:
     if not isinstance(run, dict):
         return None
@@ -429,6 +1147,7 @@ def build_snapshot(run: dict[str, Any]) -> Optional[LaneSnapshot]:
                 rewrite=weighted_dist([row.rewrite for row in level_rows], weights),
                 encode=weighted_dist([row.encode for row in level_rows], weights),
                 paste=weighted_dist([row.paste for row in level_rows], weights),
+                total=weighted_dist([row.total for row in level_rows], weights),
             )
     else:
         aggregated_levels = top_level_map
@@ -463,6 +1182,14 @@ def load_history_runs(history_dir: Optional[Path]) -> list[dict[str, Any]]:
     return runs
 
 
+def run_order_key(run: dict[str, Any]) -> tuple[datetime, str, str]:
+    return (
+        parse_generated_at(run.get("generatedAt")) or datetime.min.replace(tzinfo=timezone.utc),
+        str(run.get("commitSHA") or ""),
+        lane_name_for_run(run),
+    )
+
+
 def dedupe_and_sort_runs(runs: list[dict[str, Any]]) -> list[dict[str, Any]]:
     unique: dict[tuple[str, str, str], dict[str, Any]] = {}
     for run in runs:
@@ -473,25 +1200,285 @@ def dedupe_and_sort_runs(runs: list[dict[str, Any]]) -> list[dict[str, Any]]:
         )
         unique[key] = run
     ordered = list(unique.values())
-    ordered.sort(
-        key=lambda run: (
-            parse_generated_at(run.get("generatedAt")) or datetime.min.replace(tzinfo=timezone.utc),
-            str(run.get("commitSHA") or ""),
-            lane_name_for_run(run),
+    ordered.sort(key=run_order_key)
+    return ordered
+
+
+def dedupe_and_sort_snapshots(snapshots: list[LaneSnapshot]) -> list[LaneSnapshot]:
+    """Same identity/ordering rules as dedupe_and_sort_runs; later entries win."""
+    unique: dict[tuple[str, str, str], LaneSnapshot] = {}
+    for snapshot in snapshots:
+        unique[snapshot_identity(snapshot)] = snapshot
+    ordered = list(unique.values())
+    ordered.sort(key=lambda snapshot: run_order_key(snapshot.run))
+    return ordered
+
+
+# Bump when the compact snapshot layout (or build_snapshot semantics) changes.
+HISTORY_CACHE_VERSION = 3
+# Outside the history dir: CI rebuilds that dir every run and uploads it as an artifact.
+HISTORY_CACHE_DIR = Path(
+    os.environ.get("VOX_PERF_HISTORY_CACHE_DIR") or Path.home() / ".cache" / "vox" / "perf-history"
+)
+
+
+def default_history_cache_path(history_dir: Path) -> Path:
+    """Snapshot cache for history_dir, keyed by its resolved path."""
+    key = hashlib.sha256(str(history_dir.resolve()).encode("utf-8")).hexdigest()[:24]
+    return HISTORY_CACHE_DIR / f"{key}.sqlite"
+
+
+def dist_to_row(dist: Dist) -> list[Any]:
+    if dist.p99 is None and not dist.samples:
+        return [dist.p50, dist.p95, dist.min, dist.max]
+    return [dist.p50, dist.p95, dist.min, dist.max, dist.p99, list(dist.samples)]
+
+
+def dist_from_row(row: list[Any]) -> Dist:
+    if len(row) > 4:
+        return Dist(row[0], row[1], row[2], row[3], row[4], tuple(row[5]))
+    return Dist(*row)
+
+
+def level_to_row(stats: LevelStats) -> list[Any]:
+    return [
+        stats.level,
+        stats.iterations,
+        *(dist_to_row(stage_dist(stats, metric)) for metric in STAGE_METRICS),
+    ]
+
+
+def level_from_row(row: list[Any]) -> LevelStats:
+    dists = {metric: dist_from_row(values) for metric, values in zip(STAGE_METRICS, row[2:])}
+    return LevelStats(level=row[0], iterations=row[1], providers={}, **dists)
+
+
+def snapshot_to_compact(snapshot: LaneSnapshot) -> dict[str, Any]:
+    """Reduce a snapshot to what history queries need (no routing/provider usage)."""
+    return {
+        "run": {key: value for key, value in snapshot.run.items() if not isinstance(value, (dict, list))},
+        "lane": snapshot.lane,
+        "levels": [level_to_row(stats) for stats in snapshot.levels.values()],
+        "fixtures": [
+            [fixture.fixture_id, fixture.audio_file, fixture.audio_bytes, [level_to_row(stats) for stats in fixture.levels.values()]]
+            for fixture in snapshot.fixtures
+        ],
+        "meta": [
+            snapshot.iterations_per_fixture,
+            snapshot.warmup_per_fixture,
+            snapshot.stt_mode,
+            snapshot.stt_policy,
+            snapshot.stt_forced,
+            snapshot.rewrite_routing,
+        ],
+    }
+
+
+def snapshot_from_compact(data: dict[str, Any]) -> LaneSnapshot:
+    iterations, warmup, stt_mode, stt_policy, stt_forced, rewrite_routing = data["meta"]
+    levels = {row[0]: level_from_row(row) for row in data["levels"]}
+    return LaneSnapshot(
+        lane=data["lane"],
+        run=data["run"],
+        levels=levels,
+        fixtures=[
+            FixtureStats(
+                fixture_id=fixture_id,
+                audio_file=audio_file,
+                audio_bytes=audio_bytes,
+                levels={row[0]: level_from_row(row) for row in level_rows},
+            )
+            for fixture_id, audio_file, audio_bytes, level_rows in data["fixtures"]
+        ],
+        iterations_per_fixture=iterations,
+        warmup_per_fixture=warmup,
+        stt_mode=stt_mode,
+        stt_policy=stt_policy,
+        stt_forced=stt_forced,
+        stt_chain=[],
+        rewrite_routing=rewrite_routing,
+    )
+
+
+# Sentinel from ingest workers: the file's content hash already has a cached snapshot.
+KNOWN_DIGEST = "\0known"
+# Below this many files, process start-up costs more than it saves.
+PARALLEL_INGEST_MIN_FILES = 64
+
+
+def ingest_history_file(path: str, known_digests: frozenset[str]) -> tuple[str, Optional[str], Optional[str]]:
+    """Worker: read, hash and reduce one history file.
+
+    Returns (digest, compact JSON or None/KNOWN_DIGEST, error). Only the compact
+    row crosses the process boundary, never the full run payload.
+    """
+    try:
+        data = Path(path).read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if digest in known_digests:
+            return digest, KNOWN_DIGEST, None
+        run = parse_json_bytes(data)
+    except (OSError, ValueError) as exc:
+        return "", None, str(exc)
+    snapshot = build_snapshot(run) if isinstance(run, dict) else None
+    return digest, dump_compact_json(snapshot_to_compact(snapshot)) if snapshot else None, None
+
+
+def ingest_history_files(
+    paths: list[Path],
+    known_digests: frozenset[str] = frozenset(),
+    jobs: Optional[int] = None,
+) -> list[tuple[str, Optional[str], Optional[str]]]:
+    """Run ingest_history_file over paths, in a process pool when it pays off."""
+    jobs = jobs or os.cpu_count() or 1
+    names = [str(path) for path in paths]
+    if jobs > 1 and len(names) >= PARALLEL_INGEST_MIN_FILES:
+        chunksize = max(1, len(names) // (jobs * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                return list(pool.map(ingest_history_file, names, repeat(known_digests), chunksize=chunksize))
+        except (OSError, BrokenProcessPool, pickle.PicklingError) as exc:
+            print(f"[perf-report] parallel history ingest unavailable ({exc}); parsing serially", file=sys.stderr)
+    return [ingest_history_file(name, known_digests) for name in names]
+
+
+class HistoryCache:
+    """Persistent compact-snapshot cache for --history-dir.
+
+    Files are matched by (path, size, mtime) first; on a stat mismatch the
+    content hash decides, so re-downloaded but unchanged files still hit.
+    Snapshots are stored once per content hash.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, sha256 TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS snapshots (sha256 TEXT PRIMARY KEY, compact TEXT);
+            """
+        )
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != str(HISTORY_CACHE_VERSION):
+            with self.conn:
+                self.conn.execute("DELETE FROM files")
+                self.conn.execute("DELETE FROM snapshots")
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                    (str(HISTORY_CACHE_VERSION),),
+                )
+        self.hits = 0
+        self.misses = 0
+
+    def load_dir(self, history_dir: Path, jobs: Optional[int] = None) -> list[LaneSnapshot]:
+        files = {
+            row[0]: row[1:]
+            for row in self.conn.execute("SELECT path, size, mtime_ns, sha256 FROM files")
+        }
+        compact_by_digest: dict[str, Optional[str]] = dict(
+            self.conn.execute("SELECT sha256, compact FROM snapshots")
         )
+
+        root = history_dir.resolve()
+        digests: dict[str, str] = {}
+        pending: list[tuple[Path, str, os.stat_result]] = []
+        for path in sorted(history_dir.glob("*.json")):
+            key = str(root / path.name)
+            try:
+                st = path.stat()
+            except OSError as exc:
+                print(f"[perf-report] skipped history file {path}: {exc}", file=sys.stderr)
+                continue
+            known = files.get(key)
+            if known and known[0] == st.st_size and known[1] == st.st_mtime_ns and known[2] in compact_by_digest:
+                digests[key] = known[2]
+            else:
+                digests[key] = ""
+                pending.append((path, key, st))
+
+        results = ingest_history_files([path for path, _, _ in pending], frozenset(compact_by_digest), jobs)
+        with self.conn:
+            for (path, key, st), (digest, compact, error) in zip(pending, results):
+                if error is not None:
+                    print(f"[perf-report] skipped history file {path}: {error}", file=sys.stderr)
+                    del digests[key]
+                    continue
+                digests[key] = digest
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO files (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)",
+                    (key, st.st_size, st.st_mtime_ns, digest),
+                )
+                if compact != KNOWN_DIGEST:
+                    self.misses += 1
+                    compact_by_digest[digest] = compact
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO snapshots (sha256, compact) VALUES (?, ?)", (digest, compact)
+                    )
+
+            prefix = str(root) + os.sep
+            stale = [(key,) for key in files if key.startswith(prefix) and key not in digests]
+            self.conn.executemany("DELETE FROM files WHERE path = ?", stale)
+            if stale:
+                self.conn.execute("DELETE FROM snapshots WHERE sha256 NOT IN (SELECT sha256 FROM files)")
+
+        self.hits = len(digests) - self.misses
+        return [
+            snapshot_from_compact(parse_json_bytes(compact))
+            for digest in digests.values()
+            if (compact := compact_by_digest.get(digest))
+        ]
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def load_history_snapshots(
+    history_dir: Optional[Path],
+    cache_path: Optional[Path] = None,
+    jobs: Optional[int] = None,
+) -> list[LaneSnapshot]:
+    """Build history snapshots, reusing the compact cache when cache_path is set."""
+    if history_dir is None or not history_dir.exists() or not history_dir.is_dir():
+        return []
+    if cache_path is None:
+        paths = sorted(history_dir.glob("*.json"))
+        snapshots: list[LaneSnapshot] = []
+        for path, (_, compact, error) in zip(paths, ingest_history_files(paths, jobs=jobs)):
+            if error is not None:
+                print(f"[perf-report] skipped history file {path}: {error}", file=sys.stderr)
+            elif compact:
+                snapshots.append(snapshot_from_compact(parse_json_bytes(compact)))
+        return snapshots
+
+    try:
+        cache = HistoryCache(cache_path)
+    except (sqlite3.Error, OSError) as exc:
+        print(f"[perf-report] history cache unavailable ({cache_path}): {exc}", file=sys.stderr)
+        return load_history_snapshots(history_dir, jobs=jobs)
+    try:
+        snapshots = cache.load_dir(history_dir, jobs)
+    finally:
+        cache.close()
+    print(
+        f"[perf-report] history cache: {cache.hits} hit(s), {cache.misses} miss(es) ({cache_path})",
+        file=sys.stderr,
     )
-    return ordered
+    return snapshots
 
 
 def trend_series(
-    snapshots: list[LaneSnapshot],
+    history: HistoryIndex,
     lane: str,
     level: str,
     metric: str,
     max_points: int,
 ) -> list[float]:
     return trend_series_filtered(
-        snapshots,
+        history,
         lane=lane,
         level=level,
         metric=metric,
@@ -500,65 +1487,471 @@ def trend_series(
 
 
 def metric_value(row: LevelStats, metric: str) -> float:
-    if metric == "generation":
-        return row.generation.p95
-    if metric == "stt":
-        return row.stt.p95
-    if metric == "rewrite":
-        return row.rewrite.p95
-    if metric == "encode":
-        return row.encode.p95
-    if metric == "paste":
-        return row.paste.p95
-    return 0.0
+    dist = stage_dist(row, metric)
+    return dist.p95 if dist else 0.0
 
 
-def lane_snapshots(history_snapshots: list[LaneSnapshot], lane: str) -> list[LaneSnapshot]:
-    return [snapshot for snapshot in history_snapshots if snapshot.lane == lane]
+def lane_snapshots(history: HistoryIndex, lane: str) -> list[LaneSnapshot]:
+    return history.lane(lane)
 
 
-def run_source_label(snapshot: LaneSnapshot) -> str:
-    pr_number = snapshot.run.get("pullRequestNumber")
-    if isinstance(pr_number, int) and pr_number > 0:
-        return f"PR #{pr_number}"
-    return "master"
+# Change-point detection (PELT, Gaussian mean-shift cost) over master history.
+# "total" is left out: it moves with generation and would double every signal.
+CHANGEPOINT_METRICS = ("generation", "stt", "rewrite", "encode", "paste")
+CHANGEPOINT_PENALTY = 3.0  # multiplied by log(n); higher = fewer, larger shifts
+CHANGEPOINT_MIN_SEGMENT = 3  # runs per segment, so one outlier run is not a "shift"
+CHANGEPOINT_MIN_SHIFT_PCT = 5.0
+CHANGEPOINT_WINDOW = 200  # newest master runs scanned per series
+CHANGEPOINT_RECENT_RUNS = 5  # shifts this close to the newest run count as new
 
 
-def run_timestamp_label(snapshot: LaneSnapshot) -> str:
-    parsed = parse_generated_at(snapshot.run.get("generatedAt"))
-    if parsed is None:
-        return "—"
-    return parsed.strftime("%Y-%m-%d %H:%M")
+@dataclass(frozen=True)
+class ChangePoint:
+    lane: str
+    level: str
+    metric: str
+    before: float  # segment mean p95 before the shift (ms)
+    after: float  # segment mean p95 from the shift onwards (ms)
+    last_good_commit: str
+    first_bad_commit: str
+    first_bad_at: str
+    runs_since: int  # master runs from the shift to the newest run, inclusive
+
+    @property
+    def delta(self) -> float:
+        return self.after - self.before
+
+
+def robust_sigma(values: list[float]) -> float:
+    """Noise scale from the MAD of successive differences (insensitive to the shifts themselves)."""
+    diffs = [abs(b - a) for a, b in zip(values, values[1:])]
+    mad = median(diffs) or 0.0
+    sigma = 1.4826 * mad / math.sqrt(2)
+    floor = max(0.1, 0.01 * abs(median(values) or 0.0))
+    return max(sigma, floor)
+
+
+def pelt_mean_shift(values: list[float], penalty: float, min_size: int = CHANGEPOINT_MIN_SEGMENT) -> list[int]:
+    """Return change indices (start of each new segment) minimizing squared error + penalty per change."""
+    n = len(values)
+    if n < 2 * min_size:
+        return []
+    sums = [0.0]
+    squares = [0.0]
+    for value in values:
+        sums.append(sums[-1] + value)
+        squares.append(squares[-1] + value * value)
+
+    def cost(start: int, end: int) -> float:
+        total = sums[end] - sums[start]
+        return squares[end] - squares[start] - total * total / (end - start)
+
+    best = [math.inf] * (n + 1)
+    best[0] = -penalty
+    previous = [0] * (n + 1)
+    candidates = [0]
+    for end in range(min_size, n + 1):
+        split = end - min_size
+        if split >= min_size:
+            candidates.append(split)
+        scored = [(best[start] + cost(start, end) + penalty, start) for start in candidates]
+        best[end], previous[end] = min(scored)
+        # PELT pruning: a start that cannot beat the optimum now never will.
+        candidates = [start for total, start in scored if total - penalty <= best[end]]
+
+    changes: list[int] = []
+    end = n
+    while end > 0:
+        start = previous[end]
+        if start > 0:
+            changes.append(start)
+        end = start
+    changes.reverse()
+    return changes
+
+
+def detect_change_points(
+    history: HistoryIndex,
+    lane: str,
+    window: int = CHANGEPOINT_WINDOW,
+    penalty: float = CHANGEPOINT_PENALTY,
+) -> list[ChangePoint]:
+    """Step changes in master p95 per level and stage, newest first."""
+    found: list[ChangePoint] = []
+    for level in LEVELS:
+        for metric in CHANGEPOINT_METRICS:
+            series = history.series_entry(lane, "master", level, metric)
+            if series is None:
+                continue
+            values = list(series.p95[-window:])
+            positions = series.positions[-window:]
+            if len(values) < 2 * CHANGEPOINT_MIN_SEGMENT or max(values) - min(values) <= 0:
+                continue
+            sigma = robust_sigma(values)
+            scaled = [value / sigma for value in values]
+            bounds = [0, *pelt_mean_shift(scaled, penalty * math.log(len(values))), len(values)]
+            for left, change, right in zip(bounds, bounds[1:], bounds[2:]):
+                before = sum(values[left:change]) / (change - left)
+                after = sum(values[change:right]) / (right - change)
+                if before <= 0 or abs(after - before) / before * 100 < CHANGEPOINT_MIN_SHIFT_PCT:
+                    continue
+                first_bad = history.snapshots[positions[change]]
+                found.append(
+                    ChangePoint(
+                        lane=lane,
+                        level=level,
+                        metric=metric,
+                        before=before,
+                        after=after,
+                        last_good_commit=history.commits[positions[change - 1]],
+                        first_bad_commit=history.commits[positions[change]],
+                        first_bad_at=run_timestamp_label(first_bad),
+                        runs_since=len(values) - change,
+                    )
+                )
+    found.sort(key=lambda point: (point.runs_since, -abs(point.delta)))
+    return found
 
 
-def render_mermaid_trend_chart(lines: list[str], lane_history: list[LaneSnapshot], lane: str, max_points: int = 30) -> None:
-    if len(lane_history) < 2:
+def fmt_commit_range(point: ChangePoint) -> str:
+    return f"`{short_sha(point.last_good_commit)}..{short_sha(point.first_bad_commit)}`"
+
+
+def render_change_points(lines: list[str], points: list[ChangePoint], master_runs: int) -> None:
+    lines.append("**Change points (master p95 step shifts)**")
+    lines.append("")
+    if not points:
+        lines.append(f"No step changes detected across the latest {master_runs} master run(s).")
+        lines.append("")
         return
+    lines.append("| Level | Stage | Shift | Before → after | Commit range | First run | Runs since |")
+    lines.append("| --- | --- | --- | --- | --- | --- | ---: |")
+    for point in points:
+        lines.append(
+            f"| {point.level} | {point.metric} | {fmt_change(point.after, point.before)} | "
+            f"{fmt_ms(point.before)} → {fmt_ms(point.after)} | {fmt_commit_range(point)} | "
+            f"{point.first_bad_at} | {point.runs_since} |"
+        )
+    lines.append("")
 
-    series_runs = lane_history[-max_points:]
 
-    def level_series(level: str) -> list[int]:
-        values: list[int] = []
-        for snapshot in series_runs:
-            row = snapshot.levels.get(level)
-            values.append(int(round(row.generation.p95)) if row else 0)
-        return values
+DEFAULT_BUDGETS_PATH = REPO_ROOT / "docs" / "performance" / "latency-budgets.json"
+BUDGET_QUANTILES = ("p50", "p95", "p99", "max")
+BUDGET_TIGHT_PCT = 10.0  # headroom below this share of the limit is flagged
+BUDGET_TREND_POINTS = 8
+# Exit status for --fail-on-budget, distinct from crashes so CI can still post the report.
+BUDGET_FAILURE_EXIT = 3
 
-    raw_values = level_series("raw")
-    clean_values = level_series("clean")
-    polish_values = level_series("polish")
-    all_values = raw_values + clean_values + polish_values
-    y_max = max(all_values) if all_values else 0
-    y_upper = max(1000, ((y_max + 499) // 500) * 500)
-    x_axis = ", ".join(str(index + 1) for index in range(len(series_runs)))
-    lane_title = "Provider" if lane == "provider" else "Codepath"
 
-    lines.append("**Longitudinal chart (generation p95 by run order)**")
-    lines.append("")
-    lines.append("```mermaid")
-    lines.append("xychart-beta")
-    lines.append(f'    title "{lane_title} generation p95 trend (ms)"')
-    lines.append(f"    x-axis \"Run\" [{x_axis}]")
+@dataclass(frozen=True)
+class Budget:
+    budget_id: str
+    description: str
+    lanes: tuple[str, ...]
+    levels: tuple[str, ...]
+    metric: str
+    quantile: str
+    max_ms: float
+    subtract_ms: dict[str, float]
+
+
+@dataclass(frozen=True)
+class BudgetResult:
+    budget: Budget
+    lane: str
+    level: str
+    value: Optional[float]  # None when the run lacks this quantile (e.g. p99 on legacy runs)
+    headroom_trend: list[float]
+
+    @property
+    def headroom(self) -> Optional[float]:
+        return None if self.value is None else self.budget.max_ms - self.value
+
+    @property
+    def status(self) -> str:
+        if self.value is None:
+            return "unknown"
+        if self.value > self.budget.max_ms:
+            return "fail"
+        if self.headroom < self.budget.max_ms * BUDGET_TIGHT_PCT / 100:
+            return "tight"
+        return "pass"
+
+
+def load_budgets(path: Path) -> list[Budget]:
+    data = load_json(path)
+    entries = data.get("budgets") if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected an object with a 'budgets' list")
+    budgets: list[Budget] = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"{path}: budgets[{index}] is not an object")
+        metric = str(entry.get("metric") or "")
+        quantile = str(entry.get("quantile") or "p95")
+        if metric not in STAGE_METRICS or quantile not in BUDGET_QUANTILES:
+            raise ValueError(f"{path}: budgets[{index}] has unknown metric/quantile {metric!r}/{quantile!r}")
+        if not isinstance(entry.get("max_ms"), (int, float)):
+            raise ValueError(f"{path}: budgets[{index}] needs a numeric max_ms")
+        budgets.append(
+            Budget(
+                budget_id=str(entry.get("id") or f"{metric}-{quantile}"),
+                description=str(entry.get("description") or ""),
+                lanes=tuple(entry.get("lanes") or ("provider", "codepath")),
+                levels=tuple(entry.get("levels") or LEVELS),
+                metric=metric,
+                quantile=quantile,
+                max_ms=float(entry["max_ms"]),
+                subtract_ms={str(k): float(v) for k, v in (entry.get("subtract_ms") or {}).items()},
+            )
+        )
+    return budgets
+
+
+def budget_value(budget: Budget, row: LevelStats) -> Optional[float]:
+    dist = stage_dist(row, budget.metric)
+    value = getattr(dist, budget.quantile) if dist else None
+    if value is None:
+        return None
+    return max(0.0, value - budget.subtract_ms.get(row.level, 0.0))
+
+
+def check_budgets(
+    budgets: list[Budget],
+    snapshots: list[LaneSnapshot],
+    history: HistoryIndex,
+) -> list[BudgetResult]:
+    """Evaluate every budget against each matching lane snapshot and level."""
+    results: list[BudgetResult] = []
+    for snapshot in snapshots:
+        for budget in budgets:
+            if snapshot.lane not in budget.lanes:
+                continue
+            for level in budget.levels:
+                row = snapshot.levels.get(level)
+                if row is None:
+                    continue
+                trend: list[float] = []
+                if budget.quantile in {"p50", "p95"}:
+                    offset = budget.subtract_ms.get(level, 0.0)
+                    series = history.series(
+                        snapshot.lane,
+                        level,
+                        budget.metric,
+                        BUDGET_TREND_POINTS,
+                        source="master",
+                        exclude_snapshot=snapshot,
+                        field=budget.quantile,
+                    )
+                    trend = [budget.max_ms - max(0.0, value - offset) for value in series]
+                results.append(BudgetResult(budget, snapshot.lane, level, budget_value(budget, row), trend))
+    return results
+
+
+def budget_verdict(results: list[BudgetResult]) -> dict[str, Any]:
+    failures = [result for result in results if result.status == "fail"]
+    return {
+        "status": "fail" if failures else "pass",
+        "checked": len(results),
+        "failures": [
+            {
+                "id": result.budget.budget_id,
+                "lane": result.lane,
+                "level": result.level,
+                "value_ms": round(result.value, 1),
+                "max_ms": result.budget.max_ms,
+            }
+            for result in failures
+        ],
+    }
+
+
+REPEAT_POWER = 0.80  # chance a real effect of the target size is flagged
+
+
+def repeats_needed(sigma: float, effect: float, alpha: float, base_sigma: float) -> Optional[int]:
+    """Head repeats so a p95 shift of `effect` clears a two-sided `alpha` test with REPEAT_POWER.
+
+    Merging k repeats shrinks head noise to sigma/sqrt(k); base noise stays. None
+    when even infinitely many head repeats cannot beat the base run's own noise.
+    """
+    if sigma <= 0:
+        return 1
+    z = NormalDist().inv_cdf(1 - alpha / 2) + NormalDist().inv_cdf(REPEAT_POWER)
+    budget = (effect / z) ** 2 - base_sigma**2
+    if effect <= 0 or budget <= 0:
+        return None
+    return max(1, math.ceil(sigma**2 / budget))
+
+
+def render_repeat_stability(
+    lines: list[str],
+    runs: list[LaneSnapshot],
+    base_snapshot: Optional[LaneSnapshot],
+    policy: VerdictPolicy = DEFAULT_VERDICT_POLICY,
+) -> None:
+    """How the merged head's verdict moves as repeats are added, and how many repeats a verdict needs."""
+    if len(runs) < 2:
+        return
+    lane = runs[0].lane
+    runs = sorted(runs, key=lambda snapshot: run_order_key(snapshot.run))
+    base = base_snapshot if base_snapshot and base_snapshot.lane == lane else None
+    levels = [level for level in ("clean", "polish") if level in runs[0].levels]
+    lines.append(f"**Repeat stability — `{lane}` head merged over {len(runs)} run(s) of one commit**")
+    lines.append("")
+    lines.append("| Repeats | " + " | ".join(f"{level} p95{' vs base' if base else ''}" for level in levels) + " |")
+    lines.append("| ---: | " + " | ".join("---" for _ in levels) + " |")
+    merged = runs[0]
+    for count in range(1, len(runs) + 1):
+        merged = merge_snapshots(runs[:count])
+        cells = []
+        for level in levels:
+            row = merged.levels.get(level)
+            base_row = base.levels.get(level) if base else None
+            if row is None:
+                cells.append("—")
+            elif base_row is None:
+                cells.append(fmt_ms(row.generation.p95))
+            else:
+                comparison = compare_dists(row.generation, base_row.generation, policy, (lane, level, "generation"))
+                evidence = f", p={comparison.p_value:.3f}" if comparison.method == "permutation" else ""
+                cells.append(f"{fmt_ms(row.generation.p95)} · {comparison.status} ({fmt_signed_ms(comparison.delta)}{evidence})")
+        lines.append(f"| {count} | " + " | ".join(cells) + " |")
+    lines.append("")
+
+    confidence = int(round((1 - policy.alpha) * 100))
+    for level in levels:
+        dists = [snapshot.levels[level].generation for snapshot in runs if level in snapshot.levels]
+        # A single run's p95 wobbles both between runs and within its own few
+        # iterations; take whichever estimate is larger.
+        within = [p95_bootstrap_sigma(dist.samples, policy.resamples) for dist in dists if dist.samples]
+        within_sigma = median(within) if within else 0.0
+        if len(dists) >= 3:
+            sigma, sigma_source = stdev(dist.p95 for dist in dists), f"spread of these {len(dists)} runs"
+        elif policy.noise and (calibrated := policy.noise.sigma(lane, level, "generation")) is not None:
+            sigma, sigma_source = calibrated, "calibrated master noise"
+        else:
+            sigma, sigma_source = 0.0, ""
+        if within_sigma > sigma:
+            sigma, sigma_source = within_sigma, "bootstrap of per-run samples"
+        if sigma <= 0:
+            continue
+        row = merged.levels.get(level)
+        base_row = base.levels.get(level) if base else None
+        base_sigma = sigma
+        if base_row and base_row.generation.samples:
+            base_sigma = p95_bootstrap_sigma(base_row.generation.samples, policy.resamples)
+        observed = abs(row.generation.p95 - base_row.generation.p95) if row and base_row else 0.0
+        # Smallest shift compare_dists would call, so the advice matches the verdict rule.
+        floor = policy.threshold(lane, level, "generation")
+        effect = max(observed, floor if floor is not None else policy.min_effect_ms)
+        single_base = repeats_needed(sigma, effect, policy.alpha, base_sigma if base else 0.0)
+        # Repeating base as often as head: variance (σ² + σ_base²)/k.
+        paired = repeats_needed(math.hypot(sigma, base_sigma), effect, policy.alpha, 0.0) if base else None
+        if single_base is None:
+            advice = "head repeats alone cannot reach it against one base run"
+        else:
+            advice = f"{single_base} head repeat(s)"
+        if paired is not None:
+            advice += f"; {paired} each if base is repeated too"
+        lines.append(
+            f"- `{level}`: per-run p95 σ≈{fmt_ms(sigma)} ({sigma_source}); confirming a {fmt_ms(effect)} shift at "
+            f"{confidence}% confidence with {REPEAT_POWER:.0%} power: {advice}."
+        )
+    lines.append("")
+
+
+def render_budget_section(lines: list[str], results: list[BudgetResult], budgets_path: Path = DEFAULT_BUDGETS_PATH) -> None:
+    verdict = budget_verdict(results)
+    icon = "❌" if verdict["status"] == "fail" else "✅"
+    lines.append(f"**Latency budgets {icon}** ({len(verdict['failures'])} of {verdict['checked']} check(s) over budget)")
+    lines.append("")
+    lines.append("| Budget | Lane | Level | Value | Limit | Headroom | Status | Headroom trend (master, oldest → newest) |")
+    lines.append("| --- | --- | --- | ---: | ---: | ---: | --- | --- |")
+    status_text = {"pass": "pass", "tight": "tight ⚠️", "fail": "**over** ❌", "unknown": "—"}
+    for result in results:
+        budget = result.budget
+        value = fmt_ms(result.value) if result.value is not None else "—"
+        headroom = fmt_signed_ms(result.headroom) if result.headroom is not None else "—"
+        lines.append(
+            f"| `{budget.budget_id}` | {result.lane} | {result.level} | {value} | {fmt_ms(budget.max_ms)} | "
+            f"{headroom} | {status_text[result.status]} | {fmt_points(result.headroom_trend)} |"
+        )
+    lines.append("")
+    resolved = budgets_path.resolve()
+    shown = resolved.relative_to(REPO_ROOT) if resolved.is_relative_to(REPO_ROOT) else budgets_path
+    slo_note = " (SLOs in `latency-budget.md`)" if resolved == DEFAULT_BUDGETS_PATH.resolve() else ""
+    lines.append(f"> Budgets from `{shown.as_posix()}`{slo_note}. Headroom = limit − value.")
+    lines.append("")
+
+
+def render_noise_calibration(lines: list[str], noise: Optional[NoiseModel]) -> None:
+    """Footnote: the calibrated generation-p95 thresholds verdicts used, per lane/level."""
+    if noise is None:
+        return
+    cells = []
+    for lane in ("provider", "codepath"):
+        for level in LEVELS:
+            estimate = noise.estimates.get(f"{lane}/{level}/generation")
+            if estimate:
+                threshold = NOISE_THRESHOLD_SIGMAS * estimate.sigma_ms * math.sqrt(2)
+                cells.append(f"{lane} {level} σ {fmt_ms(estimate.sigma_ms)} → ±{fmt_ms(threshold)}")
+    if not cells:
+        lines.append(
+            f"> Noise calibration: fewer than {NOISE_MIN_RUNS} master runs per series; "
+            "run-to-run verdicts use the fixed 200ms/10% rule."
+        )
+    else:
+        lines.append(
+            f"> Noise calibration ({noise.source}; run-to-run threshold = {NOISE_THRESHOLD_SIGMAS:g}σ·√2): "
+            + "; ".join(cells)
+            + "."
+        )
+    lines.append("")
+
+
+def run_source_label(snapshot: LaneSnapshot) -> str:
+    pr_number = snapshot.run.get("pullRequestNumber")
+    if isinstance(pr_number, int) and pr_number > 0:
+        return f"PR #{pr_number}"
+    return "master"
+
+
+def run_timestamp_label(snapshot: LaneSnapshot) -> str:
+    parsed = parse_generated_at(snapshot.run.get("generatedAt"))
+    if parsed is None:
+        return "—"
+    return parsed.strftime("%Y-%m-%d %H:%M")
+
+
+def render_mermaid_trend_chart(lines: list[str], lane_history: list[LaneSnapshot], lane: str, max_points: int = 30) -> None:
+    if len(lane_history) < 2:
+        return
+
+    series_runs = lane_history[-max_points:]
+
+    def level_series(level: str) -> list[int]:
+        values: list[int] = []
+        for snapshot in series_runs:
+            row = snapshot.levels.get(level)
+            values.append(int(round(row.generation.p95)) if row else 0)
+        return values
+
+    raw_values = level_series("raw")
+    clean_values = level_series("clean")
+    polish_values = level_series("polish")
+    all_values = raw_values + clean_values + polish_values
+    y_max = max(all_values) if all_values else 0
+    y_upper = max(1000, ((y_max + 499) // 500) * 500)
+    x_axis = ", ".join(str(index + 1) for index in range(len(series_runs)))
+    lane_title = "Provider" if lane == "provider" else "Codepath"
+
+    lines.append("**Longitudinal chart (generation p95 by run order)**")
+    lines.append("")
+    lines.append("```mermaid")
+    lines.append("xychart-beta")
+    lines.append(f'    title "{lane_title} generation p95 trend (ms)"')
+    lines.append(f"    x-axis \"Run\" [{x_axis}]")
     lines.append(f"    y-axis \"ms\" 0 --> {y_upper}")
     lines.append(f"    line \"raw\" [{', '.join(str(value) for value in raw_values)}]")
     lines.append(f"    line \"clean\" [{', '.join(str(value) for value in clean_values)}]")
@@ -664,16 +2057,19 @@ def render_run_timeline(lines: list[str], lane_history: list[LaneSnapshot], max_
 def render_summary_section(
     lines: list[str],
     snapshot: LaneSnapshot,
-    history_snapshots: list[LaneSnapshot],
+    history: HistoryIndex,
     base_snapshot: Optional[LaneSnapshot],
     history_max: int,
     head_sha: Optional[str],
     base_sha: Optional[str],
     base_mode: str,
+    policy: VerdictPolicy = DEFAULT_VERDICT_POLICY,
 ) -> None:
     """Compact always-visible summary: one table row per level, regressions flagged."""
     regressions: list[str] = []
+    base_tests = collect_base_tests(snapshot, base_snapshot, policy)
     table_rows: list[str] = []
+    tested_levels = 0
 
     for level in LEVELS:
         row = snapshot.levels.get(level)
@@ -682,7 +2078,12 @@ def render_summary_section(
             continue
 
         p95_str = fmt_ms(row.generation.p95)
-        confidence = confidence_label(row.iterations, variability(row.generation), row.generation.p95)
+        confidence = confidence_label(
+            row.iterations,
+            variability(row.generation),
+            row.generation.p95,
+            policy.noise.sigma(snapshot.lane, level, "generation") if policy.noise else None,
+        )
 
         # vs base (master snapshot), noise-gated by within-run spread.
         base_row = (
@@ -691,21 +2092,24 @@ def render_summary_section(
             else None
         )
         if base_row:
-            base_noise = max(variability(row.generation), variability(base_row.generation))
-            base_status = change_status(row.generation.p95, base_row.generation.p95, noise=base_noise)
+            comparison = base_tests[(None, level)]
             vs_base = fmt_change(row.generation.p95, base_row.generation.p95)
-            if base_status == "neutral":
+            if comparison.status == "neutral":
                 vs_base = "neutral"
-            elif base_status == "regressed":
+            elif comparison.status == "regressed":
                 vs_base = f"**{vs_base}** ⚠️"
                 regressions.append(f"{level} (vs base)")
+            evidence = fmt_comparison_evidence(comparison, policy.alpha)
+            if evidence:
+                tested_levels += 1
+                vs_base = f"{vs_base} ({evidence})"
         else:
             vs_base = "—"
 
         # vs deployed/reference median (noise-gated)
         reference_source = "master" if snapshot.lane == "provider" else None
         series = trend_series_filtered(
-            history_snapshots,
+            history,
             lane=snapshot.lane,
             level=level,
             metric="generation",
@@ -716,7 +2120,12 @@ def render_summary_section(
         reference_median = median(series)
         if reference_median is not None:
             spread = variability(row.generation)
-            trend_status = change_status(row.generation.p95, reference_median, noise=spread)
+            trend_status = change_status(
+                row.generation.p95,
+                reference_median,
+                noise=spread,
+                threshold=policy.threshold(snapshot.lane, level, paired=False),
+            )
             if trend_status == "neutral":
                 vs_trend = "neutral"
             elif trend_status == "regressed":
@@ -737,6 +2146,12 @@ def render_summary_section(
     lines.extend(table_rows)
     lines.append("")
     lines.append("> **vs base** = compared to persisted master baseline at PR base SHA (or nearest persisted ancestor).")
+    if tested_levels:
+        lines.append(
+            f"> vs base verdicts use a permutation test on per-iteration p95 (α={policy.alpha:g}, "
+            f"min effect = calibrated noise threshold, or {fmt_ms(policy.min_effect_ms)} when uncalibrated) "
+            "with a bootstrap CI of the p95 delta; p-values are Holm-adjusted across every level and fixture × level test."
+        )
     lines.append("> **vs deployed median** = provider lane uses recent master-only median; codepath lane uses recent lane median. Both are noise-gated.")
     lines.append("")
 
@@ -748,7 +2163,7 @@ def render_summary_section(
         f"{snapshot.iterations_per_fixture}+{snapshot.warmup_per_fixture} iter · "
         f"head `{short_sha(head_sha)}` · base `{base_ref}`{base_note}"
     )
-    lane_history = lane_snapshots(history_snapshots, snapshot.lane)
+    lane_history = lane_snapshots(history, snapshot.lane)
     if lane_history:
         first_label = run_timestamp_label(lane_history[0])
         last_label = run_timestamp_label(lane_history[-1])
@@ -758,28 +2173,218 @@ def render_summary_section(
     lines.append("")
 
 
-def summarize_stage_delta(current: LevelStats, reference: LevelStats) -> tuple[str, float, float]:
+# Generation is the sequential encode → STT → rewrite path of one iteration; paste runs after it.
+CRITICAL_PATH_STAGES = ("encode", "stt", "rewrite")
+TAIL_QUANTILE = 0.90
+
+
+@dataclass(frozen=True)
+class TailAttribution:
+    """Mean stage time over the iterations at or above the generation p90 rank.
+
+    Built from aligned per-iteration samples, so stage times add up to the tail
+    generation time; "other" holds any residual (overlap or unrecorded gaps).
+    """
+
+    iterations: int
+    generation_ms: float
+    stages: dict[str, float]
+
+    @property
+    def driver(self) -> str:
+        return max(self.stages, key=lambda stage: self.stages[stage])
+
+    def share(self, stage: str) -> float:
+        return self.stages.get(stage, 0.0) / self.generation_ms * 100 if self.generation_ms > 0 else 0.0
+
+
+def tail_attribution(row: LevelStats, quantile: float = TAIL_QUANTILE) -> Optional[TailAttribution]:
+    """None unless every critical-path stage has one sample per generation sample."""
+    generation = row.generation.samples
+    columns = {stage: stage_dist(row, stage).samples for stage in CRITICAL_PATH_STAGES}
+    if len(generation) < MIN_TEST_SAMPLES or any(len(column) != len(generation) for column in columns.values()):
+        return None
+    # Nearest-rank-below cutoff keeps at least two iterations in the tail.
+    cutoff = sorted(generation)[int(quantile * (len(generation) - 1))]
+    tail = [index for index, value in enumerate(generation) if value >= cutoff]
+    count = len(tail)
+    stages = {stage: sum(column[index] for index in tail) / count for stage, column in columns.items()}
+    generation_ms = sum(generation[index] for index in tail) / count
+    residual = generation_ms - sum(stages.values())
+    if abs(residual) >= 0.5:
+        stages["other"] = residual
+    return TailAttribution(count, generation_ms, stages)
+
+
+def stage_deltas(current: LevelStats, reference: LevelStats) -> tuple[dict[str, float], float, str]:
+    """Per-stage deltas, net generation delta and method ("tail" or "p95").
+
+    Tail deltas come from the same iterations and add up to the net; stage p95s
+    come from different iterations, so their deltas need not add up to anything.
+    """
+    current_tail, reference_tail = tail_attribution(current), tail_attribution(reference)
+    if current_tail and reference_tail:
+        stages = dict.fromkeys([*current_tail.stages, *reference_tail.stages])
+        deltas = {
+            stage: current_tail.stages.get(stage, 0.0) - reference_tail.stages.get(stage, 0.0) for stage in stages
+        }
+        return deltas, current_tail.generation_ms - reference_tail.generation_ms, "tail"
     deltas = {
         "stt": current.stt.p95 - reference.stt.p95,
         "rewrite": current.rewrite.p95 - reference.rewrite.p95,
         "encode": current.encode.p95 - reference.encode.p95,
         "paste": current.paste.p95 - reference.paste.p95,
     }
+    return deltas, current.generation.p95 - reference.generation.p95, "p95"
+
+
+def summarize_stage_delta(current: LevelStats, reference: LevelStats) -> tuple[str, float, float, str]:
+    """Stage that moved most, its delta, its share (0-100%) and the method.
+
+    With samples ("tail") the share is the stage's part of the head's p90+ tail
+    generation time. Legacy p95 deltas need not add up to the net (and stages can
+    move in opposite directions), so there the share is of the summed absolute
+    stage movement instead of the net.
+    """
+    deltas, _, method = stage_deltas(current, reference)
     stage, delta = max(deltas.items(), key=lambda item: abs(item[1]))
-    net = current.generation.p95 - reference.generation.p95
-    share = (abs(delta) / abs(net) * 100) if abs(net) > 0 else 0.0
-    return stage, delta, share
+    if method == "tail":
+        tail = tail_attribution(current)
+        return stage, delta, min(100.0, max(0.0, tail.share(stage))) if tail else 0.0, method
+    moved = sum(abs(value) for value in deltas.values())
+    share = abs(delta) / moved * 100 if moved > 0 else 0.0
+    return stage, delta, share, method
+
+
+def tail_fields(row: LevelStats) -> dict[str, Any]:
+    tail = tail_attribution(row)
+    if tail is None:
+        return {}
+    return {
+        "tail_attribution": {
+            "quantile": TAIL_QUANTILE,
+            "iterations": tail.iterations,
+            "generation_ms": int(round(tail.generation_ms)),
+            "driver": tail.driver,
+            "stages": {
+                stage: {"ms": int(round(ms)), "share_pct": round(tail.share(stage), 1)} for stage, ms in tail.stages.items()
+            },
+        }
+    }
+
+
+@dataclass(frozen=True)
+class FixtureVerdict:
+    fixture_id: str
+    level: str
+    row: LevelStats
+    base_row: Optional[LevelStats]
+    vs_base: Optional[Comparison]
+    recent: list[float]  # this fixture's p95 history (master for provider, all runs for codepath), head excluded
+    vs_recent: Optional[str]
+
+    @property
+    def recent_median(self) -> Optional[float]:
+        return median(self.recent)
+
+
+def collect_fixture_verdicts(
+    snapshot: LaneSnapshot,
+    base_snapshot: Optional[LaneSnapshot],
+    history: HistoryIndex,
+    history_max: int,
+    policy: VerdictPolicy = DEFAULT_VERDICT_POLICY,
+) -> list[FixtureVerdict]:
+    """Generation-p95 verdicts per fixture, so a clip-length-specific regression is not
+    hidden in the aggregate (pooled samples, or byte-weighted percentiles for legacy
+    runs). Empty for single-fixture runs.
+
+    vs-base statuses come from collect_base_tests (Holm-adjusted with the aggregate)."""
+    if len(snapshot.fixtures) < 2:
+        return []
+    base_tests = collect_base_tests(snapshot, base_snapshot, policy)
+    base_fixtures = (
+        {fixture.fixture_id: fixture for fixture in base_snapshot.fixtures}
+        if base_snapshot and base_snapshot.lane == snapshot.lane and len(base_snapshot.fixtures) > 1
+        else {}
+    )
+    source = "master" if snapshot.lane == "provider" else None
+    verdicts: list[FixtureVerdict] = []
+    for fixture in snapshot.fixtures:
+        metric = fixture_metric("generation", fixture.fixture_id)
+        base_fixture = base_fixtures.get(fixture.fixture_id)
+        for level in LEVELS:
+            row = fixture.levels.get(level)
+            if row is None:
+                continue
+            base_row = base_fixture.levels.get(level) if base_fixture else None
+            vs_base = base_tests.get((fixture.fixture_id, level)) if base_row else None
+            recent = history.series(snapshot.lane, level, metric, history_max, source=source, exclude_snapshot=snapshot)
+            recent_median = median(recent)
+            vs_recent = (
+                change_status(
+                    row.generation.p95,
+                    recent_median,
+                    noise=variability(row.generation),
+                    threshold=policy.threshold(snapshot.lane, level, metric, paired=False),
+                )
+                if recent_median is not None
+                else None
+            )
+            verdicts.append(FixtureVerdict(fixture.fixture_id, level, row, base_row, vs_base, recent, vs_recent))
+    return verdicts
+
+
+def fixture_fields(verdicts: list[FixtureVerdict], level: str) -> dict[str, Any]:
+    fields: dict[str, Any] = {}
+    for verdict in verdicts:
+        if verdict.level != level:
+            continue
+        entry: dict[str, Any] = {"p95_ms": int(round(verdict.row.generation.p95))}
+        if verdict.vs_base:
+            entry["vs_base"] = {
+                "status": verdict.vs_base.status,
+                "delta_ms": int(round(verdict.vs_base.delta)),
+                "method": verdict.vs_base.method,
+            }
+            if verdict.vs_base.method == "permutation":
+                entry["vs_base"].update({"p_value": round(verdict.vs_base.p_value, 4), "p_adjust": "holm"})
+        if verdict.vs_recent:
+            entry["vs_recent_median"] = {
+                "status": verdict.vs_recent,
+                "delta_ms": int(round(verdict.row.generation.p95 - verdict.recent_median)),
+                "sample_runs": len(verdict.recent),
+            }
+        fields[verdict.fixture_id] = entry
+    return fields
+
+
+def quantile_fields(dist: Dist) -> dict[str, Any]:
+    fields: dict[str, Any] = {"p50_ms": int(round(dist.p50)), "p95_ms": int(round(dist.p95))}
+    if dist.p99 is not None:
+        fields["p99_ms"] = int(round(dist.p99))
+    if dist.samples:
+        fields["samples"] = len(dist.samples)
+    return fields
 
 
 def collect_critical_metrics(
     provider_snapshot: Optional[LaneSnapshot],
     codepath_snapshot: Optional[LaneSnapshot],
     base_snapshot: Optional[LaneSnapshot],
-    history_snapshots: list[LaneSnapshot],
+    history: HistoryIndex,
     history_max: int,
+    policy: VerdictPolicy = DEFAULT_VERDICT_POLICY,
 ) -> dict[str, Any]:
     level_metrics: dict[str, Any] = {}
     provider_statuses: list[str] = []
+    provider_fixtures = (
+        collect_fixture_verdicts(provider_snapshot, base_snapshot, history, history_max, policy) if provider_snapshot else []
+    )
+    provider_tests = collect_base_tests(provider_snapshot, base_snapshot, policy) if provider_snapshot else {}
+    codepath_fixtures = (
+        collect_fixture_verdicts(codepath_snapshot, None, history, history_max, policy) if codepath_snapshot else []
+    )
 
     for level in ["clean", "polish", "raw"]:
         provider_row = provider_snapshot.levels.get(level) if provider_snapshot else None
@@ -798,34 +2403,46 @@ def collect_critical_metrics(
 
         if provider_row:
             provider_entry: dict[str, Any] = {
-                "p95_ms": int(round(provider_row.generation.p95)),
+                **quantile_fields(provider_row.generation),
                 "confidence": confidence_label(
                     provider_row.iterations,
                     variability(provider_row.generation),
                     provider_row.generation.p95,
+                    policy.noise.sigma("provider", level, "generation") if policy.noise else None,
                 ),
+                **tail_fields(provider_row),
             }
 
             if base_row:
-                base_noise = max(variability(provider_row.generation), variability(base_row.generation))
-                status = change_status(provider_row.generation.p95, base_row.generation.p95, noise=base_noise)
+                comparison = provider_tests[(None, level)]
                 if level in {"clean", "polish"}:
-                    provider_statuses.append(status)
+                    provider_statuses.append(comparison.status)
                 provider_entry["vs_base"] = {
-                    "status": status,
-                    "delta_ms": int(round(provider_row.generation.p95 - base_row.generation.p95)),
+                    "status": comparison.status,
+                    "delta_ms": int(round(comparison.delta)),
                     "delta_pct": pct_delta(provider_row.generation.p95, base_row.generation.p95),
+                    "method": comparison.method,
                 }
+                if comparison.method == "permutation":
+                    provider_entry["vs_base"].update(
+                        {
+                            "p_value": round(comparison.p_value, 4),
+                            "p_adjust": "holm",
+                            "ci_ms": [int(round(comparison.ci_low)), int(round(comparison.ci_high))],
+                            "alpha": policy.alpha,
+                        }
+                    )
 
-                stage, delta, share = summarize_stage_delta(provider_row, base_row)
+                stage, delta, share, method = summarize_stage_delta(provider_row, base_row)
                 provider_entry["dominant_stage_vs_base"] = {
                     "stage": stage,
                     "delta_ms": int(round(delta)),
                     "share_pct": round(share, 1),
+                    "method": method,
                 }
 
             deployed_series = trend_series_filtered(
-                history_snapshots,
+                history,
                 lane="provider",
                 level=level,
                 metric="generation",
@@ -837,25 +2454,44 @@ def collect_critical_metrics(
             if deployed_median is not None:
                 deployed_noise = variability(provider_row.generation)
                 provider_entry["vs_deployed_median"] = {
-                    "status": change_status(provider_row.generation.p95, deployed_median, noise=deployed_noise),
+                    "status": change_status(
+                        provider_row.generation.p95,
+                        deployed_median,
+                        noise=deployed_noise,
+                        threshold=policy.threshold("provider", level, paired=False),
+                    ),
                     "delta_ms": int(round(provider_row.generation.p95 - deployed_median)),
                     "delta_pct": pct_delta(provider_row.generation.p95, deployed_median),
                     "sample_runs": len(deployed_series),
                 }
 
+            fixtures = fixture_fields(provider_fixtures, level)
+            if fixtures:
+                provider_entry["fixtures"] = fixtures
+                if level in {"clean", "polish"}:
+                    # A regression on one clip length counts even when the aggregate hides it,
+                    # but only from multiplicity-corrected tests; threshold verdicts stay advisory.
+                    provider_statuses.extend(
+                        entry["vs_base"]["status"]
+                        for entry in fixtures.values()
+                        if entry.get("vs_base", {}).get("method") == "permutation"
+                    )
+
             level_entry["provider"] = provider_entry
 
         if codepath_row:
             codepath_entry: dict[str, Any] = {
-                "p95_ms": int(round(codepath_row.generation.p95)),
+                **quantile_fields(codepath_row.generation),
                 "confidence": confidence_label(
                     codepath_row.iterations,
                     variability(codepath_row.generation),
                     codepath_row.generation.p95,
+                    policy.noise.sigma("codepath", level, "generation") if policy.noise else None,
                 ),
+                **tail_fields(codepath_row),
             }
             codepath_series = trend_series_filtered(
-                history_snapshots,
+                history,
                 lane="codepath",
                 level=level,
                 metric="generation",
@@ -866,11 +2502,19 @@ def collect_critical_metrics(
             if codepath_median is not None:
                 codepath_noise = variability(codepath_row.generation)
                 codepath_entry["vs_recent_median"] = {
-                    "status": change_status(codepath_row.generation.p95, codepath_median, noise=codepath_noise),
+                    "status": change_status(
+                        codepath_row.generation.p95,
+                        codepath_median,
+                        noise=codepath_noise,
+                        threshold=policy.threshold("codepath", level, paired=False),
+                    ),
                     "delta_ms": int(round(codepath_row.generation.p95 - codepath_median)),
                     "delta_pct": pct_delta(codepath_row.generation.p95, codepath_median),
                     "sample_runs": len(codepath_series),
                 }
+            fixtures = fixture_fields(codepath_fixtures, level)
+            if fixtures:
+                codepath_entry["fixtures"] = fixtures
             level_entry["codepath"] = codepath_entry
 
         if provider_row and codepath_row:
@@ -878,12 +2522,6 @@ def collect_critical_metrics(
 
         level_metrics[level] = level_entry
 
-    deployed_provider_runs = [
-        snapshot
-        for snapshot in history_snapshots
-        if snapshot.lane == "provider" and run_source_label(snapshot) == "master"
-    ]
-    codepath_runs = [snapshot for snapshot in history_snapshots if snapshot.lane == "codepath"]
 
     if any(status == "regressed" for status in provider_statuses):
         verdict = "regressed"
@@ -896,8 +2534,8 @@ def collect_critical_metrics(
         "verdict": verdict,
         "levels": level_metrics,
         "coverage": {
-            "provider_master_runs": len(deployed_provider_runs),
-            "codepath_runs": len(codepath_runs),
+            "provider_master_runs": history.count("provider", "master"),
+            "codepath_runs": history.count("codepath"),
         },
     }
 
@@ -944,6 +2582,15 @@ def render_executive_tldr(
         else:
             lines.append("- Codepath lane unavailable; internal/framework-only movement cannot be isolated.")
 
+        for level_name, provider_entry in (("clean", clean_provider), ("polish", polish_provider)):
+            tail = provider_entry.get("tail_attribution")
+            if tail:
+                driver = tail["driver"]
+                lines.append(
+                    f"- Provider {level_name} tail (≥p90, {tail['iterations']} iteration(s), mean {tail['generation_ms']}ms) "
+                    f"is driven by `{driver}` ({tail['stages'][driver]['share_pct']:.0f}%)."
+                )
+
         coverage = critical_metrics.get("coverage", {})
         lines.append(
             f"- Confidence context: provider master history={coverage.get('provider_master_runs', 0)} run(s), "
@@ -961,6 +2608,9 @@ def render_executive_tldr(
 
         provider_p95 = provider.get("p95_ms")
         provider_text = f"{provider_p95}ms" if isinstance(provider_p95, int) else "—"
+        provider_p99 = provider.get("p99_ms")
+        if isinstance(provider_p95, int) and isinstance(provider_p99, int):
+            provider_text += f" (p99 {provider_p99}ms)"
 
         vs_base_entry = provider.get("vs_base") or {}
         vs_base_status = vs_base_entry.get("status")
@@ -972,6 +2622,10 @@ def render_executive_tldr(
             vs_base_text = "neutral"
         else:
             vs_base_text = "—"
+        for fixture_id, fixture_entry in (provider.get("fixtures") or {}).items():
+            fixture_vs_base = fixture_entry.get("vs_base") or {}
+            if fixture_vs_base.get("status") == "regressed" and vs_base_status != "regressed":
+                vs_base_text += f"; `{fixture_id}` {fmt_signed_ms(float(fixture_vs_base.get('delta_ms', 0)))} ⚠️"
 
         codepath_p95 = codepath.get("p95_ms")
         codepath_text = f"{codepath_p95}ms" if isinstance(codepath_p95, int) else "—"
@@ -986,7 +2640,8 @@ def render_executive_tldr(
         if isinstance(dominant_stage, str) and isinstance(dominant_delta, int):
             dominant_text = f"{dominant_stage} {fmt_signed_ms(float(dominant_delta))}"
             if isinstance(dominant_share, (int, float)):
-                dominant_text += f" ({dominant_share:.0f}%)"
+                scope = " of p90+ tail" if dominant_entry.get("method") == "tail" else " of stage Δ"
+                dominant_text += f" ({dominant_share:.0f}%{scope})"
         else:
             dominant_text = "—"
 
@@ -1009,15 +2664,20 @@ def render_executive_tldr(
 def render_actionable_signals(
     lines: list[str],
     primary_snapshot: LaneSnapshot,
-    history_snapshots: list[LaneSnapshot],
+    history: HistoryIndex,
     history_max: int,
     base_snapshot: Optional[LaneSnapshot],
     codepath_snapshot: Optional[LaneSnapshot],
     changed_files: list[str],
+    policy: VerdictPolicy = DEFAULT_VERDICT_POLICY,
+    change_points: Optional[list[ChangePoint]] = None,
+    source_index: Optional[SourceIndex] = None,
 ) -> None:
     lines.append("## Actionable Signals")
     lines.append("")
     findings: list[str] = []
+    regressed_levels: set[str] = set()
+    base_tests = collect_base_tests(primary_snapshot, base_snapshot, policy)
 
     for level in LEVELS:
         row = primary_snapshot.levels.get(level)
@@ -1032,31 +2692,23 @@ def render_actionable_signals(
         if base_row is None:
             continue
 
-        status = change_status(
-            row.generation.p95,
-            base_row.generation.p95,
-            noise=max(variability(row.generation), variability(base_row.generation)),
-        )
-        if status != "regressed":
+        comparison = base_tests[(None, level)]
+        if comparison.status != "regressed":
             continue
+        regressed_levels.add(level)
 
-        total_delta = row.generation.p95 - base_row.generation.p95
-        stage_deltas = {
-            "stt": row.stt.p95 - base_row.stt.p95,
-            "rewrite": row.rewrite.p95 - base_row.rewrite.p95,
-            "encode": row.encode.p95 - base_row.encode.p95,
-            "paste": row.paste.p95 - base_row.paste.p95,
-        }
-        dominant_stage = max(stage_deltas, key=lambda stage: stage_deltas[stage])
-        dominant_delta = stage_deltas[dominant_stage]
-        contribution = (dominant_delta / total_delta * 100) if total_delta > 0 else 0.0
+        deltas, total_delta, method = stage_deltas(row, base_row)
+        driver = max(deltas, key=lambda stage: deltas[stage])
+        driver_delta = deltas[driver]
+        contribution = (driver_delta / total_delta * 100) if total_delta > 0 else 0.0
+        delta_scope = "of the p90+ tail delta" if method == "tail" else "of net delta"
 
         cross_lane_hint = ""
         if primary_snapshot.lane == "provider" and codepath_snapshot:
             codepath_row = codepath_snapshot.levels.get(level)
             if codepath_row is not None:
                 codepath_series = trend_series(
-                    history_snapshots,
+                    history,
                     "codepath",
                     level,
                     "generation",
@@ -1067,20 +2719,50 @@ def render_actionable_signals(
                         codepath_series[-1],
                         codepath_series[-2],
                         noise=variability(codepath_row.generation),
+                        threshold=policy.threshold("codepath", level),
                     )
                     if codepath_trend == "neutral":
                         cross_lane_hint = "codepath stable while provider regressed; likely external/provider variance."
                     elif codepath_trend == "regressed":
                         cross_lane_hint = "both provider and codepath moved; likely code-path change."
 
-        related_files = stage_related_files(changed_files, dominant_stage)
+        related_files = stage_related_files(changed_files, driver, source_index=source_index)
         files_hint = ", ".join(f"`{path}`" for path in related_files) if related_files else "no stage-specific file match"
+        evidence = fmt_comparison_evidence(comparison, policy.alpha)
+        evidence_hint = f" ({evidence})" if evidence else ""
         findings.append(
-            f"- `{level}` regressed by {fmt_change(row.generation.p95, base_row.generation.p95)}; "
-            f"largest stage delta is `{dominant_stage}` ({fmt_ms(dominant_delta)}, {contribution:.0f}% of net delta). "
+            f"- `{level}` regressed by {fmt_change(row.generation.p95, base_row.generation.p95)}{evidence_hint}; "
+            f"largest stage delta is `{driver}` ({fmt_ms(driver_delta)}, {contribution:.0f}% {delta_scope}). "
             f"Changed files: {files_hint}. {cross_lane_hint}".strip()
         )
 
+    for verdict in collect_fixture_verdicts(primary_snapshot, base_snapshot, history, history_max, policy):
+        if verdict.vs_base is None or verdict.vs_base.status != "regressed" or verdict.level in regressed_levels:
+            continue
+        row, base_row = verdict.row, verdict.base_row
+        deltas, _, _ = stage_deltas(row, base_row)
+        driver = max(deltas, key=lambda stage: deltas[stage])
+        related_files = stage_related_files(changed_files, driver, source_index=source_index)
+        files_hint = ", ".join(f"`{path}`" for path in related_files) if related_files else "no stage-specific file match"
+        evidence = fmt_comparison_evidence(verdict.vs_base, policy.alpha)
+        evidence_hint = f" ({evidence})" if evidence else ""
+        aggregate = primary_snapshot.levels.get(verdict.level)
+        aggregate_kind = "pooled" if aggregate and aggregate.generation.samples else "byte-weighted"
+        findings.append(
+            f"- `{verdict.level}` regressed on fixture `{verdict.fixture_id}` only: "
+            f"{fmt_change(row.generation.p95, base_row.generation.p95)}{evidence_hint}, masked in the {aggregate_kind} aggregate; "
+            f"largest stage delta is `{driver}` ({fmt_ms(deltas[driver])}). Changed files: {files_hint}."
+        )
+
+    recent_shifts = [point for point in change_points or [] if point.runs_since <= CHANGEPOINT_RECENT_RUNS]
+    for point in recent_shifts[:6]:
+        marker = " ⚠️" if point.delta > 0 else ""
+        findings.append(
+            f"- New `{point.lane}` master shift{marker}: `{point.level}` {point.metric} p95 "
+            f"{fmt_ms(point.before)} → {fmt_ms(point.after)} ({fmt_change(point.after, point.before)}) "
+            f"starting in {fmt_commit_range(point)}, held for the last {point.runs_since} master run(s)."
+        )
+
     if not findings:
         lines.append("- No level crossed regression thresholds versus base in this run.")
     else:
@@ -1088,8 +2770,146 @@ def render_actionable_signals(
     lines.append("")
 
 
-def maybe_generate_llm_synthesis(payload: dict[str, Any]) -> Optional[str]:
+SYNTHESIS_CACHE_DIR = Path(
+    os.environ.get("VOX_PERF_SYNTH_CACHE_DIR") or Path.home() / ".cache" / "vox" / "perf-synthesis"
+)
+SYNTHESIS_REQUEST_TIMEOUT_S = 20.0
+
+
+@dataclass(frozen=True)
+class Synthesis:
+    text: Optional[str]
+    model: Optional[str]
+    latency_s: float
+    source: str  # "cache", "primary", "hedge", "timeout" or "failed"
+
+
+def env_seconds(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.getenv(name, "") or default))
+    except ValueError:
+        return default
+
+
+def request_llm_synthesis(api_key: str, model: str, prompt: str, timeout: float) -> Optional[str]:
+    request_body = {
+        "model": model,
+        "messages": [
+            {
+                "role": "system",
+                "content": "Be strict, numeric, and avoid unsupported claims.",
+            },
+            {"role": "user", "content": prompt},
+        ],
+        "temperature": 0.0,
+        "max_tokens": 260,
+    }
+
+    url = "https://openrouter.ai/api/v1/chat/completions"
+    data = json.dumps(request_body).encode("utf-8")
+    req = urllib.request.Request(
+        url,
+        data=data,
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+        method="POST",
+    )
+
+    cassette = eval_cassette.current()
+    try:
+        if cassette is not None and cassette.replaying:
+            interaction = cassette.replay("POST", url, data)
+            cassette.pace(interaction)
+            if interaction["response"]["status"] != 200:
+                return None
+            raw = eval_cassette.decode_body(interaction).decode("utf-8")
+        else:
+            started = time.perf_counter()
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                body = resp.read()
+            if cassette is not None:
+                cassette.record(
+                    "POST", url, data, req.headers, resp.status, resp.headers, body, time.perf_counter() - started
+                )
+            raw = body.decode("utf-8")
+        decoded = json.loads(raw)
+        content = decoded.get("choices", [{}])[0].get("message", {}).get("content")
+        if isinstance(content, list):
+            content = "\n".join(str(item.get("text", "")) for item in content if isinstance(item, dict))
+        if not isinstance(content, str):
+            return None
+
+        lines = [line.strip() for line in content.strip().splitlines() if line.strip()]
+        bullet_lines = [line for line in lines if line.startswith("-")]
+        if len(bullet_lines) >= 3:
+            return "\n".join(bullet_lines[:3])
+
+        cleaned = content.strip()
+        return cleaned[:1800] if cleaned else None
+    except (
+        urllib.error.URLError,
+        TimeoutError,
+        eval_cassette.CassetteMiss,
+        json.JSONDecodeError,
+        KeyError,
+        IndexError,
+        UnicodeDecodeError,
+    ):
+        return None
+
+
+def hedged_synthesis(
+    api_key: str,
+    models: list[str],
+    prompt: str,
+    hedge_delay_s: float,
+    deadline_s: float,
+) -> tuple[Optional[str], Optional[str], str]:
+    """Fire the primary model, then the fallback after hedge_delay_s (or as soon as the
+    primary fails); keep the first usable answer. Nothing is awaited past deadline_s."""
+    started = time.monotonic()
+    deadline = started + deadline_s
+    pool = ThreadPoolExecutor(max_workers=len(models))
+    pending: dict[Future[Optional[str]], tuple[str, str]] = {}
+
+    def launch(index: int) -> None:
+        timeout = min(SYNTHESIS_REQUEST_TIMEOUT_S, max(0.1, deadline - time.monotonic()))
+        future = pool.submit(request_llm_synthesis, api_key, models[index], prompt, timeout)
+        pending[future] = (models[index], "primary" if index == 0 else "hedge")
+
+    try:
+        launch(0)
+        next_index = 1
+        while pending:
+            now = time.monotonic()
+            if now >= deadline:
+                return None, None, "timeout"
+            wait_for = deadline - now
+            if next_index < len(models):
+                wait_for = min(wait_for, max(0.0, started + hedge_delay_s * next_index - now))
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                model, source = pending.pop(future)
+                text = future.result()
+                if text:
+                    return text, model, source
+            hedge_due = time.monotonic() >= started + hedge_delay_s * next_index
+            if next_index < len(models) and (hedge_due or not pending):
+                launch(next_index)
+                next_index += 1
+        return None, None, "failed"
+    finally:
+        # In-flight requests are capped by the deadline-derived timeout; do not wait on them here.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def maybe_generate_llm_synthesis(payload: dict[str, Any], use_cache: bool = True) -> Optional[Synthesis]:
     api_key = os.getenv("OPENROUTER_API_KEY", "").strip()
+    if eval_cassette.replaying():
+        # Replayed requests never leave the machine; the key is not part of the fingerprint.
+        api_key = api_key or "replay"
     if not api_key:
         return None
 
@@ -1106,57 +2926,43 @@ def maybe_generate_llm_synthesis(payload: dict[str, Any]) -> Optional[str]:
     )
 
     synthesis_models = [
-        os.getenv("VOX_PERF_SYNTH_MODEL_PRIMARY", "google/gemini-3-flash-preview").strip(),
-        os.getenv("VOX_PERF_SYNTH_MODEL_FALLBACK", "google/gemini-2.5-flash").strip(),
-    ]
-
-    for model in synthesis_models:
-        if not model:
-            continue
-        request_body = {
-            "model": model,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "Be strict, numeric, and avoid unsupported claims.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": 0.0,
-            "max_tokens": 260,
-        }
-
-        req = urllib.request.Request(
-            "https://openrouter.ai/api/v1/chat/completions",
-            data=json.dumps(request_body).encode("utf-8"),
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            method="POST",
+        model
+        for model in (
+            os.getenv("VOX_PERF_SYNTH_MODEL_PRIMARY", "google/gemini-3-flash-preview").strip(),
+            os.getenv("VOX_PERF_SYNTH_MODEL_FALLBACK", "google/gemini-2.5-flash").strip(),
         )
+        if model
+    ]
+    if not synthesis_models:
+        return None
 
+    started = time.monotonic()
+    cache_key = hashlib.sha256(json.dumps([synthesis_models, prompt]).encode("utf-8")).hexdigest()
+    cache_path = SYNTHESIS_CACHE_DIR / f"{cache_key}.json"
+    if use_cache:
         try:
-            with urllib.request.urlopen(req, timeout=20) as resp:
-                raw = resp.read().decode("utf-8")
-            decoded = json.loads(raw)
-            content = decoded.get("choices", [{}])[0].get("message", {}).get("content")
-            if isinstance(content, list):
-                content = "\n".join(str(item.get("text", "")) for item in content if isinstance(item, dict))
-            if not isinstance(content, str):
-                continue
-
-            lines = [line.strip() for line in content.strip().splitlines() if line.strip()]
-            bullet_lines = [line for line in lines if line.startswith("-")]
-            if len(bullet_lines) >= 3:
-                return "\n".join(bullet_lines[:3])
-
-            cleaned = content.strip()
-            if cleaned:
-                return cleaned[:1800]
-        except (urllib.error.URLError, TimeoutError, json.JSONDecodeError, KeyError, IndexError, UnicodeDecodeError):
-            continue
-    return None
+            cached = load_json(cache_path)
+            if isinstance(cached.get("text"), str) and cached["text"]:
+                return Synthesis(cached["text"], cached.get("model"), time.monotonic() - started, "cache")
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    text, model, source = hedged_synthesis(
+        api_key,
+        synthesis_models,
+        prompt,
+        hedge_delay_s=env_seconds("VOX_PERF_SYNTH_HEDGE_SECONDS", 6.0),
+        deadline_s=env_seconds("VOX_PERF_SYNTH_DEADLINE_SECONDS", 25.0),
+    )
+    if text and use_cache:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".tmp{os.getpid()}")
+            tmp_path.write_text(json.dumps({"model": model, "text": text}), encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError as exc:
+            print(f"[perf-report] synthesis cache write failed: {exc}", file=sys.stderr)
+    return Synthesis(text, model, time.monotonic() - started, source)
 
 
 def render_fixture_table(lines: list[str], snapshot: LaneSnapshot) -> None:
@@ -1181,14 +2987,63 @@ def render_fixture_table(lines: list[str], snapshot: LaneSnapshot) -> None:
     lines.append("")
 
 
+def render_tail_attribution(lines: list[str], snapshot: LaneSnapshot) -> None:
+    tails = {level: tail for level in LEVELS if level in snapshot.levels and (tail := tail_attribution(snapshot.levels[level]))}
+    if not tails:
+        return
+    stages = [stage for stage in (*CRITICAL_PATH_STAGES, "other") if any(stage in tail.stages for tail in tails.values())]
+    lines.append(f"**Tail attribution (iterations ≥ generation p{TAIL_QUANTILE * 100:.0f}, mean ms and share)**")
+    lines.append("")
+    lines.append("| Level | Tail iters | Tail generation | " + " | ".join(STAGE_LABELS[stage] for stage in stages) + " | Drives tail |")
+    lines.append("| --- | ---: | ---: | " + " | ".join("---:" for _ in stages) + " | --- |")
+    for level, tail in tails.items():
+        cells = [
+            f"{fmt_ms(tail.stages[stage])} ({tail.share(stage):.0f}%)" if stage in tail.stages else "—" for stage in stages
+        ]
+        lines.append(
+            f"| {level} | {tail.iterations} | {fmt_ms(tail.generation_ms)} | " + " | ".join(cells) + f" | {STAGE_LABELS[tail.driver]} |"
+        )
+    lines.append("")
+
+
+def render_fixture_verdicts(lines: list[str], verdicts: list[FixtureVerdict], lane: str) -> None:
+    if not verdicts:
+        return
+    history_label = "master" if lane == "provider" else "lane"
+    lines.append(f"**Per-fixture verdicts (generation p95; trend = recent {history_label} runs, oldest → newest)**")
+    lines.append("")
+    if any(verdict.vs_base and verdict.vs_base.method == "permutation" for verdict in verdicts):
+        lines.append("> vs base tests are Holm-adjusted together with the aggregate level tests.")
+        lines.append("")
+    lines.append("| Fixture | Level | p95 | vs base | vs recent median | Trend |")
+    lines.append("| --- | --- | ---: | --- | --- | --- |")
+    for verdict in verdicts:
+        p95 = verdict.row.generation.p95
+        if verdict.vs_base and verdict.base_row:
+            vs_base = f"{fmt_change(p95, verdict.base_row.generation.p95)} · {verdict.vs_base.status}"
+            if verdict.vs_base.status == "regressed":
+                vs_base += " ⚠️"
+        else:
+            vs_base = "—"
+        recent_median = verdict.recent_median
+        vs_recent = f"{fmt_change(p95, recent_median)} · {verdict.vs_recent}" if recent_median is not None else "—"
+        lines.append(
+            f"| {verdict.fixture_id} | {verdict.level} | {fmt_ms(p95)} | {vs_base} | {vs_recent} | "
+            f"{fmt_points(verdict.recent[-8:]) if verdict.recent else '—'} |"
+        )
+    lines.append("")
+
+
 def render_lane_detail(
     lines: list[str],
     snapshot: LaneSnapshot,
-    history_snapshots: list[LaneSnapshot],
+    history: HistoryIndex,
     history_max: int,
     timeline_max: int,
     render_mermaid_charts: bool,
     base_snapshot: Optional[LaneSnapshot] = None,
+    change_points: Optional[list[ChangePoint]] = None,
+    policy: VerdictPolicy = DEFAULT_VERDICT_POLICY,
 ) -> None:
     """Detailed per-lane tables: stage breakdown, trend history, fixture breakdown, routing."""
     fixture_count = len(snapshot.fixtures)
@@ -1212,16 +3067,17 @@ def render_lane_detail(
             f"{fmt_ms(row.rewrite.p95)} | "
             f"{fmt_ms(row.encode.p95)} | "
             f"{fmt_ms(row.paste.p95)} | "
-            f"{dominant_stage(row.generation, row.stt, row.rewrite, row.encode, row.paste)} |"
+            f"{dominant_stage(row)} |"
         )
     lines.append("")
+    render_tail_attribution(lines, snapshot)
 
     lines.append("**Trend (generation p95, oldest → newest)**")
     lines.append("")
     lines.append("| Level | Points | Runs | Vs mean | Vs best |")
     lines.append("| --- | --- | ---: | --- | --- |")
     for level in LEVELS:
-        series = trend_series(history_snapshots, snapshot.lane, level, "generation", history_max)
+        series = trend_series(history, snapshot.lane, level, "generation", history_max)
         if not series:
             lines.append(f"| {level} | — | 0 | — | — |")
             continue
@@ -1235,7 +3091,7 @@ def render_lane_detail(
         )
     lines.append("")
 
-    lane_history = lane_snapshots(history_snapshots, snapshot.lane)
+    lane_history = lane_snapshots(history, snapshot.lane)
     if render_mermaid_charts:
         render_mermaid_trend_chart(lines, lane_history, snapshot.lane)
         render_stage_metric_chart(lines, lane_history, snapshot.lane, "stt", "STT")
@@ -1246,8 +3102,13 @@ def render_lane_detail(
         lines.append("_Mermaid charts omitted in CI for readability and render reliability._")
         lines.append("")
     render_run_timeline(lines, lane_history, max_rows=max(6, timeline_max))
+    if change_points is not None:
+        render_change_points(lines, change_points, min(history.count(snapshot.lane, "master"), CHANGEPOINT_WINDOW))
 
     render_fixture_table(lines, snapshot)
+    render_fixture_verdicts(
+        lines, collect_fixture_verdicts(snapshot, base_snapshot, history, history_max, policy), snapshot.lane
+    )
 
     if base_snapshot and base_snapshot.lane == snapshot.lane:
         lines.append("**Base branch comparison**")
@@ -1284,89 +3145,576 @@ def render_lane_detail(
     lines.append("")
 
 
-def main() -> None:
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--head", required=True, help="Primary head perf JSON path")
-    ap.add_argument("--codepath-head", required=False, help="Optional codepath lane perf JSON path")
-    ap.add_argument("--base", required=False, help="Base perf JSON path (optional)")
-    ap.add_argument("--out", required=False, help="Output markdown path (optional; else stdout)")
-    ap.add_argument("--base-sha", required=False, help="Resolved base SHA")
-    ap.add_argument("--requested-base-sha", required=False, help="Requested base SHA")
-    ap.add_argument("--base-mode", required=False, default="missing", help="exact|nearest_ancestor|missing")
-    ap.add_argument("--head-sha", required=False, help="Head SHA display override")
-    ap.add_argument("--history-dir", required=False, help="Directory containing prior perf JSON files (PR + master history)")
-    ap.add_argument("--history-max", required=False, type=int, default=24, help="Max points per trend series")
-    ap.add_argument("--timeline-max", required=False, type=int, default=16, help="Max rows in run timeline table")
-    ap.add_argument("--render-mermaid-charts", action="store_true", help="Render Mermaid charts in report details")
-    ap.add_argument("--changed-files", required=False, help="Optional path to changed-files list from git diff")
-    args = ap.parse_args()
+# ── bisect subcommand ────────────────────────────────────────────────────────
+# Chrome trace-event export of a perf run's per-iteration stage timings, in the
+# same format stt-eval/rewrite-bakeoff write with --trace (open in Perfetto).
 
-    head = load_json(Path(args.head))
-    codepath_head = load_json(Path(args.codepath_head)) if args.codepath_head else None
-    base = load_json(Path(args.base)) if args.base else None
+TRACE_STAGES = ("encode", "stt", "rewrite", "paste")
 
-    head_sha = args.head_sha or head.get("commitSHA")
-    requested_base_sha = args.requested_base_sha or args.base_sha
-    resolved_base_sha = args.base_sha or (base.get("commitSHA") if base else None)
-    base_mode = str(args.base_mode or "missing")
 
-    snapshots: dict[str, LaneSnapshot] = {}
-    head_snapshot = build_snapshot(head)
-    if head_snapshot:
-        snapshots[head_snapshot.lane] = head_snapshot
+def run_trace_events(run: dict[str, Any], pid: int) -> list[dict[str, Any]]:
+    """One process per run, one thread lane per fixture and level, one span per iteration.
 
-    if codepath_head:
-        cp_snapshot = build_snapshot(codepath_head)
-        if cp_snapshot:
-            snapshots[cp_snapshot.lane] = cp_snapshot
+    The perf JSON keeps durations, not timestamps: iterations are laid end to end
+    in recorded order (warmups and gaps are not recorded), with the stages
+    nested sequentially inside. Levels without samples get a single p50 iteration.
+    """
+    snapshot = build_snapshot(run)
+    if snapshot is None:
+        return []
+    tracks = [(fixture.fixture_id, fixture.levels) for fixture in snapshot.fixtures] or [
+        (Path(str(run.get("audioFile") or "audio")).stem, snapshot.levels)
+    ]
+    label = f"{snapshot.lane} @ {short_sha(snapshot.run.get('commitSHA'))}"
+    events: list[dict[str, Any]] = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": label}}]
+    clock = 0.0
+    tid = 0
+    for fixture_id, levels in tracks:
+        for level in LEVELS:
+            row = levels.get(level)
+            if row is None:
+                continue
+            tid += 1
+            events.append(
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": f"{fixture_id} · {level}"}}
+            )
+            columns = {stage: stage_dist(row, stage).samples for stage in TRACE_STAGES}
+            count = len(row.generation.samples)
+            aligned = count > 0 and all(len(column) in (0, count) for column in columns.values())
+            if aligned:
+                iterations = [
+                    (
+                        {stage: column[index] if column else 0.0 for stage, column in columns.items()},
+                        row.generation.samples[index],
+                    )
+                    for index in range(count)
+                ]
+            else:
+                iterations = [({stage: stage_dist(row, stage).p50 for stage in TRACE_STAGES}, row.generation.p50)]
+            for index, (stages, generation_ms) in enumerate(iterations, start=1):
+                start = clock
+                cursor = start
+                for stage in CRITICAL_PATH_STAGES:
+                    if stages[stage] > 0:
+                        events.append(trace_span(STAGE_LABELS[stage], "stage", cursor, stages[stage], pid, tid))
+                        cursor += stages[stage] * 1000
+                # Generation time not covered by encode/stt/rewrite (handoffs between stages).
+                other = generation_ms - sum(stages[stage] for stage in CRITICAL_PATH_STAGES)
+                if other >= 0.5:
+                    events.append(trace_span(STAGE_LABELS["other"], "stage", cursor, other, pid, tid))
+                    cursor += other * 1000
+                if stages["paste"] > 0:
+                    events.append(trace_span(STAGE_LABELS["paste"], "stage", cursor, stages["paste"], pid, tid))
+                    cursor += stages["paste"] * 1000
+                args = {"level": level, "fixture": fixture_id, "generation_ms": round(generation_ms, 1)}
+                if not aligned:
+                    args["synthetic"] = "p50 (no per-iteration samples)"
+                name = f"iteration {index}" if aligned else "p50"
+                events.append(trace_span(name, "iteration", start, (cursor - start) / 1000, pid, tid, args))
+                clock = cursor
+    return events
+
+
+def trace_span(
+    name: str, cat: str, start_us: float, dur_ms: float, pid: int, tid: int, args: Optional[dict[str, Any]] = None
+) -> dict[str, Any]:
+    return {
+        "name": name,
+        "cat": cat,
+        "ph": "X",
+        "ts": round(start_us, 1),
+        "dur": round(dur_ms * 1000, 1),
+        "pid": pid,
+        "tid": tid,
+        "args": args or {},
+    }
 
-    if not snapshots:
-        raise SystemExit("no valid lane snapshots found")
 
-    base_snapshot = build_snapshot(base) if base else None
+def trace_main(argv: list[str]) -> None:
+    ap = argparse.ArgumentParser(
+        prog="format-perf-report.py trace",
+        description="Convert perf JSON runs into a Chrome trace-event file (open in https://ui.perfetto.dev).",
+    )
+    ap.add_argument("runs", nargs="+", help="Perf JSON run path(s); each becomes one process in the trace")
+    ap.add_argument("--out", required=True, help="Trace JSON path")
+    args = ap.parse_args(argv)
 
-    history_runs = load_history_runs(Path(args.history_dir)) if args.history_dir else []
-    changed_files = load_changed_files(args.changed_files)
-    current_runs: list[dict[str, Any]] = [head]
-    if codepath_head:
-        current_runs.append(codepath_head)
-    trend_runs = dedupe_and_sort_runs(history_runs + current_runs)
-    history_snapshots = [snapshot for run in trend_runs if (snapshot := build_snapshot(run)) is not None]
-    history_max = max(2, args.history_max)
-    timeline_max = max(6, args.timeline_max)
-    render_mermaid_charts = bool(args.render_mermaid_charts)
+    events: list[dict[str, Any]] = []
+    for pid, path in enumerate(args.runs, start=1):
+        try:
+            run = load_json(Path(path))
+        except (OSError, ValueError) as exc:
+            raise SystemExit(f"cannot read {path}: {exc}")
+        run_events = run_trace_events(run, pid)
+        if not run_events:
+            print(f"[perf-report] {path}: no lane snapshot, skipped", file=sys.stderr)
+        events.extend(run_events)
+    payload = {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "otherData": {"tool": "format-perf-report", "runs": args.runs},
+    }
+    Path(args.out).write_text(dump_compact_json(payload), encoding="utf-8")
+    spans = sum(1 for event in events if event.get("cat") == "iteration")
+    print(f"wrote {spans} iteration span(s) from {len(args.runs)} run(s) to {args.out}", file=sys.stderr)
+
+
+BISECT_STAGES = ("stt", "rewrite", "encode", "paste")
+
+
+def git_lines(repo: Path, *args: str) -> list[str]:
+    try:
+        proc = subprocess.run(
+            ["git", "-C", str(repo), *args],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as exc:
+        detail = exc.stderr.strip() if isinstance(exc, subprocess.CalledProcessError) and exc.stderr else exc
+        raise SystemExit(f"git {' '.join(args)} failed: {detail}")
+    return [line for line in proc.stdout.splitlines() if line.strip()]
+
+
+def resolve_branch(repo: Path, branch: Optional[str]) -> str:
+    candidates = [branch] if branch else ["master", "origin/master", "main", "origin/main"]
+    for candidate in candidates:
+        proc = subprocess.run(
+            ["git", "-C", str(repo), "rev-parse", "--verify", "--quiet", f"{candidate}^{{commit}}"],
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode == 0:
+            return candidate
+    raise SystemExit(f"no branch found among {', '.join(candidates)} in {repo}")
+
+
+@dataclass(frozen=True)
+class CommitPoint:
+    sha: str
+    order: int  # index along first-parent history, oldest = 0
+    runs: int
+    level: LevelStats  # median-of-runs p95s are folded into one row per commit
+
+    def value(self, metric: str) -> float:
+        return metric_value(self.level, metric)
+
+
+def commit_points(
+    snapshots: list[LaneSnapshot],
+    lane: str,
+    level: str,
+    first_parent: list[str],
+) -> tuple[list[CommitPoint], int]:
+    """Master runs of one lane/level placed on the first-parent line; returns (points, unplaced runs)."""
+    order = {sha: index for index, sha in enumerate(first_parent)}
+    by_sha: dict[str, list[LevelStats]] = {}
+    unplaced = 0
+    for snapshot in snapshots:
+        if snapshot.lane != lane or run_source_label(snapshot) != "master":
+            continue
+        row = snapshot.levels.get(level)
+        if row is None:
+            continue
+        sha = str(snapshot.run.get("commitSHA") or "")
+        full = sha if sha in order else next((c for c in first_parent if sha and c.startswith(sha)), None)
+        if full is None:
+            unplaced += 1
+            continue
+        by_sha.setdefault(full, []).append(row)
+
+    points: list[CommitPoint] = []
+    for sha, rows in by_sha.items():
+        folded = rows[0]
+        if len(rows) > 1:
+            folded = LevelStats(
+                level=level,
+                iterations=sum(row.iterations for row in rows),
+                providers={},
+                **{
+                    metric: Dist(
+                        p50=median([stage_dist(row, metric).p50 for row in rows]) or 0.0,
+                        p95=median([stage_dist(row, metric).p95 for row in rows]) or 0.0,
+                        min=min(stage_dist(row, metric).min for row in rows),
+                        max=max(stage_dist(row, metric).max for row in rows),
+                    )
+                    for metric in STAGE_METRICS
+                },
+            )
+        points.append(CommitPoint(sha=sha, order=order[sha], runs=len(rows), level=folded))
+    points.sort(key=lambda point: point.order)
+    return points, unplaced
+
+
+def find_regression_split(
+    points: list[CommitPoint],
+    metric: str,
+    penalty: float,
+) -> Optional[tuple[int, int, int, float, float]]:
+    """Largest upward mean shift along commit order: (segment start, first bad index, segment end, before, after)."""
+    values = [point.value(metric) for point in points]
+    if len(values) < 2 * CHANGEPOINT_MIN_SEGMENT or max(values) - min(values) <= 0:
+        return None
+    sigma = robust_sigma(values)
+    bounds = [0, *pelt_mean_shift([value / sigma for value in values], penalty * math.log(len(values))), len(values)]
+    best: Optional[tuple[int, int, int, float, float]] = None
+    for left, change, right in zip(bounds, bounds[1:], bounds[2:]):
+        before = sum(values[left:change]) / (change - left)
+        after = sum(values[change:right]) / (right - change)
+        if after <= before or before <= 0 or (after - before) / before * 100 < CHANGEPOINT_MIN_SHIFT_PCT:
+            continue
+        if best is None or after - before > best[4] - best[3]:
+            best = (left, change, right, before, after)
+    return best
+
+
+def bisect_main(argv: list[str]) -> None:
+    ap = argparse.ArgumentParser(
+        prog="format-perf-report.py bisect",
+        description="Locate the narrowest first-parent commit range holding a perf regression in master history.",
+    )
+    ap.add_argument("--history-dir", required=True, help="Directory of persisted perf JSON runs")
+    ap.add_argument("--repo", default=".", help="Local git checkout to read the commit graph from")
+    ap.add_argument("--branch", help="First-parent line to order runs along (default: master/main, local or origin)")
+    ap.add_argument("--lane", choices=["provider", "codepath"], default="provider")
+    ap.add_argument("--level", choices=LEVELS, default="clean")
+    ap.add_argument("--metric", choices=STAGE_METRICS, default="generation")
+    ap.add_argument("--good", help="Known-good commit; restricts the search to runs after it")
+    ap.add_argument("--bad", help="Known-bad commit; restricts the search to runs up to it")
+    ap.add_argument("--penalty", type=float, default=CHANGEPOINT_PENALTY, help="Change-point penalty factor (x log n)")
+    ap.add_argument("--history-cache", help="Snapshot cache path (default: ~/.cache/vox/perf-history/<history-dir hash>.sqlite)")
+    ap.add_argument("--no-history-cache", action="store_true")
+    args = ap.parse_args(argv)
+
+    repo = Path(args.repo)
+    branch = resolve_branch(repo, args.branch)
+    first_parent = list(reversed(git_lines(repo, "rev-list", "--first-parent", branch)))
+    history_dir = Path(args.history_dir)
+    cache_path = None
+    if not args.no_history_cache:
+        cache_path = Path(args.history_cache) if args.history_cache else default_history_cache_path(history_dir)
+    snapshots = load_history_snapshots(history_dir, cache_path)
+    points, unplaced = commit_points(snapshots, args.lane, args.level, first_parent)
+
+    def position(ref: Optional[str]) -> Optional[int]:
+        if not ref:
+            return None
+        sha = git_lines(repo, "rev-parse", "--verify", f"{ref}^{{commit}}")[0]
+        if sha in first_parent:
+            return first_parent.index(sha)
+        # Off the first-parent line (e.g. a PR commit): use where it forked from the branch.
+        return first_parent.index(git_lines(repo, "merge-base", sha, branch)[0])
+
+    good_at, bad_at = position(args.good), position(args.bad)
+    points = [
+        point
+        for point in points
+        if (good_at is None or point.order >= good_at) and (bad_at is None or point.order <= bad_at)
+    ]
+
+    lines = [f"## Perf bisect — `{args.lane}` {args.level} {args.metric} p95 along `{branch}` (first-parent)", ""]
+    lines.append(
+        f"{len(points)} measured commit(s) from {len(snapshots)} history run(s); "
+        f"{unplaced} master run(s) not on the first-parent line were skipped."
+    )
+    lines.append("")
+
+    split = find_regression_split(points, args.metric, max(0.1, args.penalty))
+    if split is None:
+        lines.append("No upward step change detected in this range.")
+        print("\n".join(lines))
+        return
+
+    left, change, right, before, after = split
+    good, bad = points[change - 1], points[change]
+
+    def segment_mean(stage: str, start: int, end: int) -> float:
+        return sum(point.value(stage) for point in points[start:end]) / (end - start)
+
+    stage_shift = {
+        stage: segment_mean(stage, change, right) - segment_mean(stage, left, change) for stage in BISECT_STAGES
+    }
+    stage = max(stage_shift, key=lambda name: stage_shift[name])
+    between = first_parent[good.order + 1 : bad.order + 1]  # candidate culprits, oldest first
+
+    lines.append(
+        f"Regression {fmt_ms(before)} → {fmt_ms(after)} ({fmt_change(after, before)}) between "
+        f"last good `{short_sha(good.sha)}` ({fmt_ms(good.value(args.metric))}) and "
+        f"first bad `{short_sha(bad.sha)}` ({fmt_ms(bad.value(args.metric))})."
+    )
+    lines.append(f"Largest stage shift across the boundary (segment means): `{stage}` {fmt_signed_ms(stage_shift[stage])}.")
+    lines.append("")
+
+    lines.append(f"**Commits in range** (`{short_sha(good.sha)}..{short_sha(bad.sha)}`, {len(between)} first-parent commit(s))")
+    lines.append("")
+    subjects = dict(
+        line.split("\t", 1)
+        for line in git_lines(repo, "log", "--first-parent", "--format=%H%x09%s", f"{good.sha}..{bad.sha}")
+        if "\t" in line
+    )
+    for sha in between:
+        lines.append(f"- `{short_sha(sha)}` {subjects.get(sha, '')}".rstrip())
+    lines.append("")
+
+    changed_files = git_lines(repo, "diff", "--name-only", good.sha, bad.sha)
+    related = stage_related_files(changed_files, stage, limit=20, source_index=load_source_index(repo))
+    lines.append(f"**{stage}-related changed files** ({len(related)} of {len(changed_files)} changed)")
+    lines.append("")
+    if related:
+        lines.extend(f"- `{path}`" for path in related)
+    else:
+        lines.append("- none matched")
+    lines.append("")
+
+    if len(between) <= 1:
+        lines.append(f"Range is a single commit: `{short_sha(bad.sha)}` introduced the shift.")
+    else:
+        midpoint = between[(len(between) - 1) // 2]
+        lines.append(
+            f"Next: benchmark midpoint `{short_sha(midpoint)}` "
+            f"({len(between) - 1} unmeasured commit(s) in range, ~{math.ceil(math.log2(len(between)))} more run(s) to isolate)."
+        )
+    print("\n".join(lines))
+
+
+def calibrate_main(argv: list[str]) -> None:
+    ap = argparse.ArgumentParser(
+        prog="format-perf-report.py calibrate",
+        description="Estimate per-(lane, level, stage) run-to-run p95 noise from master history.",
+    )
+    ap.add_argument("--history-dir", required=True, help="Directory of persisted perf JSON runs")
+    ap.add_argument("--out", help="Noise model JSON path (default: stdout)")
+    ap.add_argument("--window", type=int, default=NOISE_CALIBRATION_WINDOW, help="Newest master runs per series")
+    ap.add_argument("--history-cache", help="Snapshot cache path (default: ~/.cache/vox/perf-history/<history-dir hash>.sqlite)")
+    ap.add_argument("--no-history-cache", action="store_true")
+    args = ap.parse_args(argv)
+
+    history_dir = Path(args.history_dir)
+    cache_path = None
+    if not args.no_history_cache:
+        cache_path = Path(args.history_cache) if args.history_cache else default_history_cache_path(history_dir)
+    history = HistoryIndex(dedupe_and_sort_snapshots(load_history_snapshots(history_dir, cache_path)))
+    model = calibrate_noise(history, window=max(NOISE_MIN_RUNS, args.window))
+    payload = json.dumps(noise_model_to_json(model), indent=2) + "\n"
+    if args.out:
+        Path(args.out).write_text(payload)
+        print(f"wrote {len(model.estimates)} noise estimate(s) to {args.out}", file=sys.stderr)
+    else:
+        sys.stdout.write(payload)
+
+
+REPORT_JSON_SCHEMA = "vox-perf-report"
+# Bump on any change that removes, renames or retypes a field; adding fields keeps the version.
+REPORT_JSON_VERSION = 1
+
+
+def dist_fields(dist: Dist) -> dict[str, Any]:
+    return {**quantile_fields(dist), "min_ms": int(round(dist.min)), "max_ms": int(round(dist.max))}
+
+
+def comparison_fields(comparison: Comparison, current: float, reference: float, alpha: float) -> dict[str, Any]:
+    fields: dict[str, Any] = {
+        "status": comparison.status,
+        "delta_ms": int(round(comparison.delta)),
+        "delta_pct": pct_delta(current, reference),
+        "method": comparison.method,
+    }
+    if comparison.method == "permutation":
+        fields["p_value"] = round(comparison.p_value, 4)
+        fields["ci_ms"] = [int(round(comparison.ci_low)), int(round(comparison.ci_high))]
+        fields["alpha"] = alpha
+    return fields
+
+
+def collect_report_json(
+    lane_runs: dict[str, list[LaneSnapshot]],
+    base_snapshot: Optional[LaneSnapshot],
+    history: HistoryIndex,
+    policy: VerdictPolicy,
+    critical_metrics: Optional[dict[str, Any]],
+    *,
+    change_points: dict[str, list[ChangePoint]],
+    budget_results: Optional[list[BudgetResult]],
+    head_sha: Optional[str],
+    base_sha: Optional[str],
+    requested_base_sha: Optional[str],
+    base_mode: str,
+    history_max: int,
+) -> dict[str, Any]:
+    """Machine-readable report: every lane/level/stage with its base comparison, trend and verdicts.
+
+    Trend semantics match the markdown: provider stages compare to the recent
+    master median, codepath stages to the recent median of every run.
+    """
+    lanes: dict[str, Any] = {}
+    for lane in ("provider", "codepath"):
+        if lane not in lane_runs:
+            continue
+        snapshot = merge_snapshots(lane_runs[lane])
+        base = base_snapshot if base_snapshot and base_snapshot.lane == lane else None
+        trend_source = "master" if lane == "provider" else None
+        base_tests = collect_base_tests(snapshot, base, policy)
+        levels: dict[str, Any] = {}
+        for level in LEVELS:
+            row = snapshot.levels.get(level)
+            if row is None:
+                continue
+            base_row = base.levels.get(level) if base else None
+            stages: dict[str, Any] = {}
+            for metric in STAGE_METRICS:
+                dist = stage_dist(row, metric)
+                entry = dist_fields(dist)
+                if base_row:
+                    base_dist = stage_dist(base_row, metric)
+                    if metric == "generation":
+                        # The verdict-bearing test: same Holm-adjusted result as critical_metrics.
+                        comparison = base_tests[(None, level)]
+                    else:
+                        comparison = compare_dists(dist, base_dist, policy, (lane, level, metric))
+                    entry["vs_base"] = comparison_fields(comparison, dist.p95, base_dist.p95, policy.alpha)
+                    if metric == "generation" and comparison.method == "permutation":
+                        entry["vs_base"]["p_adjust"] = "holm"
+                series = history.series(
+                    lane, level, metric, history_max, source=trend_source, exclude_snapshot=snapshot
+                )
+                trend_median = median(series)
+                if trend_median is not None:
+                    entry["trend"] = {
+                        "source": trend_source or "all",
+                        "runs": len(series),
+                        "median_ms": int(round(trend_median)),
+                        "delta_ms": int(round(dist.p95 - trend_median)),
+                        "delta_pct": pct_delta(dist.p95, trend_median),
+                        "status": change_status(
+                            dist.p95,
+                            trend_median,
+                            noise=variability(dist),
+                            threshold=policy.threshold(lane, level, metric, paired=False),
+                        ),
+                    }
+                sigma = policy.noise.sigma(lane, level, metric) if policy.noise else None
+                if sigma is not None:
+                    entry["noise_sigma_ms"] = round(sigma, 1)
+                stages[metric] = entry
+            level_entry: dict[str, Any] = {"iterations": row.iterations, "stages": stages, **tail_fields(row)}
+            critical = ((critical_metrics or {}).get("levels", {}).get(level) or {}).get(lane) or {}
+            for key in ("confidence", "fixtures"):
+                if key in critical:
+                    level_entry[key] = critical[key]
+            levels[level] = level_entry
+        lanes[lane] = {
+            "commit_sha": snapshot.run.get("commitSHA"),
+            "generated_at": snapshot.run.get("generatedAt"),
+            "runs": len(lane_runs[lane]),
+            "iterations_per_fixture": snapshot.iterations_per_fixture,
+            "fixtures": [fixture.fixture_id for fixture in snapshot.fixtures],
+            "stt_mode": snapshot.stt_mode,
+            "history": {"runs": history.count(lane), "master_runs": history.count(lane, "master")},
+            "levels": levels,
+            "change_points": [
+                {
+                    "level": point.level,
+                    "metric": point.metric,
+                    "before_ms": int(round(point.before)),
+                    "after_ms": int(round(point.after)),
+                    "last_good_commit": point.last_good_commit,
+                    "first_bad_commit": point.first_bad_commit,
+                    "runs_since": point.runs_since,
+                }
+                for point in change_points.get(lane, [])
+            ],
+        }
 
+    return {
+        "schema": REPORT_JSON_SCHEMA,
+        "schema_version": REPORT_JSON_VERSION,
+        "verdict": (critical_metrics or {}).get("verdict", "neutral"),
+        "head": {"commit_sha": head_sha},
+        "base": {
+            "commit_sha": base_sha,
+            "requested_sha": requested_base_sha,
+            "mode": base_mode,
+            "lane": base_snapshot.lane if base_snapshot else None,
+        },
+        "policy": {
+            "alpha": policy.alpha,
+            "resamples": policy.resamples,
+            "min_effect_ms": policy.min_effect_ms,
+            "noise_source": policy.noise.source if policy.noise else None,
+        },
+        "lanes": lanes,
+        "budgets": budget_verdict(budget_results) if budget_results is not None else None,
+        "critical_metrics": critical_metrics,
+    }
+
+
+def render_report(
+    lane_runs: dict[str, list[LaneSnapshot]],
+    base_snapshot: Optional[LaneSnapshot],
+    history: HistoryIndex,
+    policy: VerdictPolicy,
+    *,
+    change_points: dict[str, list[ChangePoint]],
+    changed_files: list[str],
+    source_index: Optional[SourceIndex],
+    budget_results: Optional[list[BudgetResult]],
+    head_sha: Optional[str],
+    base_sha: Optional[str],
+    base_mode: str,
+    history_max: int,
+    timeline_max: int,
+    render_mermaid_charts: bool = False,
+    use_synthesis_cache: bool = True,
+    synthesize: bool = True,
+    budgets_path: Optional[Path] = None,
+) -> tuple[str, Optional[dict[str, Any]]]:
+    """The PR comment markdown for one head (repeats merged per lane) against one base.
+
+    Also returns the critical metrics it was built from, for --json-out.
+    """
+    snapshots = {lane: merge_snapshots(runs) for lane, runs in lane_runs.items()}
     provider_snapshot = snapshots.get("provider")
     codepath_snapshot = snapshots.get("codepath")
     primary_snapshot = provider_snapshot or codepath_snapshot
 
     lines: list[str] = []
     lines.append("<!-- vox-perf-audit -->")
+    synthesis: Optional[Synthesis] = None
+    critical_metrics: Optional[dict[str, Any]] = None
 
     # ── Summary (always visible) ─────────────────────────────────────────────
     if primary_snapshot:
-        critical_metrics = collect_critical_metrics(
-            provider_snapshot=provider_snapshot,
-            codepath_snapshot=codepath_snapshot,
-            base_snapshot=base_snapshot,
-            history_snapshots=history_snapshots,
-            history_max=history_max,
-        )
+        with eval_profile.phase("scoring"):
+            critical_metrics = collect_critical_metrics(
+                provider_snapshot=provider_snapshot,
+                codepath_snapshot=codepath_snapshot,
+                base_snapshot=base_snapshot,
+                history=history,
+                history_max=history_max,
+                policy=policy,
+            )
         llm_payload = {
             "head": short_sha(head_sha),
-            "base": short_sha(resolved_base_sha) if resolved_base_sha else None,
+            "base": short_sha(base_sha) if base_sha else None,
             "base_mode": base_mode,
             "critical_metrics": critical_metrics,
             "changed_files": changed_files[:20],
         }
-        llm_tldr = maybe_generate_llm_synthesis(llm_payload)
+        if budget_results is not None:
+            llm_payload["budgets"] = budget_verdict(budget_results)
+        if any(len(runs) > 1 for runs in lane_runs.values()):
+            llm_payload["head_repeats"] = {lane: len(runs) for lane, runs in lane_runs.items()}
+        if synthesize:
+            with eval_profile.phase("network"):
+                synthesis = maybe_generate_llm_synthesis(llm_payload, use_cache=use_synthesis_cache)
+        llm_tldr = synthesis.text if synthesis else None
 
         render_executive_tldr(
             lines,
             critical_metrics=critical_metrics,
             llm_tldr=llm_tldr,
             head_sha=head_sha,
-            base_sha=resolved_base_sha,
+            base_sha=base_sha,
             base_mode=base_mode,
         )
 
@@ -1377,22 +3725,31 @@ def main() -> None:
         render_summary_section(
             lines,
             primary_snapshot,
-            history_snapshots,
+            history,
             base_snapshot,
             history_max,
             head_sha=head_sha,
-            base_sha=resolved_base_sha,
+            base_sha=base_sha,
             base_mode=base_mode,
+            policy=policy,
         )
         render_actionable_signals(
             lines,
             primary_snapshot=primary_snapshot,
-            history_snapshots=history_snapshots,
+            history=history,
             history_max=history_max,
             base_snapshot=base_snapshot,
             codepath_snapshot=codepath_snapshot,
             changed_files=changed_files,
+            policy=policy,
+            change_points=change_points["provider"] + change_points["codepath"],
+            source_index=source_index,
         )
+        for runs in lane_runs.values():
+            render_repeat_stability(lines, runs, base_snapshot, policy)
+        render_noise_calibration(lines, policy.noise)
+        if budget_results is not None:
+            render_budget_section(lines, budget_results, budgets_path or DEFAULT_BUDGETS_PATH)
 
         lines.append("**LLM payload (critical metrics)**")
         lines.append("")
@@ -1409,11 +3766,13 @@ def main() -> None:
         render_lane_detail(
             detail_lines,
             provider_snapshot,
-            history_snapshots,
+            history,
             history_max,
             timeline_max=timeline_max,
             render_mermaid_charts=render_mermaid_charts,
             base_snapshot=base_snapshot,
+            change_points=change_points["provider"],
+            policy=policy,
         )
         lines.append("<details>")
         lines.append("<summary>Provider Perf — stage breakdown, trend history, routing</summary>")
@@ -1436,10 +3795,12 @@ def main() -> None:
         render_lane_detail(
             cp_detail_lines,
             codepath_snapshot,
-            history_snapshots,
+            history,
             history_max,
             timeline_max=timeline_max,
             render_mermaid_charts=render_mermaid_charts,
+            change_points=change_points["codepath"],
+            policy=policy,
         )
         lines.append("<details>")
         lines.append("<summary>Codepath Perf (deterministic mock) — stage breakdown, trend history</summary>")
@@ -1448,11 +3809,534 @@ def main() -> None:
         lines.append("</details>")
         lines.append("")
 
-    out = "\n".join(lines)
+    if synthesis is not None:
+        if synthesis.text:
+            via = "cached" if synthesis.source == "cache" else synthesis.source
+            lines.append(f"> LLM synthesis: `{synthesis.model}` ({via}) in {synthesis.latency_s:.1f}s")
+        else:
+            lines.append(f"> LLM synthesis: no answer ({synthesis.source}) after {synthesis.latency_s:.1f}s; metrics TL;DR shown")
+        lines.append("")
+
+    return "\n".join(lines), critical_metrics
+
+
+# Watch mode: one long-lived process keeps parsed runs, the history index and
+# per-lane noise/change points in memory, re-reads only files that changed, and
+# re-renders only the PRs that received new runs.
+
+WATCH_POLL_SECONDS = 5.0
+WATCH_BASE_MODE = "preceding_master"  # base = newest master run of the lane before the PR head
+
+
+@dataclass(frozen=True)
+class WatchedFile:
+    size: int
+    mtime_ns: int
+    digest: str
+    snapshot: Optional[LaneSnapshot]
+
+
+class WatchState:
+    """In-memory history for `watch`, updated per changed file rather than per report."""
+
+    def __init__(self, history_dir: Path, jobs: Optional[int] = None, changepoint_penalty: float = CHANGEPOINT_PENALTY) -> None:
+        self.history_dir = history_dir
+        self.jobs = jobs
+        self.changepoint_penalty = changepoint_penalty
+        self.files: dict[str, WatchedFile] = {}
+        self.history = HistoryIndex([])
+        self.pr_runs: dict[int, list[LaneSnapshot]] = {}
+        self.noise_estimates: dict[str, dict[str, NoiseEstimate]] = {}
+        self.change_points: dict[str, list[ChangePoint]] = {"provider": [], "codepath": []}
+        self.rebuilds = 0
+
+    @property
+    def noise(self) -> NoiseModel:
+        return NoiseModel(
+            {key: estimate for estimates in self.noise_estimates.values() for key, estimate in estimates.items()},
+            source="history",
+        )
+
+    def scan(self) -> set[int]:
+        """Apply added, changed and removed history files; returns PR numbers that got new runs."""
+        current: dict[str, os.stat_result] = {}
+        try:
+            entries = sorted(os.scandir(self.history_dir), key=lambda entry: entry.name)
+        except OSError as exc:
+            print(f"[perf-report] watch: cannot list {self.history_dir}: {exc}", file=sys.stderr)
+            return set()
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                if entry.is_file():
+                    current[entry.path] = entry.stat()
+            except OSError:
+                continue
+
+        pending = [
+            path
+            for path, st in current.items()
+            if (known := self.files.get(path)) is None or (known.size, known.mtime_ns) != (st.st_size, st.st_mtime_ns)
+        ]
+        rebuild = False
+        added: list[LaneSnapshot] = []
+        for path, (digest, compact, error) in zip(pending, ingest_history_files([Path(path) for path in pending], jobs=self.jobs)):
+            if error is not None:
+                # Usually a file still being written: leave it unrecorded so the next poll retries it.
+                print(f"[perf-report] skipped history file {path}: {error}", file=sys.stderr)
+                continue
+            st = current[path]
+            previous = self.files.get(path)
+            if previous and previous.digest == digest:
+                self.files[path] = replace(previous, size=st.st_size, mtime_ns=st.st_mtime_ns)
+                continue
+            snapshot = snapshot_from_compact(parse_json_bytes(compact)) if compact else None
+            self.files[path] = WatchedFile(st.st_size, st.st_mtime_ns, digest, snapshot)
+            rebuild = rebuild or bool(previous and previous.snapshot)
+            if snapshot:
+                added.append(snapshot)
+        for path in [path for path in self.files if path not in current]:
+            rebuild = rebuild or self.files.pop(path).snapshot is not None
+
+        eval_profile.switch("aggregation")
+        added.sort(key=lambda snapshot: run_order_key(snapshot.run))
+        if not rebuild and added and self.history.snapshots:
+            newest = run_order_key(self.history.snapshots[-1].run)
+            rebuild = run_order_key(added[0].run) < newest or any(map(self.history.contains, added))
+        if rebuild:
+            self.rebuilds += 1
+            self.history = HistoryIndex(
+                dedupe_and_sort_snapshots([known.snapshot for _, known in sorted(self.files.items()) if known.snapshot])
+            )
+            self.pr_runs = {}
+            for snapshot in self.history.snapshots:
+                self._track_pr(snapshot)
+            stale_lanes = {"provider", "codepath"}
+        else:
+            for snapshot in added:
+                self.history.append(snapshot)
+                self._track_pr(snapshot)
+            stale_lanes = {snapshot.lane for snapshot in added if run_source_label(snapshot) == "master"}
+
+        for lane in stale_lanes:
+            self.noise_estimates[lane] = calibrate_noise(self.history, lanes=(lane,)).estimates
+            self.change_points[lane] = detect_change_points(self.history, lane, penalty=max(0.1, self.changepoint_penalty))
+        return {
+            number
+            for snapshot in added
+            if isinstance(number := snapshot.run.get("pullRequestNumber"), int) and number > 0
+        }
+
+    def _track_pr(self, snapshot: LaneSnapshot) -> None:
+        number = snapshot.run.get("pullRequestNumber")
+        if isinstance(number, int) and number > 0:
+            self.pr_runs.setdefault(number, []).append(snapshot)
+
+    def pr_mtimes_ns(self) -> dict[int, int]:
+        """Newest file mtime per PR number."""
+        newest: dict[int, int] = {}
+        for known in self.files.values():
+            number = known.snapshot.run.get("pullRequestNumber") if known.snapshot else None
+            if isinstance(number, int) and number > 0:
+                newest[number] = max(newest.get(number, 0), known.mtime_ns)
+        return newest
+
+    def pr_inputs(self, number: int) -> tuple[dict[str, list[LaneSnapshot]], Optional[LaneSnapshot]]:
+        """Head runs of the PR's newest commit per lane, and the master run that preceded them."""
+        runs = self.pr_runs.get(number, [])
+        if not runs:
+            return {}, None
+        head_sha = runs[-1].run.get("commitSHA")
+        lane_runs: dict[str, list[LaneSnapshot]] = {}
+        for snapshot in runs:
+            if snapshot.run.get("commitSHA") == head_sha:
+                lane_runs.setdefault(snapshot.lane, []).append(snapshot)
+        lane = "provider" if "provider" in lane_runs else "codepath"
+        cutoff = run_order_key(lane_runs[lane][0].run)
+        base = next(
+            (
+                snapshot
+                for snapshot in reversed(self.history.lane(lane))
+                if run_source_label(snapshot) == "master" and run_order_key(snapshot.run) <= cutoff
+            ),
+            None,
+        )
+        return lane_runs, base
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def watch_main(argv: list[str]) -> None:
+    ap = argparse.ArgumentParser(
+        prog="format-perf-report.py watch",
+        description=(
+            "Keep --history-dir in memory and write out-dir/pr-<number>.md whenever a PR gets new runs. "
+            "Files are polled; only added or changed files are parsed."
+        ),
+    )
+    ap.add_argument("--history-dir", required=True, help="Directory of persisted perf JSON runs (PR + master)")
+    ap.add_argument("--out-dir", required=True, help="Directory for pr-<number>.md reports")
+    ap.add_argument("--poll-seconds", type=float, default=WATCH_POLL_SECONDS, help="Delay between directory scans")
+    ap.add_argument("--once", action="store_true", help="Scan once, write outstanding reports and exit")
+    ap.add_argument("--history-jobs", type=int, default=None, help="Worker processes for parsing new files")
+    ap.add_argument("--history-max", type=int, default=24, help="Max points per trend series")
+    ap.add_argument("--timeline-max", type=int, default=16, help="Max rows in run timeline table")
+    ap.add_argument("--noise-model", help="Noise model JSON from `calibrate` (default: recalibrated as master runs arrive)")
+    ap.add_argument("--changepoint-penalty", type=float, default=CHANGEPOINT_PENALTY)
+    ap.add_argument("--budgets", help=f"Latency budgets JSON (default: {DEFAULT_BUDGETS_PATH.name} when present)")
+    ap.add_argument("--no-synthesis", action="store_true", help="Never call the LLM for the TL;DR")
+    ap.add_argument("--json", action="store_true", help=f"Also write pr-<number>.json ({REPORT_JSON_SCHEMA} v{REPORT_JSON_VERSION})")
+    eval_profile.add_profile_argument(ap)
+    args = ap.parse_args(argv)
+    eval_profile.start_profile(args.profile, args.profile_interval_ms)
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    noise_override: Optional[NoiseModel] = None
+    if args.noise_model:
+        try:
+            noise_override = load_noise_model(Path(args.noise_model))
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            raise SystemExit(f"invalid noise model: {exc}")
+    budgets_path = Path(args.budgets) if args.budgets else DEFAULT_BUDGETS_PATH
+    budgets: Optional[list[Budget]] = None
+    if args.budgets or budgets_path.exists():
+        try:
+            budgets = load_budgets(budgets_path)
+        except (OSError, ValueError) as exc:
+            raise SystemExit(f"invalid budgets file: {exc}")
+
+    state = WatchState(Path(args.history_dir), args.history_jobs, args.changepoint_penalty)
+    first = True
+    try:
+        while True:
+            started = time.perf_counter()
+            runs_before, rebuilds_before = len(state.history.snapshots), state.rebuilds
+            eval_profile.reset_phases()
+            eval_profile.switch("load")
+            affected = state.scan()
+            eval_profile.switch("render")
+            if first:
+                # Everything is new on start-up: only catch up on PRs whose report is
+                # missing or older than their newest run.
+                affected = {
+                    number
+                    for number, mtime_ns in state.pr_mtimes_ns().items()
+                    if not (path := out_dir / f"pr-{number}.md").exists() or path.stat().st_mtime_ns < mtime_ns
+                }
+                first = False
+            policy = replace(DEFAULT_VERDICT_POLICY, noise=noise_override or state.noise)
+            for number in sorted(affected):
+                lane_runs, base_snapshot = state.pr_inputs(number)
+                if not lane_runs:
+                    continue
+                head_sha = next(iter(lane_runs.values()))[0].run.get("commitSHA")
+                merged = [merge_snapshots(lane_runs[lane]) for lane in ("provider", "codepath") if lane in lane_runs]
+                budget_results = check_budgets(budgets, merged, state.history) if budgets is not None else None
+                base_sha = base_snapshot.run.get("commitSHA") if base_snapshot else None
+                base_mode = WATCH_BASE_MODE if base_snapshot else "missing"
+                report, critical_metrics = render_report(
+                    lane_runs,
+                    base_snapshot,
+                    state.history,
+                    policy,
+                    change_points=state.change_points,
+                    changed_files=[],
+                    source_index=None,
+                    budget_results=budget_results,
+                    head_sha=head_sha,
+                    base_sha=base_sha,
+                    base_mode=base_mode,
+                    history_max=max(2, args.history_max),
+                    timeline_max=max(6, args.timeline_max),
+                    synthesize=not args.no_synthesis,
+                    budgets_path=budgets_path,
+                )
+                write_text_atomic(out_dir / f"pr-{number}.md", report)
+                if args.json:
+                    report_json = collect_report_json(
+                        lane_runs,
+                        base_snapshot,
+                        state.history,
+                        policy,
+                        critical_metrics,
+                        change_points=state.change_points,
+                        budget_results=budget_results,
+                        head_sha=head_sha,
+                        base_sha=base_sha,
+                        requested_base_sha=None,
+                        base_mode=base_mode,
+                        history_max=max(2, args.history_max),
+                    )
+                    write_text_atomic(out_dir / f"pr-{number}.json", json.dumps(report_json, indent=2, sort_keys=True) + "\n")
+            if affected or len(state.history.snapshots) != runs_before or state.rebuilds != rebuilds_before:
+                print(
+                    f"[perf-report] watch: {len(state.history.snapshots) - runs_before:+d} run(s) "
+                    f"({'full rebuild' if state.rebuilds != rebuilds_before else 'incremental'}), "
+                    f"{len(affected)} PR report(s) in {time.perf_counter() - started:.2f}s "
+                    f"[{eval_profile.phases().one_line()}]",
+                    file=sys.stderr,
+                )
+            if args.once:
+                return
+            time.sleep(max(0.1, args.poll_seconds))
+    except KeyboardInterrupt:
+        return
+
+
+def main() -> None:
+    if len(sys.argv) > 1 and sys.argv[1] == "bisect":
+        bisect_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "calibrate":
+        calibrate_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "watch":
+        watch_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "trace":
+        trace_main(sys.argv[2:])
+        return
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--head",
+        required=True,
+        nargs="+",
+        help="Primary head perf JSON path(s); repeated runs of one commit are merged",
+    )
+    ap.add_argument(
+        "--codepath-head",
+        required=False,
+        nargs="+",
+        default=[],
+        help="Optional codepath lane perf JSON path(s); repeated runs of one commit are merged",
+    )
+    ap.add_argument("--base", required=False, help="Base perf JSON path (optional)")
+    ap.add_argument("--out", required=False, help="Output markdown path (optional; else stdout)")
+    ap.add_argument(
+        "--json-out",
+        required=False,
+        help=f"Also write the structured report ({REPORT_JSON_SCHEMA} v{REPORT_JSON_VERSION}) to this JSON path",
+    )
+    ap.add_argument("--base-sha", required=False, help="Resolved base SHA")
+    ap.add_argument("--requested-base-sha", required=False, help="Requested base SHA")
+    ap.add_argument("--base-mode", required=False, default="missing", help="exact|nearest_ancestor|missing")
+    ap.add_argument("--head-sha", required=False, help="Head SHA display override")
+    ap.add_argument("--history-dir", required=False, help="Directory containing prior perf JSON files (PR + master history)")
+    ap.add_argument(
+        "--history-cache",
+        required=False,
+        help="Snapshot cache path (default: ~/.cache/vox/perf-history/<history-dir hash>.sqlite)",
+    )
+    ap.add_argument("--no-history-cache", action="store_true", help="Parse every history file from scratch")
+    ap.add_argument(
+        "--history-jobs",
+        type=int,
+        default=None,
+        help="Worker processes for parsing uncached history files (default: CPU count; 1 = serial)",
+    )
+    ap.add_argument("--history-max", required=False, type=int, default=24, help="Max points per trend series")
+    ap.add_argument("--timeline-max", required=False, type=int, default=16, help="Max rows in run timeline table")
+    ap.add_argument("--render-mermaid-charts", action="store_true", help="Render Mermaid charts in report details")
+    ap.add_argument("--changed-files", required=False, help="Optional path to changed-files list from git diff")
+    ap.add_argument(
+        "--verdict-alpha",
+        type=float,
+        default=DEFAULT_VERDICT_POLICY.alpha,
+        help="False-positive rate for sample-based head-vs-base verdicts",
+    )
+    ap.add_argument(
+        "--verdict-resamples",
+        type=int,
+        default=DEFAULT_VERDICT_POLICY.resamples,
+        help="Permutation/bootstrap resamples for sample-based verdicts",
+    )
+    ap.add_argument(
+        "--verdict-min-effect-ms",
+        type=float,
+        default=DEFAULT_VERDICT_POLICY.min_effect_ms,
+        help="Smallest p95 shift (ms) reported as a regression/improvement when significant, for lanes without calibrated noise",
+    )
+    ap.add_argument(
+        "--source-root",
+        default=str(REPO_ROOT),
+        help="Checkout whose Sources/ is indexed to map changed files to stages (default: this repository)",
+    )
+    ap.add_argument(
+        "--no-source-index",
+        action="store_true",
+        help="Map changed files to stages with path patterns instead of the Sources/ type index",
+    )
+    ap.add_argument(
+        "--noise-model",
+        required=False,
+        help="Noise model JSON from `calibrate` (default: calibrate from --history-dir master runs)",
+    )
+    ap.add_argument(
+        "--changepoint-penalty",
+        type=float,
+        default=CHANGEPOINT_PENALTY,
+        help="Change-point penalty factor (x log n) for master history shift detection",
+    )
+    ap.add_argument(
+        "--budgets",
+        required=False,
+        help=f"Latency budgets JSON (default: {DEFAULT_BUDGETS_PATH.relative_to(DEFAULT_BUDGETS_PATH.parents[2])} when present)",
+    )
+    ap.add_argument(
+        "--fail-on-budget",
+        action="store_true",
+        help=f"Print a JSON budget verdict to stderr and exit {BUDGET_FAILURE_EXIT} if any budget is exceeded",
+    )
+    ap.add_argument(
+        "--no-synthesis-cache",
+        action="store_true",
+        help="Always call the LLM for the TL;DR (default: reuse answers for identical payloads)",
+    )
+    eval_cassette.add_cassette_arguments(ap)
+    eval_profile.add_profile_argument(ap)
+    args = ap.parse_args()
+    eval_profile.start_profile(args.profile, args.profile_interval_ms)
+    try:
+        eval_cassette.configure(args)
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"invalid cassette: {exc}")
+    eval_profile.reset_phases()
+    eval_profile.switch("load")
+    if not 0 < args.verdict_alpha < 1:
+        ap.error("--verdict-alpha must be between 0 and 1")
+    policy = VerdictPolicy(
+        alpha=args.verdict_alpha,
+        resamples=max(100, args.verdict_resamples),
+        min_effect_ms=max(0.0, args.verdict_min_effect_ms),
+    )
+
+    head_runs = [load_json(Path(path)) for path in args.head]
+    codepath_runs = [load_json(Path(path)) for path in args.codepath_head]
+    head = head_runs[0]
+    base = load_json(Path(args.base)) if args.base else None
+
+    head_sha = args.head_sha or head.get("commitSHA")
+    requested_base_sha = args.requested_base_sha or args.base_sha
+    resolved_base_sha = args.base_sha or (base.get("commitSHA") if base else None)
+    base_mode = str(args.base_mode or "missing")
+
+    lane_runs: dict[str, list[LaneSnapshot]] = {}
+    for run in head_runs + codepath_runs:
+        snapshot = build_snapshot(run)
+        if snapshot:
+            lane_runs.setdefault(snapshot.lane, []).append(snapshot)
+    snapshots: dict[str, LaneSnapshot] = {}
+    for lane, runs in lane_runs.items():
+        commits = sorted({str(snapshot.run.get("commitSHA") or "") for snapshot in runs})
+        if len(commits) > 1:
+            raise SystemExit(
+                f"{lane} head runs span {len(commits)} commits ({', '.join(short_sha(sha) for sha in commits)}); "
+                "repeats must measure one commit"
+            )
+        snapshots[lane] = merge_snapshots(runs)
+
+    if not snapshots:
+        raise SystemExit("no valid lane snapshots found")
+
+    base_snapshot = build_snapshot(base) if base else None
+
+    history_dir = Path(args.history_dir) if args.history_dir else None
+    cache_path: Optional[Path] = None
+    if history_dir and not args.no_history_cache:
+        cache_path = Path(args.history_cache) if args.history_cache else default_history_cache_path(history_dir)
+    history_snapshots = load_history_snapshots(history_dir, cache_path, args.history_jobs)
+    changed_files = load_changed_files(args.changed_files)
+    source_index = None if args.no_source_index or not changed_files else load_source_index(Path(args.source_root))
+    eval_profile.switch("aggregation")
+    history = HistoryIndex(dedupe_and_sort_snapshots(history_snapshots + list(snapshots.values())))
+    if args.noise_model:
+        try:
+            noise = load_noise_model(Path(args.noise_model))
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            raise SystemExit(f"invalid noise model: {exc}")
+    else:
+        noise = calibrate_noise(history)
+    policy = replace(policy, noise=noise)
+    change_points = {
+        lane: detect_change_points(history, lane, penalty=max(0.1, args.changepoint_penalty))
+        for lane in ("provider", "codepath")
+    }
+    history_max = max(2, args.history_max)
+    timeline_max = max(6, args.timeline_max)
+    render_mermaid_charts = bool(args.render_mermaid_charts)
+
+    budgets_path = Path(args.budgets) if args.budgets else DEFAULT_BUDGETS_PATH
+    budget_results: Optional[list[BudgetResult]] = None
+    if args.budgets or budgets_path.exists():
+        try:
+            budgets = load_budgets(budgets_path)
+        except (OSError, ValueError) as exc:
+            raise SystemExit(f"invalid budgets file: {exc}")
+        budget_results = check_budgets(
+            budgets,
+            [snapshots[lane] for lane in ("provider", "codepath") if lane in snapshots],
+            history,
+        )
+    elif args.fail_on_budget:
+        raise SystemExit(f"--fail-on-budget needs a budgets file ({budgets_path} not found)")
+
+    eval_profile.switch("render")
+    out, critical_metrics = render_report(
+        lane_runs,
+        base_snapshot,
+        history,
+        policy,
+        change_points=change_points,
+        changed_files=changed_files,
+        source_index=source_index,
+        budget_results=budget_results,
+        head_sha=head_sha,
+        base_sha=resolved_base_sha,
+        base_mode=base_mode,
+        history_max=history_max,
+        timeline_max=timeline_max,
+        render_mermaid_charts=render_mermaid_charts,
+        # Cassettes must see the request, so a cached answer would hide it.
+        use_synthesis_cache=not args.no_synthesis_cache and eval_cassette.current() is None,
+        budgets_path=budgets_path,
+    )
     if args.out:
         Path(args.out).write_text(out, encoding="utf-8")
     else:
         print(out)
+    if args.json_out:
+        with eval_profile.phase("scoring"):
+            report_json = collect_report_json(
+                lane_runs,
+                base_snapshot,
+                history,
+                policy,
+                critical_metrics,
+                change_points=change_points,
+                budget_results=budget_results,
+                head_sha=head_sha,
+                base_sha=resolved_base_sha,
+                requested_base_sha=requested_base_sha,
+                base_mode=base_mode,
+                history_max=history_max,
+            )
+        Path(args.json_out).write_text(json.dumps(report_json, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    print(f"[perf-report] phases: {eval_profile.phases().one_line()}", file=sys.stderr)
+    if eval_cassette.current() is not None:
+        print(f"[perf-report] {eval_cassette.current().summary()}", file=sys.stderr)
+
+    if args.fail_on_budget and budget_results is not None:
+        verdict = budget_verdict(budget_results)
+        print(json.dumps(verdict, separators=(",", ":")), file=sys.stderr)
+        if verdict["status"] == "fail":
+            raise SystemExit(BUDGET_FAILURE_EXIT)
 
 
 if __name__ == "__main__":
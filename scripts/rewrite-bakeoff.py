@@ -5,21 +5,31 @@ for candidate rewrite models via OpenRouter.
 
 Usage:
     python3 scripts/rewrite-bakeoff.py [--iterations N] [--models model1,model2,...]
+    python3 scripts/rewrite-bakeoff.py --trace bakeoff.trace.json   # Perfetto/Chrome trace
+    python3 scripts/rewrite-bakeoff.py --profile /tmp/bakeoff          # cProfile + flamegraph stacks
+    python3 scripts/rewrite-bakeoff.py --replay-cassette bakeoff.cassette  # Offline replay
 
 Reads corpus from docs/performance/rewrite-corpus.json.
-Outputs markdown report to docs/performance/.
+Outputs markdown report to docs/performance/ and records the run in the
+eval results store (see scripts/eval_store.py).
 """
 
 import argparse
 import json
 import os
+import sqlite3
 import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 import numpy as np
-import requests
+
+import eval_cassette
+import eval_profile
+import eval_store
+import eval_trace
+from rewrite_gate import content_overlap, levenshtein_similarity
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 CORPUS_PATH = REPO_ROOT / "docs" / "performance" / "rewrite-corpus.json"
@@ -74,56 +84,12 @@ PROMPTS = {
     ),
 }
 
-# Quality metrics (mirrors RewriteQualityGate logic)
-STOP_WORDS = {
-    "a", "an", "the", "is", "it", "in", "on", "at", "to", "of",
-    "and", "or", "but", "so", "if", "do", "my", "me", "we", "he",
-    "she", "be", "am", "are", "was", "were", "has", "had", "have",
-    "i", "you", "for", "with", "as", "by", "this",
-    "that", "from", "up", "out", "just", "then", "than", "very",
-    "um", "uh", "like", "know", "mean", "basically", "actually",
-    "literally", "well", "right", "yeah", "ok", "okay",
-}
-
-
-def content_words(text):
-    import re
-    words = re.split(r"[^a-zA-Z0-9]+", text.lower())
-    return [w for w in words if len(w) >= 2 and w not in STOP_WORDS]
-
-
-def content_overlap(raw, candidate):
-    raw_words = content_words(raw)
-    if not raw_words:
-        return 1.0
-    cand_set = set(content_words(candidate))
-    matches = sum(1 for w in raw_words if w in cand_set)
-    return matches / len(raw_words)
-
-
-def levenshtein_similarity(raw, candidate):
-    a, b = raw.lower(), candidate.lower()
-    max_len = max(len(a), len(b))
-    if max_len == 0:
-        return 1.0
-    # Use numpy-optimized DP
-    if len(a) < len(b):
-        a, b = b, a
-    m, n = len(a), len(b)
-    prev = np.arange(n + 1, dtype=np.int32)
-    for i in range(1, m + 1):
-        curr = np.empty(n + 1, dtype=np.int32)
-        curr[0] = i
-        for j in range(1, n + 1):
-            cost = 0 if a[i - 1] == b[j - 1] else 1
-            curr[j] = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + cost)
-        prev = curr
-    distance = prev[n]
-    return 1.0 - (distance / max_len)
-
 
 def call_openrouter(api_key, model, system_prompt, transcript):
-    """Make a single OpenRouter API call. Returns (text, latency_s, cost, error)."""
+    """Make a single OpenRouter API call.
+
+    Returns (text, latency_s, cost, error, usage); usage holds token counts.
+    """
     url = "https://openrouter.ai/api/v1/chat/completions"
     body = {
         "model": model,
@@ -145,21 +111,24 @@ def call_openrouter(api_key, model, system_prompt, transcript):
 
     start = time.monotonic()
     try:
-        resp = requests.post(url, json=body, headers=headers, timeout=60)
+        resp = eval_cassette.post(url, json=body, headers=headers, timeout=60)
         latency = time.monotonic() - start
 
         if resp.status_code != 200:
-            return None, latency, 0, f"HTTP {resp.status_code}: {resp.text[:200]}"
+            return None, latency, 0, f"HTTP {resp.status_code}: {resp.text[:200]}", {}
 
         data = resp.json()
         text = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-        # Extract cost from usage metadata
+        # Extract cost and token counts from usage metadata
         usage = data.get("usage", {})
         cost = usage.get("total_cost", 0) or 0
-        return text, latency, cost, None
+        tokens = {
+            k: usage[k] for k in ("prompt_tokens", "completion_tokens") if isinstance(usage.get(k), int)
+        }
+        return text, latency, cost, None, tokens
     except Exception as e:
         latency = time.monotonic() - start
-        return None, latency, 0, str(e)
+        return None, latency, 0, str(e), {}
 
 
 def run_bakeoff(api_key, models, corpus, iterations, levels):
@@ -192,9 +161,16 @@ def run_bakeoff(api_key, models, corpus, iterations, levels):
                         end="",
                         flush=True,
                     )
-                    text, latency, cost, error = call_openrouter(
-                        api_key, model, prompt, entry["transcript"]
-                    )
+                    span_args = {"level": level, "entry": entry["id"], "iteration": iteration + 1}
+                    eval_trace.take_phases()
+                    with eval_trace.span(model, "request", span_args) as fields, eval_profile.phase("network"):
+                        text, latency, cost, error, tokens = call_openrouter(
+                            api_key, model, prompt, entry["transcript"]
+                        )
+                        fields["latency_s"] = round(latency, 3)
+                        if error:
+                            fields["error"] = error[:200]
+                    phases = eval_trace.take_phases()
                     if error:
                         print(f" ERROR: {error[:80]}")
                         results[level][model].append({
@@ -202,11 +178,13 @@ def run_bakeoff(api_key, models, corpus, iterations, levels):
                             "iteration": iteration + 1,
                             "error": error,
                             "latency": latency,
+                            **phases,
                         })
                     else:
-                        ratio = len(text) / max(len(entry["transcript"]), 1)
-                        lev = levenshtein_similarity(entry["transcript"], text)
-                        ovl = content_overlap(entry["transcript"], text)
+                        with eval_profile.phase("scoring"):
+                            ratio = len(text) / max(len(entry["transcript"]), 1)
+                            lev = levenshtein_similarity(entry["transcript"], text)
+                            ovl = content_overlap(entry["transcript"], text)
                         print(
                             f" {latency:.2f}s | ratio={ratio:.2f} "
                             f"lev={lev:.2f} ovl={ovl:.2f}"
@@ -216,13 +194,17 @@ def run_bakeoff(api_key, models, corpus, iterations, levels):
                             "iteration": iteration + 1,
                             "text": text,
                             "latency": latency,
+                            **phases,
                             "cost": cost,
+                            **tokens,
                             "ratio": ratio,
                             "levenshtein": lev,
                             "content_overlap": ovl,
                         })
-                    # Small delay to avoid rate limiting
-                    time.sleep(0.1)
+                    # Small delay to avoid rate limiting (nothing to limit when replaying)
+                    if not eval_cassette.replaying():
+                        with eval_trace.span("throttle", "wait"), eval_profile.phase("network"):
+                            time.sleep(0.1)
 
     return results
 
@@ -372,7 +354,19 @@ def main():
         default="clean,polish",
     )
     parser.add_argument("--output-suffix", type=str, default="")
+    parser.add_argument("--db", type=str, default=str(eval_store.DEFAULT_DB))
+    parser.add_argument("--no-db", action="store_true", help="Do not record this run in the results store")
+    parser.add_argument("--trace", metavar="PATH", help="Write a Chrome trace-event JSON of every request (open in Perfetto)")
+    eval_cassette.add_cassette_arguments(parser)
+    eval_profile.add_profile_argument(parser)
     args = parser.parse_args()
+    eval_profile.start_profile(args.profile, args.profile_interval_ms)
+    try:
+        cassette = eval_cassette.configure(args)
+    except (OSError, ValueError) as e:
+        parser.error(f"cannot open cassette: {e}")
+    eval_profile.reset_phases()
+    eval_profile.switch("load")
 
     # Load API key
     env_path = REPO_ROOT / ".env.local"
@@ -382,6 +376,9 @@ def main():
             if line.startswith("OPENROUTER_API_KEY="):
                 api_key = line.split("=", 1)[1].strip().strip('"').strip("'")
                 break
+    if eval_cassette.replaying():
+        # Replayed requests never leave the machine; the key is not part of the fingerprint.
+        api_key = api_key or "replay"
     if not api_key:
         print("ERROR: OPENROUTER_API_KEY not found in environment or .env.local")
         sys.exit(1)
@@ -403,11 +400,29 @@ def main():
     print()
 
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if args.trace:
+        eval_trace.enable("rewrite-bakeoff")
+    eval_profile.switch("aggregation")
     all_results = run_bakeoff(api_key, models, corpus, iterations, levels)
+    eval_profile.switch("render")
+    if args.trace:
+        eval_trace.current().write(args.trace, {"tool": "rewrite-bakeoff", "models": models, "levels": levels})
+        print(f"Trace: {args.trace}")
+    if cassette is not None:
+        print(cassette.summary())
 
     # Save raw results
-    date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    now = datetime.now(timezone.utc)
+    date_str = now.strftime("%Y-%m-%d")
     suffix = f"-{args.output_suffix}" if args.output_suffix else ""
+    if eval_cassette.replaying():
+        # Replayed latencies are scaled by --replay-speed; keep them apart from live runs.
+        suffix += "-replay"
+    # Keep earlier same-day runs instead of overwriting them.
+    run_number = 2
+    while (OUTPUT_DIR / f"bakeoff-raw-{date_str}{suffix}.json").exists():
+        date_str = f"{now:%Y-%m-%d}-{run_number}"
+        run_number += 1
     raw_path = OUTPUT_DIR / f"bakeoff-raw-{date_str}{suffix}.json"
     raw_data = {
         "timestamp": timestamp,
@@ -415,8 +430,11 @@ def main():
         "models": models,
         "levels": levels,
         "corpus_size": len(corpus),
+        "output_suffix": args.output_suffix or None,
         "results": {},
     }
+    if cassette is not None:
+        raw_data["cassette"] = {"mode": cassette.mode, "path": str(cassette.path), "replay_speed": cassette.replay_speed}
     for level, level_results in all_results.items():
         raw_data["results"][level] = {}
         for model, result_list in level_results.items():
@@ -424,11 +442,27 @@ def main():
     raw_path.write_text(json.dumps(raw_data, indent=2, default=str))
     print(f"\nRaw results: {raw_path}")
 
+    if eval_cassette.replaying():
+        print("Results store: skipped for replayed run")
+    elif not args.no_db:
+        try:
+            conn = eval_store.connect(args.db)
+            run_id = eval_store.record_bakeoff_run(conn, json.loads(json.dumps(raw_data, default=str)))
+            conn.close()
+            print(f"Results store: run {run_id} in {args.db}")
+        except sqlite3.Error as e:
+            print(f"WARNING: results store not updated ({e})")
+
     # Generate and save report
+    eval_profile.switch("aggregation")
     report = generate_report(all_results, models, iterations, len(corpus), timestamp)
+    eval_profile.switch("render")
     report_path = OUTPUT_DIR / f"rewrite-model-bakeoff-{date_str}{suffix}.md"
     report_path.write_text(report)
     print(f"Report: {report_path}")
+    print()
+    for line in eval_profile.phases().summary_lines():
+        print(line)
 
 
 if __name__ == "__main__":
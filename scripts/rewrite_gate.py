@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Batch RewriteQualityGate scorer — the gate's metrics and accept/reject
+decisions for large sets of (raw, candidate) rewrites.
+
+Usage:
+    python3 scripts/rewrite_gate.py score pairs.jsonl --level clean
+    python3 scripts/rewrite_gate.py score docs/performance/bakeoff-raw-*.json
+    python3 scripts/rewrite_gate.py score pairs.jsonl --out scores.jsonl --sweep-step 0.02 --sweep-steps 5
+    python3 scripts/rewrite_gate.py bench --pairs 1000000
+
+Inputs are JSONL rows {"raw": ..., "candidate": ..., "level": ...} (level
+falls back to --level), or bakeoff-raw-*.json files, whose outputs are
+scored against the transcripts in docs/performance/rewrite-corpus.json.
+
+Mirrors Sources/VoxCore/RewriteQualityGate.swift: both texts are trimmed,
+an empty candidate is rejected, an empty raw gets ratio 1, the length ratio
+must sit inside the level's bounds, and (except for raw) normalized
+Levenshtein similarity and content-word overlap must reach the level's
+thresholds. Swift counts grapheme clusters; here text is NFC-normalized and
+counted in code points, which agrees except for clusters NFC cannot
+compose (ZWJ emoji, flags, stacked combining marks).
+
+Scoring runs in a process pool (--jobs, default all cores). Levenshtein uses
+Myers' bit-parallel algorithm on Python ints, so each character of the
+longer text costs a handful of big-int operations instead of a DP row.
+Decisions and the threshold sweep are numpy operations over the metric
+arrays, so trying other thresholds never rescores.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+import unicodedata
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CORPUS_PATH = REPO_ROOT / "docs" / "performance" / "rewrite-corpus.json"
+
+GateThresholds = namedtuple("GateThresholds", "min_ratio max_ratio levenshtein content_overlap")
+
+# RewriteQualityGate.minimumRatio / maximumRatio / levenshteinThreshold / contentOverlapThreshold.
+GATE_THRESHOLDS = {
+    "raw": GateThresholds(0.0, None, 0.0, 0.0),
+    "clean": GateThresholds(0.6, 3.0, 0.3, 0.4),
+    "polish": GateThresholds(0.3, None, 0.2, 0.3),
+}
+
+# "not"/"no" intentionally excluded — negation tokens must survive overlap
+# scoring to catch semantic inversions (e.g. "not approving" → "approving").
+STOP_WORDS = frozenset({
+    "a", "an", "the", "is", "it", "in", "on", "at", "to", "of",
+    "and", "or", "but", "so", "if", "do", "my", "me", "we", "he",
+    "she", "be", "am", "are", "was", "were", "has", "had", "have",
+    "i", "you", "for", "with", "as", "by", "this",
+    "that", "from", "up", "out", "just", "then", "than", "very",
+    "um", "uh", "like", "know", "mean", "basically", "actually",
+    "literally", "well", "right", "yeah", "ok", "okay",
+})
+
+# Runs of Unicode letters/digits (Swift: components(separatedBy: .alphanumerics.inverted)).
+WORD_RE = re.compile(r"[^\W_]+")
+
+CHUNK_PAIRS = 2000
+
+
+# ---------------------------------------------------------------------------
+# Metrics (one pair)
+# ---------------------------------------------------------------------------
+
+def content_words(text):
+    return [w for w in WORD_RE.findall(text.lower()) if len(w) >= 2 and w not in STOP_WORDS]
+
+
+def content_overlap(raw, candidate):
+    """Fraction of raw's content words found in candidate. 1.0 = all preserved."""
+    raw_words = content_words(raw)
+    if not raw_words:
+        return 1.0
+    cand_set = set(content_words(candidate))
+    return sum(1 for w in raw_words if w in cand_set) / len(raw_words)
+
+
+def levenshtein_distance(a, b):
+    """Edit distance via Myers' bit-vector algorithm (Hyyrö's formulation).
+
+    The shorter string is the bit pattern; one pass over the longer string
+    updates all of its columns at once.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    n = len(b)
+    if n == 0:
+        return len(a)
+    if a == b:
+        return 0
+    # Match masks keyed by every character of both strings, so the loop can
+    # map() lookups in C instead of calling dict.get per character.
+    peq = dict.fromkeys(a, 0)
+    bit = 1
+    for ch in b:
+        peq[ch] = peq.get(ch, 0) | bit
+        bit <<= 1
+    mask = bit - 1
+    last = 1 << (n - 1)
+    pv, mv, score = mask, 0, n
+    for eq in map(peq.__getitem__, a):
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        pv = ((mh << 1) | ~(xv | ph)) & mask
+        mv = ph & xv
+    return score
+
+
+def levenshtein_similarity(raw, candidate):
+    """Normalized Levenshtein similarity: 1.0 = identical, 0.0 = completely different."""
+    a, b = raw.lower(), candidate.lower()
+    max_len = max(len(a), len(b))
+    if max_len == 0:
+        return 1.0
+    return 1.0 - levenshtein_distance(a, b) / max_len
+
+
+def score_pair(raw, candidate, level):
+    """(ratio, levenshtein, content_overlap, candidate_empty); NaN where the gate skips a metric."""
+    raw = unicodedata.normalize("NFC", raw).strip()
+    candidate = unicodedata.normalize("NFC", candidate).strip()
+    if not candidate:
+        return 0.0, float("nan"), float("nan"), True
+    if not raw:
+        return 1.0, float("nan"), float("nan"), False
+    ratio = len(candidate) / len(raw)
+    if level == "raw":
+        return ratio, float("nan"), float("nan"), False
+    return ratio, levenshtein_similarity(raw, candidate), content_overlap(raw, candidate), False
+
+
+def evaluate(raw, candidate, level, thresholds=None):
+    """Single-pair RewriteQualityGate.evaluate: (accepted, ratio, levenshtein, content_overlap)."""
+    scores = score_pairs([raw], [candidate], level, jobs=1)
+    return bool(gate_decisions(scores, thresholds)[0]), *(
+        float(scores[key][0]) for key in ("ratio", "levenshtein", "content_overlap")
+    )
+
+
+# ---------------------------------------------------------------------------
+# Batch scoring
+# ---------------------------------------------------------------------------
+
+def _score_chunk(chunk):
+    raws, candidates, levels = chunk
+    return [score_pair(raw, candidate, level) for raw, candidate, level in zip(raws, candidates, levels)]
+
+
+def score_pairs(raws, candidates, levels, jobs=None):
+    """Gate metrics for every pair, as numpy arrays.
+
+    levels is one level name for all pairs or one per pair. Returns
+    {"level", "ratio", "levenshtein", "content_overlap", "candidate_empty"};
+    levenshtein/content_overlap are NaN where the gate does not compute them.
+    """
+    raws, candidates = list(raws), list(candidates)
+    if len(raws) != len(candidates):
+        raise ValueError(f"{len(raws)} raw texts but {len(candidates)} candidates")
+    levels = [levels] * len(raws) if isinstance(levels, str) else list(levels)
+    unknown = set(levels) - set(GATE_THRESHOLDS)
+    if unknown:
+        raise ValueError(f"unknown level(s): {', '.join(sorted(unknown))}")
+
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    size = max(1, min(CHUNK_PAIRS, -(-len(raws) // jobs)))
+    chunks = [
+        (raws[i:i + size], candidates[i:i + size], levels[i:i + size])
+        for i in range(0, len(raws), size)
+    ]
+    rows = None
+    if jobs > 1 and len(chunks) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                rows = [row for part in pool.map(_score_chunk, chunks) for row in part]
+        except (OSError, BrokenProcessPool) as e:
+            print(f"  parallel scoring unavailable ({e}); scoring serially", file=sys.stderr)
+    if rows is None:
+        rows = [row for chunk in chunks for row in _score_chunk(chunk)]
+
+    table = np.array([row[:3] for row in rows], dtype=np.float64).reshape(-1, 3)
+    return {
+        "level": np.array(levels, dtype=object),
+        "ratio": table[:, 0],
+        "levenshtein": table[:, 1],
+        "content_overlap": table[:, 2],
+        "candidate_empty": np.array([row[3] for row in rows], dtype=bool),
+    }
+
+
+def _threshold_arrays(level_array, thresholds):
+    """Per-pair threshold columns for the given {level: GateThresholds}."""
+    names, index = np.unique(level_array.astype(str), return_inverse=True)
+    table = np.array(
+        [
+            [
+                thresholds[name].min_ratio,
+                np.inf if thresholds[name].max_ratio is None else thresholds[name].max_ratio,
+                thresholds[name].levenshtein,
+                thresholds[name].content_overlap,
+            ]
+            for name in names
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 4)
+    return table[index].T
+
+
+def rejection_reasons(scores, thresholds=None):
+    """Boolean arrays per failing gate clause (a pair can fail several)."""
+    min_ratio, max_ratio, lev_threshold, overlap_threshold = _threshold_arrays(
+        scores["level"], thresholds or GATE_THRESHOLDS
+    )
+    scored = ~scores["candidate_empty"]
+    return {
+        "empty": scores["candidate_empty"],
+        "ratio_low": scored & (scores["ratio"] < min_ratio),
+        "ratio_high": scored & (scores["ratio"] > max_ratio),
+        # NaN (metric skipped) never compares below a threshold.
+        "levenshtein": scored & (scores["levenshtein"] < lev_threshold),
+        "content_overlap": scored & (scores["content_overlap"] < overlap_threshold),
+    }
+
+
+def gate_decisions(scores, thresholds=None):
+    """Accepted mask, as RewriteQualityGate.Decision.isAcceptable."""
+    rejected = np.zeros(len(scores["ratio"]), dtype=bool)
+    for mask in rejection_reasons(scores, thresholds).values():
+        rejected |= mask
+    return ~rejected
+
+
+def threshold_sweep(scores, step=0.05, steps=2):
+    """Rejection-rate shift per level when one threshold moves by ±k·step.
+
+    Returns rows {level, threshold, current, value, pairs, rejected_pct,
+    delta_pp, flipped}; flipped counts pairs whose decision changes.
+    """
+    baseline = gate_decisions(scores)
+    level_array = scores["level"].astype(str)
+    rows = []
+    for level in sorted(set(level_array)):
+        in_level = level_array == level
+        pairs = int(in_level.sum())
+        base_rejected = float((~baseline[in_level]).mean()) * 100
+        current = GATE_THRESHOLDS[level]
+        for field in GateThresholds._fields:
+            value = getattr(current, field)
+            if value is None or (level == "raw" and field in ("levenshtein", "content_overlap")):
+                continue
+            for k in range(-steps, steps + 1):
+                if k == 0:
+                    continue
+                moved = round(value + k * step, 6)
+                if moved < 0:
+                    continue
+                trial = dict(GATE_THRESHOLDS)
+                trial[level] = current._replace(**{field: moved})
+                accepted = gate_decisions(scores, trial)
+                rejected_pct = float((~accepted[in_level]).mean()) * 100
+                rows.append({
+                    "level": level,
+                    "threshold": field,
+                    "current": value,
+                    "value": moved,
+                    "pairs": pairs,
+                    "rejected_pct": rejected_pct,
+                    "delta_pp": rejected_pct - base_rejected,
+                    "flipped": int((accepted[in_level] != baseline[in_level]).sum()),
+                })
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Inputs
+# ---------------------------------------------------------------------------
+
+def load_pairs(paths, default_level=None, corpus_path=CORPUS_PATH):
+    """(raws, candidates, levels) from JSONL pair files and/or bakeoff-raw-*.json files."""
+    raws, candidates, levels = [], [], []
+    corpus = None
+    for path in map(Path, paths):
+        if path.suffix == ".json":
+            if corpus is None:
+                corpus = {e["id"]: e["transcript"] for e in json.loads(Path(corpus_path).read_text())["entries"]}
+            data = json.loads(path.read_text())
+            for level, by_model in (data.get("results") or {}).items():
+                for results in by_model.values():
+                    for result in results:
+                        if "error" in result or result.get("entry_id") not in corpus:
+                            continue
+                        raws.append(corpus[result["entry_id"]])
+                        candidates.append(result.get("text") or "")
+                        levels.append(level)
+            continue
+        with path.open(encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                level = row.get("level") or default_level
+                if not level:
+                    raise ValueError(f"{path}:{number}: no level (set one per row or pass --level)")
+                raws.append(row["raw"])
+                candidates.append(row["candidate"])
+                levels.append(level)
+    return raws, candidates, levels
+
+
+def synthetic_pairs(count, seed=0):
+    """Corpus transcripts with rewrite-like edits (drops, swaps, filler removal, case)."""
+    rng = random.Random(seed)
+    entries = [e for e in json.loads(CORPUS_PATH.read_text())["entries"] if e["level"] in GATE_THRESHOLDS]
+    raws, candidates, levels = [], [], []
+    for _ in range(count):
+        entry = rng.choice(entries)
+        words = entry["transcript"].split()
+        edited = [w for w in words if rng.random() > 0.15]
+        for _ in range(rng.randint(0, 3)):
+            if len(edited) > 1:
+                i = rng.randrange(len(edited) - 1)
+                edited[i], edited[i + 1] = edited[i + 1], edited[i]
+        candidate = " ".join(edited)
+        raws.append(entry["transcript"])
+        candidates.append(candidate.capitalize() if rng.random() < 0.5 else candidate)
+        levels.append(entry["level"])
+    return raws, candidates, levels
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def fmt_thresholds(t):
+    bounds = f"ratio ≥ {t.min_ratio:g}" if t.max_ratio is None else f"ratio {t.min_ratio:g}–{t.max_ratio:g}"
+    return f"{bounds}, lev ≥ {t.levenshtein:g}, overlap ≥ {t.content_overlap:g}"
+
+
+def print_summary(scores, elapsed, jobs):
+    n = len(scores["ratio"])
+    rate = n / elapsed if elapsed > 0 else float("inf")
+    print(f"Scored {n} pair(s) in {elapsed:.2f}s ({rate:,.0f} pairs/s, {jobs} worker(s))")
+    print()
+    accepted = gate_decisions(scores)
+    reasons = rejection_reasons(scores)
+    level_array = scores["level"].astype(str)
+    print("| Level | Pairs | Rejected | Empty | Ratio < min | Ratio > max | Levenshtein | Overlap | Thresholds |")
+    print("| --- | ---: | ---: | ---: | ---: | ---: | ---: | ---: | --- |")
+    for level in sorted(set(level_array)):
+        mask = level_array == level
+        counts = " | ".join(str(int(reasons[key][mask].sum())) for key in reasons)
+        print(
+            f"| {level} | {int(mask.sum())} | {float((~accepted[mask]).mean()):.1%} | {counts} | "
+            f"{fmt_thresholds(GATE_THRESHOLDS[level])} |"
+        )
+
+
+def print_sweep(rows):
+    print()
+    print("Threshold sensitivity (one threshold moved at a time):")
+    print()
+    print("| Level | Threshold | Current | Trial | Rejected | Δ pp | Flipped |")
+    print("| --- | --- | ---: | ---: | ---: | ---: | ---: |")
+    for row in rows:
+        print(
+            f"| {row['level']} | {row['threshold']} | {row['current']:g} | {row['value']:g} | "
+            f"{row['rejected_pct']:.1f}% | {row['delta_pp']:+.1f} | {row['flipped']} |"
+        )
+
+
+def write_scores(path, scores, accepted):
+    with Path(path).open("w", encoding="utf-8") as f:
+        for i in range(len(accepted)):
+            row = {"level": scores["level"][i], "accepted": bool(accepted[i])}
+            for key in ("ratio", "levenshtein", "content_overlap"):
+                value = float(scores[key][i])
+                row[key] = None if np.isnan(value) else round(value, 6)
+            f.write(json.dumps(row) + "\n")
+
+
+def run_scoring(args, raws, candidates, levels):
+    start = time.perf_counter()
+    scores = score_pairs(raws, candidates, levels, jobs=args.jobs)
+    print_summary(scores, time.perf_counter() - start, args.jobs)
+    if args.sweep_steps > 0:
+        print_sweep(threshold_sweep(scores, step=args.sweep_step, steps=args.sweep_steps))
+    if getattr(args, "out", None):
+        write_scores(args.out, scores, gate_decisions(scores))
+        print(f"\nScores: {args.out}")
+
+
+def cmd_score(args):
+    raws, candidates, levels = load_pairs(args.files, args.level, args.corpus)
+    if not raws:
+        print("No pairs to score.")
+        return
+    run_scoring(args, raws, candidates, levels)
+
+
+def cmd_bench(args):
+    start = time.perf_counter()
+    raws, candidates, levels = synthetic_pairs(args.pairs, args.seed)
+    print(f"Generated {len(raws)} synthetic pair(s) in {time.perf_counter() - start:.2f}s")
+    run_scoring(args, raws, candidates, levels)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch RewriteQualityGate scoring and threshold sweeps")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_score = sub.add_parser("score", help="Score JSONL (raw, candidate) pairs or bakeoff-raw-*.json outputs")
+    p_score.add_argument("files", nargs="+")
+    p_score.add_argument("--level", choices=sorted(GATE_THRESHOLDS), help="Level for rows without one")
+    p_score.add_argument("--corpus", default=str(CORPUS_PATH), help="Corpus for bakeoff-raw inputs")
+    p_score.add_argument("--out", metavar="PATH", help="Write per-pair metrics and decisions as JSONL")
+
+    p_bench = sub.add_parser("bench", help="Score synthetic corpus-derived pairs and report throughput")
+    p_bench.add_argument("--pairs", type=int, default=100_000)
+    p_bench.add_argument("--seed", type=int, default=0)
+
+    for p in (p_score, p_bench):
+        p.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+        p.add_argument("--sweep-step", type=float, default=0.05, help="Threshold sweep step (default: 0.05)")
+        p.add_argument("--sweep-steps", type=int, default=2, help="Sweep steps either side (default: 2, 0 = off)")
+    args = parser.parse_args()
+    args.jobs = max(1, args.jobs)
+
+    try:
+        {"score": cmd_score, "bench": cmd_bench}[args.command](args)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,27 +6,72 @@ Usage:
     python3 scripts/stt-eval.py --record 30        # Record 30s then eval
     python3 scripts/stt-eval.py path/to/audio.wav   # Eval existing file
     python3 scripts/stt-eval.py --iterations 3       # Multiple runs
+    python3 scripts/stt-eval.py --manifest clips.jsonl --jobs 8   # Batch eval
+    python3 scripts/stt-eval.py clip.wav --vad-compare  # Trimmed vs untrimmed
+    python3 scripts/stt-eval.py --manifest long.jsonl --chunk-compare  # Chunked fan-out
+    python3 scripts/stt-eval.py clip.wav --trace stt.trace.json  # Perfetto/Chrome trace
+    python3 scripts/stt-eval.py clip.wav --profile /tmp/stt-eval  # cProfile + flamegraph stacks
+    python3 scripts/stt-eval.py clip.wav --replay-cassette stt.cassette  # Offline replay
+
+Non-WAV inputs are transcoded once into a content-addressed cache
+(default ~/.cache/vox/stt-eval, override with VOX_STT_EVAL_CACHE_DIR).
 
 Set API keys via environment or .env.local:
     ELEVENLABS_API_KEY, DEEPGRAM_API_KEY, OPENAI_API_KEY, GROQ_API_KEY
 """
 
 import argparse
+import hashlib
 import json
 import os
+import re
+import sqlite3
 import subprocess
 import sys
 import tempfile
 import time
+import wave
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
 from pathlib import Path
 
-import requests
+import numpy as np
+
+import eval_cassette
+import eval_profile
+import eval_store
+import eval_trace
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 OUTPUT_DIR = REPO_ROOT / "docs" / "performance"
+CACHE_DIR = Path(
+    os.environ.get("VOX_STT_EVAL_CACHE_DIR")
+    or Path.home() / ".cache" / "vox" / "stt-eval"
+)
+DEFAULT_CACHE_MAX_MB = 2048
+# Files the cache writes itself (see transcode_to_cache, vad_preprocess, chunk_wav);
+# prune_cache never touches anything else under a user-supplied --cache-dir.
+CACHE_WAV_PATTERNS = {
+    "": re.compile(r"[0-9a-f]{64}\.wav"),
+    "vad": re.compile(r"[0-9a-f]{32}-p\d+-m\d+\.wav"),
+    "chunks": re.compile(r"[0-9a-f]{32}-m[^/]+-o\d+-\d{3,}\.wav"),
+}
+
+# Keep in sync with record_audio(); part of the cache key so changing the
+# target format invalidates previously converted files.
+TRANSCODE_ARGS = ["-ar", "16000", "-ac", "1", "-sample_fmt", "s16"]
+
+# VAD: 20ms analysis frames; speech = energy this far above the clip's noise
+# floor (10th percentile frame energy), or quieter high-ZCR frames (fricatives).
+VAD_FRAME_MS = 20
+VAD_MARGIN_DB = 10.0
+VAD_FLOOR_DB = -55.0
+VAD_ZCR_THRESHOLD = 0.3
+VAD_HANGOVER_MS = 200
+
+# Chunked fan-out: report speedup/WER per clip-duration bucket (seconds).
+DURATION_BUCKETS = [(0, 15), (15, 30), (30, 60), (60, 120), (120, float("inf"))]
 
 
 # ---------------------------------------------------------------------------
@@ -79,19 +124,428 @@ def record_audio(duration, output_path, device_index=1):
     return output_path
 
 
-def ensure_wav(input_path):
-    """Convert input to 16kHz mono WAV if needed."""
-    path = Path(input_path)
-    if path.suffix.lower() == ".wav":
-        return str(path)
-    wav_path = path.with_suffix(".wav")
-    print(f"  Converting {path.name} → {wav_path.name}...")
-    subprocess.run([
-        "ffmpeg", "-y", "-i", str(path),
-        "-ar", "16000", "-ac", "1", "-sample_fmt", "s16",
-        str(wav_path),
-    ], capture_output=True, check=True)
-    return str(wav_path)
+def file_digest(path, chunk_size=1 << 20):
+    """SHA-256 of file contents plus transcode args (conversion cache key)."""
+    h = hashlib.sha256(" ".join(TRANSCODE_ARGS).encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_digest_index(cache_dir):
+    """Load the path → (size, mtime_ns, digest) index so warm runs skip hashing."""
+    index_path = Path(cache_dir) / "index.json"
+    try:
+        return json.loads(index_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_digest_index(cache_dir, index):
+    index_path = Path(cache_dir) / "index.json"
+    tmp_path = index_path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(index, sort_keys=True))
+    os.replace(tmp_path, index_path)
+
+
+def cached_digest(path, index):
+    """Return the content digest for path, reusing the index when size+mtime match."""
+    st = os.stat(path)
+    key = str(Path(path).resolve())
+    entry = index.get(key)
+    if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+        return entry[2]
+    digest = file_digest(path)
+    index[key] = [st.st_size, st.st_mtime_ns, digest]
+    return digest
+
+
+def transcode_to_cache(input_path, digest, cache_dir):
+    """Convert input to 16kHz mono WAV under cache_dir/<digest>.wav.
+
+    Returns (wav_path, hit). Cache hits refresh mtime, which is the LRU clock
+    used by prune_cache().
+    """
+    wav_path = Path(cache_dir) / f"{digest}.wav"
+    if wav_path.exists():
+        os.utime(wav_path)
+        return str(wav_path), True
+    fd, tmp_path = tempfile.mkstemp(suffix=".wav", prefix=".partial-", dir=cache_dir)
+    os.close(fd)
+    try:
+        subprocess.run(
+            ["ffmpeg", "-y", "-i", str(input_path), *TRANSCODE_ARGS, tmp_path],
+            capture_output=True, check=True,
+        )
+        os.replace(tmp_path, wav_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    return str(wav_path), False
+
+
+def prune_cache(cache_dir, max_bytes, keep=()):
+    """Evict least-recently-used WAVs until the cache fits in max_bytes.
+
+    Covers the derived vad/ and chunks/ copies too, so they share the budget.
+    Only cache-named files count (CACHE_WAV_PATTERNS): other WAVs under the
+    directory, e.g. source clips, are never evicted.
+
+    Paths in keep (the current batch) are never evicted, even if that leaves
+    the cache above its limit.
+    """
+    keep = {str(p) for p in keep}
+    entries = []
+    total = 0
+    paths = (
+        path
+        for subdir, pattern in CACHE_WAV_PATTERNS.items()
+        for path in (Path(cache_dir) / subdir).glob("*.wav")
+        if pattern.fullmatch(path.name)
+    )
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        total += st.st_size
+        if str(path) not in keep:
+            entries.append((st.st_mtime, st.st_size, path))
+    evicted = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        evicted += 1
+    return evicted
+
+
+def ensure_wavs(input_paths, cache_dir=CACHE_DIR, jobs=None, max_bytes=DEFAULT_CACHE_MAX_MB * 1024 * 1024):
+    """Convert inputs to 16kHz mono WAV via the content-hash cache.
+
+    WAV inputs pass through untouched. Misses are transcoded in a bounded
+    ffmpeg pool (default: one process per CPU). Returns paths in input order.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    jobs = max(1, jobs or os.cpu_count() or 1)
+
+    out = [None] * len(input_paths)
+    pending = {}  # digest -> (source path, [indices])
+    index = load_digest_index(cache_dir)
+    for i, input_path in enumerate(input_paths):
+        path = Path(input_path)
+        if path.suffix.lower() == ".wav":
+            out[i] = str(path)
+            continue
+        digest = cached_digest(path, index)
+        pending.setdefault(digest, (path, []))[1].append(i)
+    save_digest_index(cache_dir, index)
+
+    if not pending:
+        return out
+
+    hits = misses = 0
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+        futures = {
+            executor.submit(transcode_to_cache, path, digest, cache_dir): indices
+            for digest, (path, indices) in pending.items()
+        }
+        for future in as_completed(futures):
+            wav_path, hit = future.result()
+            hits += hit
+            misses += not hit
+            for i in futures[future]:
+                out[i] = wav_path
+
+    evicted = prune_cache(cache_dir, max_bytes, keep=out)
+    print(
+        f"  Transcode cache: {hits} hit(s), {misses} converted, {evicted} evicted "
+        f"({time.monotonic() - started:.1f}s, {jobs} worker(s), {cache_dir})"
+    )
+    return out
+
+
+def ensure_wav(input_path, cache_dir=CACHE_DIR):
+    """Convert input to 16kHz mono WAV if needed (cached by content hash)."""
+    return ensure_wavs([input_path], cache_dir=cache_dir, jobs=1)[0]
+
+
+def load_manifest(manifest_path):
+    """Load clips from a JSON list, {"clips": [...]}, or JSONL manifest.
+
+    Each clip is a path string or an object with "audio" (required) and
+    optional "id" and "reference" (ground-truth transcript, used for WER).
+    Relative paths resolve against the manifest directory.
+    """
+    path = Path(manifest_path)
+    text = path.read_text()
+    if path.suffix.lower() == ".jsonl":
+        items = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        data = json.loads(text)
+        items = data.get("clips", []) if isinstance(data, dict) else data
+
+    clips = []
+    for n, item in enumerate(items):
+        if isinstance(item, str):
+            item = {"audio": item}
+        audio = Path(item["audio"])
+        if not audio.is_absolute():
+            audio = path.parent / audio
+        clips.append({
+            "id": str(item.get("id") or audio.stem or f"clip-{n + 1}"),
+            "audio": str(audio),
+            "reference": item.get("reference"),
+        })
+    return clips
+
+
+def dedupe_clip_ids(clips):
+    """Suffix repeated clip ids (-2, -3, ...) in place; a/clip.wav and b/clip.m4a share a stem.
+
+    Results, consensus and VAD stats are keyed by id, so duplicates would
+    silently merge two clips. Returns the renamed ids as (old, new) pairs.
+    """
+    taken = {c["id"] for c in clips}
+    seen, renamed = set(), []
+    for clip in clips:
+        if clip["id"] in seen:
+            n = 2
+            while f"{clip['id']}-{n}" in taken:
+                n += 1
+            new_id = f"{clip['id']}-{n}"
+            renamed.append((clip["id"], new_id))
+            clip["id"] = new_id
+            taken.add(new_id)
+        seen.add(clip["id"])
+    return renamed
+
+
+# ---------------------------------------------------------------------------
+# Silence trimming (VAD)
+# ---------------------------------------------------------------------------
+
+def read_wav_mono16(path):
+    """Read a 16-bit PCM WAV as a mono int16 array. Returns (samples, rate)."""
+    with wave.open(str(path), "rb") as w:
+        rate, channels, width = w.getframerate(), w.getnchannels(), w.getsampwidth()
+        raw = w.readframes(w.getnframes())
+    if width != 2:
+        raise ValueError(f"{path}: expected 16-bit PCM, got {8 * width}-bit")
+    samples = np.frombuffer(raw, dtype="<i2")
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1).astype(np.int16)
+    return samples, rate
+
+
+def write_wav_mono16(path, samples, rate):
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(samples.astype("<i2").tobytes())
+
+
+def speech_mask(samples, rate, frame_ms=VAD_FRAME_MS):
+    """Per-frame speech flags from short-time energy and zero-crossing rate.
+
+    Returns (mask, frame_len). Clips without a usable noise floor (dynamic
+    range under the margin) are treated as all speech so nothing is trimmed.
+    """
+    frame = max(1, rate * frame_ms // 1000)
+    n = len(samples) // frame
+    if n == 0:
+        return np.zeros(0, dtype=bool), frame
+    frames = samples[: n * frame].astype(np.float32).reshape(n, frame) / 32768.0
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    energy_db = 20 * np.log10(np.maximum(rms, 1e-6))
+    signs = np.signbit(frames).astype(np.int8)
+    zcr = np.mean(np.abs(np.diff(signs, axis=1)), axis=1)
+
+    noise_db, loud_db = np.percentile(energy_db, [10, 90])
+    if loud_db - noise_db < VAD_MARGIN_DB:
+        return np.ones(n, dtype=bool), frame
+    threshold = max(noise_db + VAD_MARGIN_DB, VAD_FLOOR_DB)
+    voiced = energy_db > threshold
+    unvoiced = (zcr > VAD_ZCR_THRESHOLD) & (energy_db > max(noise_db + VAD_MARGIN_DB / 2, VAD_FLOOR_DB))
+    mask = voiced | unvoiced
+
+    hang = VAD_HANGOVER_MS // frame_ms
+    if hang > 0 and mask.any():
+        kernel = np.ones(2 * hang + 1, dtype=np.int32)
+        mask = np.convolve(mask.astype(np.int32), kernel, mode="same") > 0
+    return mask, frame
+
+
+def trim_silence(samples, rate, pad_ms=150, max_pause_ms=0):
+    """Trim leading/trailing silence; optionally cap internal pauses.
+
+    Pauses longer than max_pause_ms are shortened to max_pause_ms (split
+    evenly around the cut). Returns (trimmed samples, stats dict).
+    """
+    mask, frame = speech_mask(samples, rate)
+    stats = {
+        "original_ms": len(samples) * 1000 / rate,
+        "leading_ms": 0.0,
+        "trailing_ms": 0.0,
+        "pauses_compressed": 0,
+    }
+    speech = np.flatnonzero(mask)
+    if speech.size == 0:
+        stats["trimmed_ms"] = stats["original_ms"]
+        return samples, stats
+
+    pad = pad_ms * rate // 1000
+    first, last = speech[0], speech[-1]
+    start = max(0, first * frame - pad)
+    end = min(len(samples), (last + 1) * frame + pad)
+    keep = np.zeros(len(samples), dtype=bool)
+    keep[start:end] = True
+
+    max_frames = max_pause_ms // VAD_FRAME_MS if max_pause_ms else 0
+    if max_frames > 0:
+        silent = (~mask[first:last + 1]).astype(np.int8)
+        edges = np.diff(np.concatenate(([0], silent, [0])))
+        run_starts = np.flatnonzero(edges == 1)
+        run_ends = np.flatnonzero(edges == -1)
+        long_runs = (run_ends - run_starts) > max_frames
+        head = max_frames // 2
+        for run_start, run_end in zip(run_starts[long_runs], run_ends[long_runs]):
+            cut_from = (first + run_start + head) * frame
+            cut_to = (first + run_end - (max_frames - head)) * frame
+            keep[cut_from:cut_to] = False
+        stats["pauses_compressed"] = int(long_runs.sum())
+
+    trimmed = samples[keep]
+    stats["leading_ms"] = start * 1000 / rate
+    stats["trailing_ms"] = (len(samples) - end) * 1000 / rate
+    stats["trimmed_ms"] = len(trimmed) * 1000 / rate
+    return trimmed, stats
+
+
+def vad_preprocess(wav_path, cache_dir=CACHE_DIR, pad_ms=150, max_pause_ms=0):
+    """Write a silence-trimmed copy of wav_path into the cache.
+
+    Returns (trimmed_path, stats); stats include original/trimmed bytes.
+    """
+    samples, rate = read_wav_mono16(wav_path)
+    trimmed, stats = trim_silence(samples, rate, pad_ms=pad_ms, max_pause_ms=max_pause_ms)
+    vad_dir = Path(cache_dir) / "vad"
+    vad_dir.mkdir(parents=True, exist_ok=True)
+    out_path = vad_dir / f"{file_digest(wav_path)[:32]}-p{pad_ms}-m{max_pause_ms}.wav"
+    if not out_path.exists():
+        fd, tmp_path = tempfile.mkstemp(suffix=".wav", prefix=".partial-", dir=vad_dir)
+        os.close(fd)
+        write_wav_mono16(tmp_path, trimmed, rate)
+        os.replace(tmp_path, out_path)
+    stats["original_bytes"] = os.path.getsize(wav_path)
+    stats["trimmed_bytes"] = os.path.getsize(out_path)
+    return str(out_path), stats
+
+
+def split_on_silence(samples, rate, max_chunk_s=15.0, overlap_ms=300):
+    """Split audio into chunks of at most max_chunk_s, cutting inside pauses.
+
+    Each cut lands at the midpoint of the longest pause in the back half of
+    the window; windows without a pause get a hard cut. Neighbouring chunks
+    share overlap_ms of audio around each cut. Returns [(start, end)] sample
+    ranges.
+    """
+    mask, frame = speech_mask(samples, rate)
+    max_frames = max(2, int(max_chunk_s * 1000) // VAD_FRAME_MS)
+    min_frames = max_frames // 2
+    silent = (~mask).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], silent, [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    mids, lens = (starts + ends) // 2, ends - starts
+
+    cuts, pos = [], 0
+    while len(mask) - pos > max_frames:
+        lo, hi = pos + min_frames, pos + max_frames
+        in_window = (mids > lo) & (mids <= hi)
+        if in_window.any():
+            candidates = np.flatnonzero(in_window)
+            cut = int(mids[candidates[np.argmax(lens[candidates])]])
+        else:
+            cut = hi
+        cuts.append(cut)
+        pos = cut
+
+    half = overlap_ms * rate // 2000
+    bounds = [0] + [cut * frame for cut in cuts] + [len(samples)]
+    return [
+        (max(0, start - half), min(len(samples), end + half))
+        for start, end in zip(bounds, bounds[1:])
+    ]
+
+
+def chunk_wav(wav_path, cache_dir=CACHE_DIR, max_chunk_s=15.0, overlap_ms=300):
+    """Write silence-aligned chunks of wav_path into the cache.
+
+    Returns (chunk paths, clip duration in seconds).
+    """
+    samples, rate = read_wav_mono16(wav_path)
+    chunk_dir = Path(cache_dir) / "chunks"
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"{file_digest(wav_path)[:32]}-m{max_chunk_s:g}-o{overlap_ms}"
+    paths = []
+    for i, (start, end) in enumerate(split_on_silence(samples, rate, max_chunk_s, overlap_ms)):
+        out_path = chunk_dir / f"{stem}-{i:03d}.wav"
+        if not out_path.exists():
+            fd, tmp_path = tempfile.mkstemp(suffix=".wav", prefix=".partial-", dir=chunk_dir)
+            os.close(fd)
+            write_wav_mono16(tmp_path, samples[start:end], rate)
+            os.replace(tmp_path, out_path)
+        paths.append(str(out_path))
+    return paths, len(samples) / rate
+
+
+def stitch_transcripts(texts, max_overlap_words=8):
+    """Join chunk transcripts, dropping words repeated across chunk overlaps.
+
+    Finds the longest run of (normalized) words that ends the text so far and
+    starts the next chunk, and keeps only one copy.
+    """
+    def norm(word):
+        return re.sub(r"[^a-z0-9']", "", word.lower())
+
+    words = []
+    for text in texts:
+        nxt = (text or "").split()
+        if words and nxt:
+            tail = [norm(w) for w in words[-max_overlap_words:]]
+            head = [norm(w) for w in nxt[:max_overlap_words]]
+            for k in range(min(len(tail), len(head)), 0, -1):
+                if tail[-k:] == head[:k]:
+                    nxt = nxt[k:]
+                    break
+        words.extend(nxt)
+    return " ".join(words)
+
+
+def call_chunked(call, api_key, chunk_paths, max_workers):
+    """Transcribe chunks in parallel and stitch them.
+
+    Latency is time-to-full-transcript: from first upload to the stitched
+    text. Any chunk error fails the whole call.
+    """
+    start = time.monotonic()
+    workers = max(1, min(max_workers, len(chunk_paths)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chunk") as executor:
+        outcomes = list(executor.map(lambda path: call(api_key, path), chunk_paths))
+    errors = [error for _, _, error in outcomes if error]
+    text = stitch_transcripts([transcript for transcript, _, _ in outcomes])
+    latency = time.monotonic() - start
+    if errors:
+        return None, latency, f"chunk failed ({len(errors)}/{len(chunk_paths)}): {errors[0]}"
+    return text, latency, None
 
 
 # ---------------------------------------------------------------------------
@@ -102,7 +556,7 @@ def call_elevenlabs(api_key, wav_path):
     """ElevenLabs Scribe v2 (batch)."""
     start = time.monotonic()
     with open(wav_path, "rb") as f:
-        resp = requests.post(
+        resp = eval_cassette.post(
             "https://api.elevenlabs.io/v1/speech-to-text",
             headers={"xi-api-key": api_key},
             files={"file": ("audio.wav", f, "audio/wav")},
@@ -119,7 +573,7 @@ def call_deepgram(api_key, wav_path):
     """Deepgram Nova-3 (batch)."""
     start = time.monotonic()
     with open(wav_path, "rb") as f:
-        resp = requests.post(
+        resp = eval_cassette.post(
             "https://api.deepgram.com/v1/listen",
             params={"model": "nova-3", "punctuate": "true", "smart_format": "true"},
             headers={
@@ -144,7 +598,7 @@ def call_openai(api_key, wav_path, model):
     """OpenAI transcription (gpt-4o-mini-transcribe, etc.)."""
     start = time.monotonic()
     with open(wav_path, "rb") as f:
-        resp = requests.post(
+        resp = eval_cassette.post(
             "https://api.openai.com/v1/audio/transcriptions",
             headers={"Authorization": f"Bearer {api_key}"},
             files={"file": ("audio.wav", f, "audio/wav")},
@@ -161,7 +615,7 @@ def call_groq(api_key, wav_path, model):
     """Groq (OpenAI-compatible endpoint)."""
     start = time.monotonic()
     with open(wav_path, "rb") as f:
-        resp = requests.post(
+        resp = eval_cassette.post(
             "https://api.groq.com/openai/v1/audio/transcriptions",
             headers={"Authorization": f"Bearer {api_key}"},
             files={"file": ("audio.wav", f, "audio/wav")},
@@ -181,26 +635,31 @@ def call_groq(api_key, wav_path, model):
 PROVIDERS = [
     {
         "name": "ElevenLabs Scribe v2",
+        "host": "api.elevenlabs.io",
         "key_name": "ELEVENLABS_API_KEY",
         "call": lambda key, path: call_elevenlabs(key, path),
     },
     {
         "name": "Deepgram Nova-3",
+        "host": "api.deepgram.com",
         "key_name": "DEEPGRAM_API_KEY",
         "call": lambda key, path: call_deepgram(key, path),
     },
     {
         "name": "OpenAI gpt-4o-mini-transcribe",
+        "host": "api.openai.com",
         "key_name": "OPENAI_API_KEY",
         "call": lambda key, path: call_openai(key, path, "gpt-4o-mini-transcribe"),
     },
     {
         "name": "Groq whisper-large-v3-turbo",
+        "host": "api.groq.com",
         "key_name": "GROQ_API_KEY",
         "call": lambda key, path: call_groq(key, path, "whisper-large-v3-turbo"),
     },
     {
         "name": "Groq distil-whisper-large-v3-en",
+        "host": "api.groq.com",
         "key_name": "GROQ_API_KEY",
         "call": lambda key, path: call_groq(key, path, "distil-whisper-large-v3-en"),
     },
@@ -216,8 +675,26 @@ def similarity(a, b):
     return SequenceMatcher(None, a.lower(), b.lower()).ratio()
 
 
-def run_eval(providers, keys, wav_path, iterations):
-    """Run all providers and collect results."""
+def traced_call(name, clip, iteration, call, *args):
+    """Run one provider call as a trace span on the worker thread (no-op unless --trace).
+
+    Returns (transcript, latency, error, HTTP phase seconds of the call).
+    """
+    span_args = {"clip": clip["id"], "variant": clip.get("variant", "original"), "iteration": iteration}
+    eval_trace.take_phases()
+    with eval_trace.span(name, "request", span_args) as fields:
+        transcript, latency, error = call(*args)
+        fields["latency_s"] = round(latency, 3)
+        if error:
+            fields["error"] = error[:200]
+    return transcript, latency, error, eval_trace.take_phases()
+
+
+def run_eval(providers, keys, clips, iterations, chunk_workers=8):
+    """Run all providers over every clip and collect results.
+
+    Clips carrying "chunks" are transcribed chunk-parallel per provider.
+    """
     active = [p for p in providers if keys.get(p["key_name"])]
     skipped = [p for p in providers if not keys.get(p["key_name"])]
 
@@ -228,73 +705,251 @@ def run_eval(providers, keys, wav_path, iterations):
 
     all_results = {p["name"]: [] for p in active}
 
-    for iteration in range(iterations):
-        if iterations > 1:
-            print(f"  --- Iteration {iteration + 1}/{iterations} ---")
-
-        # Run all providers in parallel
-        futures = {}
-        with ThreadPoolExecutor(max_workers=len(active)) as executor:
-            for p in active:
-                key = keys[p["key_name"]]
-                future = executor.submit(p["call"], key, wav_path)
-                futures[future] = p["name"]
-
-            for future in as_completed(futures):
-                name = futures[future]
-                try:
-                    transcript, latency, error = future.result()
-                except Exception as e:
-                    transcript, latency, error = None, 0, str(e)
-
-                if error:
-                    print(f"  {name:40s}  ERROR: {error[:80]}")
-                    all_results[name].append({
-                        "iteration": iteration + 1,
-                        "error": error,
-                        "latency": latency,
-                    })
-                else:
-                    chars = len(transcript) if transcript else 0
-                    print(f"  {name:40s}  {latency:6.2f}s  {chars:4d} chars")
-                    all_results[name].append({
-                        "iteration": iteration + 1,
-                        "transcript": transcript,
-                        "latency": latency,
-                        "chars": chars,
-                    })
+    for clip in clips:
+        if len(clips) > 1:
+            variant = f" ({clip['variant']})" if "variant" in clip else ""
+            print(f"  === Clip {clip['id']}{variant} ===")
+        for iteration in range(iterations):
+            if iterations > 1:
+                print(f"  --- Iteration {iteration + 1}/{iterations} ---")
+
+            # Run all providers in parallel
+            futures = {}
+            with ThreadPoolExecutor(max_workers=len(active), thread_name_prefix="provider") as executor, \
+                    eval_trace.span(f"{clip['id']} iteration {iteration + 1}", "iteration"):
+                for p in active:
+                    key = keys[p["key_name"]]
+                    if clip.get("chunks"):
+                        future = executor.submit(
+                            traced_call, p["name"], clip, iteration + 1,
+                            call_chunked, p["call"], key, clip["chunks"], chunk_workers,
+                        )
+                        upload_bytes = sum(os.path.getsize(c) for c in clip["chunks"])
+                    else:
+                        future = executor.submit(traced_call, p["name"], clip, iteration + 1, p["call"], key, clip["wav"])
+                        upload_bytes = os.path.getsize(clip["wav"])
+                    futures[future] = p["name"]
+
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        transcript, latency, error, phases = future.result()
+                    except Exception as e:
+                        transcript, latency, error, phases = None, 0, str(e), {}
+
+                    if error:
+                        print(f"  {name:40s}  ERROR: {error[:80]}")
+                        all_results[name].append({
+                            "clip": clip["id"],
+                            "variant": clip.get("variant", "original"),
+                            "iteration": iteration + 1,
+                            "bytes": upload_bytes,
+                            "error": error,
+                            "latency": latency,
+                            **phases,
+                        })
+                    else:
+                        chars = len(transcript) if transcript else 0
+                        print(f"  {name:40s}  {latency:6.2f}s  {chars:4d} chars")
+                        all_results[name].append({
+                            "clip": clip["id"],
+                            "variant": clip.get("variant", "original"),
+                            "iteration": iteration + 1,
+                            "bytes": upload_bytes,
+                            "transcript": transcript,
+                            "latency": latency,
+                            **phases,
+                            "chars": chars,
+                        })
 
     return all_results
 
 
-def compute_consensus(results):
-    """Find the most common transcript (plurality vote)."""
-    transcripts = []
+def compute_consensus(results, variants=None):
+    """Find the most common transcript per clip (plurality vote).
+
+    variants restricts which upload variants vote (e.g. only untrimmed
+    audio when comparing VAD trimming against it).
+    """
+    by_clip = {}
     for name, runs in results.items():
         for run in runs:
+            if variants and run.get("variant", "original") not in variants:
+                continue
             if "transcript" in run and run["transcript"]:
-                transcripts.append(run["transcript"])
-    if not transcripts:
-        return ""
-    # Use the transcript most similar to all others as reference
-    best_score = -1
-    best = transcripts[0]
-    for t in transcripts:
-        score = sum(similarity(t, other) for other in transcripts)
-        if score > best_score:
-            best_score = score
-            best = t
-    return best
-
-
-def generate_report(results, consensus, wav_path, iterations, timestamp):
-    """Generate markdown comparison report."""
+                by_clip.setdefault(run.get("clip"), []).append(run["transcript"])
+
+    consensus = {}
+    for clip_id, transcripts in by_clip.items():
+        # Use the transcript most similar to all others as reference
+        best_score = -1
+        best = transcripts[0]
+        for t in transcripts:
+            score = sum(similarity(t, other) for other in transcripts)
+            if score > best_score:
+                best_score = score
+                best = t
+        consensus[clip_id] = best
+    return consensus
+
+
+def normalize_words(text):
+    return re.findall(r"[a-z0-9']+", (text or "").lower())
+
+
+def word_error_rate(reference, hypothesis):
+    """Word-level edit distance divided by reference length."""
+    ref, hyp = normalize_words(reference), normalize_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        curr = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, 1):
+            curr[j] = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (r != h))
+        prev = curr
+    return prev[-1] / len(ref)
+
+
+def summarize_variant(runs, references, variant):
+    """Mean latency, upload bytes, and WER for one provider's runs of a variant."""
+    runs = [r for r in runs if r.get("variant", "original") == variant and "transcript" in r]
+    if not runs:
+        return None
+    wers = [
+        word_error_rate(references[r["clip"]], r["transcript"])
+        for r in runs
+        if references.get(r.get("clip"))
+    ]
+    return {
+        "latency": sum(r["latency"] for r in runs) / len(runs),
+        "bytes": sum(r["bytes"] for r in runs) / len(runs),
+        "wer": sum(wers) / len(wers) if wers else None,
+    }
+
+
+def generate_vad_section(results, references, vad_stats):
+    """Markdown section comparing silence-trimmed uploads with untrimmed ones."""
+    original_ms = sum(s["original_ms"] for s in vad_stats.values())
+    trimmed_ms = sum(s["trimmed_ms"] for s in vad_stats.values())
+    original_bytes = sum(s["original_bytes"] for s in vad_stats.values())
+    trimmed_bytes = sum(s["trimmed_bytes"] for s in vad_stats.values())
+    pauses = sum(s["pauses_compressed"] for s in vad_stats.values())
+    saved_pct = (1 - trimmed_bytes / original_bytes) if original_bytes else 0
+
+    lines = [
+        "## Silence Trimming (VAD)",
+        "",
+        f"- Audio: {original_ms / 1000:.1f}s → {trimmed_ms / 1000:.1f}s "
+        f"({len(vad_stats)} clip(s), {pauses} long pause(s) compressed)",
+        f"- Upload bytes: {original_bytes / 1024:.0f} KB → {trimmed_bytes / 1024:.0f} KB "
+        f"({saved_pct:.1%} saved)",
+        "- WER reference: manifest transcript when provided, else untrimmed consensus.",
+        "",
+        "| Provider | Latency (untrimmed) | Latency (trimmed) | Latency saved | Bytes saved | WER (untrimmed) | WER (trimmed) | ΔWER |",
+        "| --- | --- | --- | --- | --- | --- | --- | --- |",
+    ]
+
+    def fmt_wer(value):
+        return f"{value:.1%}" if value is not None else "—"
+
+    for name, runs in results.items():
+        base = summarize_variant(runs, references, "original")
+        trim = summarize_variant(runs, references, "trimmed")
+        if not trim:
+            lines.append(f"| {name} | — | — | — | — | — | — | — |")
+            continue
+        if not base:
+            lines.append(
+                f"| {name} | — | {trim['latency']:.2f}s | — | — | — | {fmt_wer(trim['wer'])} | — |"
+            )
+            continue
+        latency_saved = 1 - trim["latency"] / base["latency"] if base["latency"] else 0
+        bytes_saved = 1 - trim["bytes"] / base["bytes"] if base["bytes"] else 0
+        delta_wer = (
+            f"{(trim['wer'] - base['wer']) * 100:+.1f}pp"
+            if trim["wer"] is not None and base["wer"] is not None
+            else "—"
+        )
+        lines.append(
+            f"| {name} | {base['latency']:.2f}s | {trim['latency']:.2f}s | {latency_saved:+.1%} | "
+            f"{bytes_saved:.1%} | {fmt_wer(base['wer'])} | {fmt_wer(trim['wer'])} | {delta_wer} |"
+        )
+    lines.append("")
+    return lines
+
+
+def duration_bucket_label(lo, hi):
+    return f"≥{lo:g}s" if hi == float("inf") else f"{lo:g}–{hi:g}s"
+
+
+def generate_chunk_section(results, references, clip_durations, chunk_counts):
+    """Markdown section comparing chunked fan-out against single-shot upload."""
+    lines = [
+        "## Chunked Fan-out vs Single-shot",
+        "",
+        "- Chunked latency is time-to-full-transcript (parallel chunk uploads + stitch); "
+        "speedup = single-shot / chunked latency.",
+        "- WER reference: manifest transcript when provided, else single-shot consensus.",
+        "",
+        "| Provider | Clip duration | Clips | Chunks (avg) | Single-shot | Chunked | Speedup | WER (single) | WER (chunked) | ΔWER |",
+        "| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |",
+    ]
+
+    def fmt_wer(value):
+        return f"{value:.1%}" if value is not None else "—"
+
+    for name, runs in results.items():
+        for lo, hi in DURATION_BUCKETS:
+            bucket = {c for c, d in clip_durations.items() if lo <= d < hi}
+            if not bucket:
+                continue
+            bucket_runs = [r for r in runs if r.get("clip") in bucket]
+            single = summarize_variant(bucket_runs, references, "original")
+            chunked = summarize_variant(bucket_runs, references, "chunked")
+            label = duration_bucket_label(lo, hi)
+            avg_chunks = sum(chunk_counts[c] for c in bucket) / len(bucket)
+            if not single or not chunked:
+                lines.append(f"| {name} | {label} | {len(bucket)} | {avg_chunks:.1f} | — | — | — | — | — | — |")
+                continue
+            speedup = single["latency"] / chunked["latency"] if chunked["latency"] else 0
+            delta_wer = (
+                f"{(chunked['wer'] - single['wer']) * 100:+.1f}pp"
+                if chunked["wer"] is not None and single["wer"] is not None
+                else "—"
+            )
+            lines.append(
+                f"| {name} | {label} | {len(bucket)} | {avg_chunks:.1f} | "
+                f"{single['latency']:.2f}s | {chunked['latency']:.2f}s | {speedup:.2f}× | "
+                f"{fmt_wer(single['wer'])} | {fmt_wer(chunked['wer'])} | {delta_wer} |"
+            )
+    lines.append("")
+    return lines
+
+
+def generate_report(results, consensus, clips, iterations, timestamp, extra_sections=None, variant=None):
+    """Generate markdown comparison report.
+
+    variant restricts the Results table and transcripts to one upload variant
+    (the untrimmed / single-shot "original" under --vad-compare or
+    --chunk-compare); the other variants only appear in extra_sections.
+    """
+    clip_ids = list(dict.fromkeys(c["id"] for c in clips))
+    if variant:
+        results = {
+            name: [r for r in runs if r.get("variant", "original") == variant]
+            for name, runs in results.items()
+        }
+    audio_label = (
+        f"`{Path(clips[0]['wav']).name}`" if len(clip_ids) == 1 else f"{len(clip_ids)} clips"
+    )
     lines = [
         "# STT Provider Evaluation",
         "",
         f"- Generated: {timestamp}",
-        f"- Audio: `{Path(wav_path).name}`",
+        f"- Audio: {audio_label}",
         f"- Iterations: {iterations}",
+        *([f"- Results: {variant} uploads only; variant comparisons below"] if variant else []),
         "",
         "## Results",
         "",
@@ -315,7 +970,7 @@ def generate_report(results, consensus, wav_path, iterations, timestamp):
         avg_chars = sum(r["chars"] for r in successes) / len(successes)
         # Similarity to consensus
         avg_sim = sum(
-            similarity(r["transcript"], consensus) for r in successes
+            similarity(r["transcript"], consensus.get(r.get("clip"), "")) for r in successes
         ) / len(successes) if consensus else 0
         summaries.append((name, avg_lat, min_lat, avg_chars, avg_sim, len(errors), len(runs)))
 
@@ -330,6 +985,10 @@ def generate_report(results, consensus, wav_path, iterations, timestamp):
                 f"{chars:.0f} | {sim:.1%} | {errs}/{total} |"
             )
 
+    if extra_sections:
+        lines.append("")
+        lines.extend(extra_sections)
+
     # Transcripts section
     lines.extend(["", "## Transcripts", ""])
     for name, runs in results.items():
@@ -345,11 +1004,18 @@ def generate_report(results, consensus, wav_path, iterations, timestamp):
             ])
 
     # Consensus
-    if consensus:
+    if len(clip_ids) == 1 and consensus.get(clip_ids[0]):
         lines.extend([
             "## Consensus Transcript (reference)",
             "",
-            f"> {consensus}",
+            f"> {consensus[clip_ids[0]]}",
+            "",
+        ])
+    elif consensus:
+        lines.extend([
+            "## Consensus Transcripts (reference)",
+            "",
+            f"{len(consensus)} per-clip consensus transcripts; see raw JSON.",
             "",
         ])
 
@@ -362,18 +1028,50 @@ def generate_report(results, consensus, wav_path, iterations, timestamp):
 
 def main():
     parser = argparse.ArgumentParser(description="STT Provider Evaluation")
-    parser.add_argument("audio_file", nargs="?", help="Path to audio file (WAV, CAF, etc.)")
+    parser.add_argument("audio_files", nargs="*", metavar="audio_file", help="Path(s) to audio files (WAV, CAF, etc.)")
+    parser.add_argument("--manifest", help="JSON/JSONL manifest of clips to evaluate")
     parser.add_argument("--record", type=int, metavar="SECONDS", help="Record N seconds")
     parser.add_argument("--device", type=int, default=1, help="Audio input device index (default: 1)")
     parser.add_argument("--iterations", type=int, default=3, help="Runs per provider (default: 3)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Parallel ffmpeg conversions (default: CPU count)")
+    parser.add_argument("--cache-dir", default=str(CACHE_DIR), help=f"Transcode cache directory (default: {CACHE_DIR})")
+    parser.add_argument("--cache-max-mb", type=int, default=DEFAULT_CACHE_MAX_MB, help=f"Transcode cache LRU size limit, including VAD and chunk copies (default: {DEFAULT_CACHE_MAX_MB})")
+    parser.add_argument("--vad", action="store_true", help="Trim leading/trailing silence before upload")
+    parser.add_argument("--vad-compare", action="store_true", help="Upload both trimmed and untrimmed audio and compare latency, bytes, WER")
+    parser.add_argument("--vad-pad-ms", type=int, default=150, help="Silence kept around speech when trimming (default: 150)")
+    parser.add_argument("--vad-max-pause-ms", type=int, default=0, help="Compress internal pauses longer than this (default: 0 = off)")
+    parser.add_argument("--chunk-compare", action="store_true", help="Compare single-shot upload with silence-chunked parallel fan-out")
+    parser.add_argument("--chunk-max-s", type=float, default=15.0, help="Max chunk length in seconds (default: 15)")
+    parser.add_argument("--chunk-overlap-ms", type=int, default=300, help="Audio shared between neighbouring chunks (default: 300)")
+    parser.add_argument("--chunk-workers", type=int, default=8, help="Parallel chunk uploads per provider (default: 8)")
+    parser.add_argument("--db", default=str(eval_store.DEFAULT_DB), help=f"Results store (default: {eval_store.DEFAULT_DB})")
+    parser.add_argument("--no-db", action="store_true", help="Do not record this run in the results store")
+    parser.add_argument("--trace", metavar="PATH", help="Write a Chrome trace-event JSON of every request (open in Perfetto)")
+    eval_cassette.add_cassette_arguments(parser)
+    eval_profile.add_profile_argument(parser)
     args = parser.parse_args()
+    eval_profile.start_profile(args.profile, args.profile_interval_ms)
+    try:
+        cassette = eval_cassette.configure(args)
+    except (OSError, ValueError) as e:
+        parser.error(f"cannot open cassette: {e}")
+    eval_profile.reset_phases()
+    eval_profile.switch("load")
 
-    if not args.audio_file and not args.record:
-        parser.error("Provide an audio file or use --record N")
+    if not args.audio_files and not args.manifest and not args.record:
+        parser.error("Provide audio file(s), --manifest, or use --record N")
+    if args.chunk_compare and (args.vad or args.vad_compare):
+        parser.error("--chunk-compare cannot be combined with --vad/--vad-compare")
 
     # Load keys
     key_names = list({p["key_name"] for p in PROVIDERS})
     keys = load_env(key_names)
+    if eval_cassette.replaying():
+        # Replay needs no real keys; enable every provider the cassette has responses for.
+        recorded_hosts = cassette.hosts()
+        for p in PROVIDERS:
+            if p["host"] in recorded_hosts:
+                keys[p["key_name"]] = keys[p["key_name"]] or "replay"
     active_count = sum(1 for p in PROVIDERS if keys.get(p["key_name"]))
     if active_count == 0:
         print("ERROR: No API keys found. Set keys in .env.local or environment.")
@@ -383,51 +1081,191 @@ def main():
     if args.record:
         wav_path = tempfile.mktemp(suffix=".wav", prefix="stt-eval-")
         record_audio(args.record, wav_path, device_index=args.device)
+        clips = [{"id": Path(wav_path).stem, "audio": wav_path, "wav": wav_path}]
     else:
-        if not os.path.exists(args.audio_file):
-            print(f"ERROR: File not found: {args.audio_file}")
+        clips = [{"id": Path(f).stem, "audio": f} for f in args.audio_files]
+        if args.manifest:
+            clips.extend(load_manifest(args.manifest))
+        for old_id, new_id in dedupe_clip_ids(clips):
+            print(f"  Note: duplicate clip id {old_id!r} renamed to {new_id!r}")
+        missing = [c["audio"] for c in clips if not os.path.exists(c["audio"])]
+        if missing:
+            print(f"ERROR: File not found: {', '.join(missing[:5])}")
             sys.exit(1)
-        wav_path = ensure_wav(args.audio_file)
+        wav_paths = ensure_wavs(
+            [c["audio"] for c in clips],
+            cache_dir=args.cache_dir,
+            jobs=args.jobs,
+            max_bytes=args.cache_max_mb * 1024 * 1024,
+        )
+        for clip, wav in zip(clips, wav_paths):
+            clip["wav"] = wav
+
+    # Variants (VAD, chunking) reuse a clip; size and duration count each source clip once.
+    source_wavs = {c["id"]: c["wav"] for c in clips}
+
+    vad_stats = {}
+    if args.vad or args.vad_compare:
+        variants = []
+        for clip in clips:
+            trimmed_path, vad_stats[clip["id"]] = vad_preprocess(
+                clip["wav"],
+                cache_dir=args.cache_dir,
+                pad_ms=args.vad_pad_ms,
+                max_pause_ms=args.vad_max_pause_ms,
+            )
+            if args.vad_compare:
+                variants.append({**clip, "variant": "original"})
+            variants.append({**clip, "wav": trimmed_path, "variant": "trimmed"})
+        clips = variants
+        stats = vad_stats.values()
+        print(
+            f"  VAD: trimmed {sum(s['original_ms'] - s['trimmed_ms'] for s in stats) / 1000:.1f}s "
+            f"of silence across {len(vad_stats)} clip(s)"
+        )
 
-    file_size = os.path.getsize(wav_path)
+    clip_durations, chunk_counts = {}, {}
+    if args.chunk_compare:
+        variants = []
+        for clip in clips:
+            chunks, clip_durations[clip["id"]] = chunk_wav(
+                clip["wav"],
+                cache_dir=args.cache_dir,
+                max_chunk_s=args.chunk_max_s,
+                overlap_ms=args.chunk_overlap_ms,
+            )
+            chunk_counts[clip["id"]] = len(chunks)
+            variants.append({**clip, "variant": "original"})
+            variants.append({**clip, "chunks": chunks, "variant": "chunked"})
+        clips = variants
+        print(
+            f"  Chunking: {sum(chunk_counts.values())} chunk(s) from {len(chunk_counts)} clip(s) "
+            f"(max {args.chunk_max_s:g}s, overlap {args.chunk_overlap_ms}ms)"
+        )
+
+    file_size = sum(os.path.getsize(wav) for wav in source_wavs.values())
     duration = file_size / (16000 * 2)  # 16kHz, 16-bit mono
-    print(f"\n  Audio: {wav_path}")
+    wav_path = clips[0]["wav"]
+    clip_ids = list(dict.fromkeys(c["id"] for c in clips))
+    if len(clip_ids) == 1:
+        print(f"\n  Audio: {wav_path}")
+    else:
+        print(f"\n  Audio: {len(clip_ids)} clips")
     print(f"  Size: {file_size / 1024:.0f} KB, ~{duration:.1f}s")
 
     # Run eval
     print(f"\n  Running {args.iterations} iteration(s) per provider...\n")
-    results = run_eval(PROVIDERS, keys, wav_path, args.iterations)
-
-    # Compute consensus
-    consensus = compute_consensus(results)
+    if args.trace:
+        eval_trace.enable("stt-eval")
+    eval_profile.switch("network")
+    results = run_eval(PROVIDERS, keys, clips, args.iterations, chunk_workers=args.chunk_workers)
+    eval_profile.switch("render")
+    if args.trace:
+        eval_trace.current().write(args.trace, {"tool": "stt-eval", "iterations": args.iterations, "clips": clip_ids})
+    if cassette is not None:
+        print(f"  {cassette.summary()}")
+
+    # Compute consensus (untrimmed audio only when comparing against it)
+    eval_profile.switch("scoring")
+    compare = args.vad_compare or args.chunk_compare
+    consensus = compute_consensus(results, variants=("original",) if compare else None)
+    references = {c["id"]: c.get("reference") or consensus.get(c["id"], "") for c in clips}
+    for runs in results.values():
+        for run in runs:
+            reference = references.get(run.get("clip"))
+            if "transcript" in run and reference:
+                run["wer"] = word_error_rate(reference, run["transcript"])
+                run["similarity"] = similarity(run["transcript"], reference)
+    eval_profile.switch("aggregation")
+    extra_sections = []
+    if vad_stats:
+        extra_sections += generate_vad_section(results, references, vad_stats)
+    if clip_durations:
+        extra_sections += generate_chunk_section(results, references, clip_durations, chunk_counts)
 
     # Generate report
+    eval_profile.switch("render")
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    report = generate_report(results, consensus, wav_path, args.iterations, timestamp)
+    report = generate_report(
+        results, consensus, clips, args.iterations, timestamp,
+        extra_sections=extra_sections, variant="original" if compare else None,
+    )
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    report_path = OUTPUT_DIR / f"stt-eval-{date_str}.md"
+    now = datetime.now(timezone.utc)
+    date_str = now.strftime("%Y-%m-%d")
+    # Replayed latencies are scaled by --replay-speed; keep them apart from live runs.
+    suffix = "-replay" if eval_cassette.replaying() else ""
+    # Keep earlier same-day runs instead of overwriting them.
+    run_number = 2
+    while (OUTPUT_DIR / f"stt-eval-{date_str}{suffix}.md").exists():
+        date_str = f"{now:%Y-%m-%d}-{run_number}"
+        run_number += 1
+    report_path = OUTPUT_DIR / f"stt-eval-{date_str}{suffix}.md"
     report_path.write_text(report)
 
     # Save raw data
-    raw_path = OUTPUT_DIR / f"stt-eval-raw-{date_str}.json"
+    raw_path = OUTPUT_DIR / f"stt-eval-raw-{date_str}{suffix}.json"
     raw_data = {
         "timestamp": timestamp,
         "audio_file": wav_path,
+        "clips": [
+            {
+                "id": c["id"],
+                "audio": c["audio"],
+                "wav": c["wav"],
+                "variant": c.get("variant", "original"),
+                "chunks": c.get("chunks"),
+                "reference": c.get("reference"),
+            }
+            for c in clips
+        ],
         "duration_s": duration,
         "iterations": args.iterations,
         "results": results,
-        "consensus": consensus,
+        "consensus": consensus.get(clip_ids[0], "") if len(clip_ids) == 1 else consensus,
     }
+    if vad_stats:
+        raw_data["vad"] = {
+            "pad_ms": args.vad_pad_ms,
+            "max_pause_ms": args.vad_max_pause_ms,
+            "clips": vad_stats,
+        }
+    if cassette is not None:
+        raw_data["cassette"] = {"mode": cassette.mode, "path": str(cassette.path), "replay_speed": cassette.replay_speed}
+    if clip_durations:
+        raw_data["chunking"] = {
+            "max_chunk_s": args.chunk_max_s,
+            "overlap_ms": args.chunk_overlap_ms,
+            "workers": args.chunk_workers,
+            "clip_durations_s": clip_durations,
+        }
     raw_path.write_text(json.dumps(raw_data, indent=2, default=str))
 
+    run_id = None
+    if eval_cassette.replaying():
+        print("  Results store: skipped for replayed run")
+    elif not args.no_db:
+        try:
+            conn = eval_store.connect(args.db)
+            run_id = eval_store.record_stt_run(conn, json.loads(json.dumps(raw_data, default=str)))
+            conn.close()
+        except sqlite3.Error as e:
+            print(f"  WARNING: results store not updated ({e})")
+
     # Print summary
     print(f"\n{'=' * 70}")
     print(report)
     print(f"{'=' * 70}")
     print(f"\n  Report: {report_path}")
     print(f"  Raw data: {raw_path}")
+    if run_id:
+        print(f"  Results store: run {run_id} in {args.db}")
+    if args.trace:
+        print(f"  Trace: {args.trace}")
+    print()
+    for line in eval_profile.phases().summary_lines():
+        print(f"  {line}")
 
 
 if __name__ == "__main__":